@@ -1,12 +1,23 @@
 # app/api/endpoints/generation.py
-from typing import Any, Dict, Optional, List
-from fastapi import APIRouter, HTTPException, Body
+from typing import Any, Dict, Literal, Optional, List
+from fastapi import APIRouter, HTTPException, Body, Depends
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
+from starlette.concurrency import run_in_threadpool
 
-from app.services.constraint_parser import Parser  # constraint_parser의 Parser 클래스
+from app.services.parse_cache import CachedParser  # constraint_parser.Parser + 결과 캐시
+from app.services.system_prompt_processor import SystemPromptProcessor
+from app.services.executor import ExecutorBusy, ParseExecutor
+from app.services.instances import get_executor, get_parser, get_prompt_processor
+from app.services.generators import generate_columns, normalize_fields
+from app.services.generators.engine import check_independent_blocks, shard_blocks
+from app.services.generators.serialize import FORMATS, stream_dataset
 
 router = APIRouter()
-parser = Parser()
+
+# 프로세스 풀 대기열이 가득 찼을 때의 응답 (클라이언트는 잠시 후 재시도)
+def _busy() -> HTTPException:
+    return HTTPException(status_code=503, detail="Server busy, retry later", headers={"Retry-After": "1"})
 
 # 요청: prompt만 받음 (Swagger 기본값을 example로 지정)
 class PromptRequest(BaseModel):
@@ -22,6 +33,25 @@ class FieldConstraint(BaseModel):
     constraints: Dict[str, Any]
     nullablePercent: Optional[int]
 
+# 배치 요청: 여러 필드 프롬프트를 한 번에 받음 (스키마 전체 파싱용)
+class BatchPromptRequest(BaseModel):
+    prompts: List[str] = Field(
+        ...,
+        min_length=1,
+        max_length=200,
+        description="필드별 자연어 제약 설명 목록 (요청 순서대로 결과 반환)",
+        example=["비밀번호는 최소 10자 이상이고 숫자와 특수문자가 포함되어야 해", "나이는 20 이상 60 이하"],
+    )
+
+# 배치 응답: 항목별 결과 또는 오류 (한 항목 실패가 전체 500이 되지 않도록)
+class BatchSuggestItem(BaseModel):
+    index: int
+    result: Optional[FieldConstraint] = None
+    error: Optional[str] = None
+
+class BatchSuggestResponse(BaseModel):
+    results: List[BatchSuggestItem]
+
 # 새로운 auto-generate 요청 모델
 class AutoGenerateRequest(BaseModel):
     prompt: str = Field(
@@ -41,6 +71,28 @@ class AutoGenerateResponse(BaseModel):
     count: int
     fields: List[FieldDefinition]
 
+# 데이터 생성 요청: auto-generate 응답의 fields + 생성할 행 수
+class GenerateStreamRequest(BaseModel):
+    fields: List[FieldDefinition] = Field(
+        ...,
+        min_length=1,
+        description="AutoGenerateResponse.fields와 같은 필드 정의 목록",
+        example=[
+            {"name": "name", "type": "korean_full_name", "constraints": {}, "nullablePercent": 0},
+            {"name": "age", "type": "number", "constraints": {"min": 20, "max": 60, "decimals": 0}, "nullablePercent": 0},
+        ],
+    )
+    rows: int = Field(..., ge=1, le=100_000_000, description="생성할 행 수", example=1000)
+    format: Literal["ndjson", "csv"] = Field("ndjson", description="출력 형식")
+    chunk_rows: int = Field(10_000, ge=1, le=100_000, description="한 번에 생성·전송할 행 수")
+    null_mode: Literal["random", "exact"] = Field(
+        "random",
+        description="nullablePercent 적용 방식 (random: 행마다 확률, exact: 정확히 nullablePercent% 행)",
+    )
+    seed: Optional[int] = Field(None, ge=0, description="재현 가능한 생성용 전역 시드 (같은 seed·chunk_rows면 같은 데이터)")
+    shard: int = Field(0, ge=0, description="rows 전체 중 이번 요청이 받을 샤드 번호 (seed 필요)")
+    shards: int = Field(1, ge=1, le=10_000, description="전체 샤드 수")
+
 @router.post(
     "/fields/ai-suggest",
     summary="개별 필드 프롬프트 → 제약 추론",
@@ -49,17 +101,78 @@ class AutoGenerateResponse(BaseModel):
     response_model=FieldConstraint,
     response_model_exclude_none=False,  # None도 그대로 노출
 )
-def ai_suggest(
+async def ai_suggest(
     req: PromptRequest = Body(...),
+    parser: CachedParser = Depends(get_parser),
+    executor: Optional[ParseExecutor] = Depends(get_executor),
 ):
     try:
         # 가공 없이 원본 그대로 반환
-        result: Dict[str, Any] = parser.parse_field_constraint(req.prompt)
+        if executor is not None:
+            result: Dict[str, Any] = await executor.parse_field_constraint(parser, req.prompt)
+        else:
+            result = await run_in_threadpool(parser.parse_field_constraint, req.prompt)
         return result
+    except ExecutorBusy:
+        raise _busy()
     except Exception:
         # 내부 예외 메시지는 숨기고 500만 전달
         raise HTTPException(status_code=500, detail="Failed to parse constraints")
 
+@router.post(
+    "/fields/ai-suggest/batch",
+    summary="여러 필드 프롬프트 → 제약 추론 (배치)",
+    description="prompt 목록을 받아 같은 순서로 Parser.parse_field_constraint() 결과를 반환합니다. 실패한 항목은 error에 표시됩니다.",
+    tags=["fields"],
+    response_model=BatchSuggestResponse,
+    response_model_exclude_none=False,
+)
+async def ai_suggest_batch(
+    req: BatchPromptRequest = Body(...),
+    parser: CachedParser = Depends(get_parser),
+    executor: Optional[ParseExecutor] = Depends(get_executor),
+):
+    if executor is not None:
+        try:
+            parsed = await executor.parse_batch(parser, req.prompts)
+        except ExecutorBusy:
+            raise _busy()
+    else:
+        parsed = await run_in_threadpool(parser.parse_batch, req.prompts)
+
+    results: List[BatchSuggestItem] = []
+    for i, result in enumerate(parsed):
+        if result is None:
+            # 내부 예외 메시지는 숨기고 항목 단위로만 실패 표시
+            results.append(BatchSuggestItem(index=i, error="Failed to parse constraints"))
+        else:
+            results.append(BatchSuggestItem(index=i, result=result))
+    return BatchSuggestResponse(results=results)
+
+@router.get(
+    "/fields/ai-suggest/cache",
+    summary="ai-suggest 결과 캐시 통계",
+    description="정규화된 프롬프트 기준 LRU 캐시의 크기와 hit/miss/eviction 카운터를 반환합니다.",
+    tags=["fields"],
+)
+def ai_suggest_cache_stats(
+    parser: CachedParser = Depends(get_parser),
+):
+    return parser.stats()
+
+@router.get(
+    "/fields/executor",
+    summary="파싱 실행기 상태",
+    description="PARSE_EXECUTOR=process일 때 프로세스 풀의 워커 수, 대기열 깊이(queue_depth), 거절 수 등을 반환합니다.",
+    tags=["fields"],
+)
+def executor_stats(
+    executor: Optional[ParseExecutor] = Depends(get_executor),
+):
+    if executor is None:
+        return {"mode": "inline"}
+    return executor.stats()
+
 @router.post(
     "/fields/auto-generate",
     summary="전체 목적 프롬프트 → 필드 세트 자동 생성",
@@ -67,15 +180,50 @@ def ai_suggest(
     tags=["fields"],
     response_model=AutoGenerateResponse,
 )
-def auto_generate_fields(
+async def auto_generate_fields(
     req: AutoGenerateRequest = Body(...),
+    processor: SystemPromptProcessor = Depends(get_prompt_processor),
+    executor: Optional[ParseExecutor] = Depends(get_executor),
 ):
     try:
-        from app.services.system_prompt_processor import SystemPromptProcessor
-        
-        processor = SystemPromptProcessor()
-        result = processor.process_system_prompt(req.prompt)
+        if executor is not None:
+            result = await executor.process_system_prompt(req.prompt)
+        else:
+            result = await run_in_threadpool(processor.process_system_prompt, req.prompt)
         return result
+    except ExecutorBusy:
+        raise _busy()
     except Exception as e:
         # 내부 예외 메시지는 숨기고 500만 전달
         raise HTTPException(status_code=500, detail="Failed to generate fields")
+
+@router.post(
+    "/generate/stream",
+    summary="필드 정의 → 합성 데이터 스트리밍 (NDJSON / CSV)",
+    description="fields와 rows를 받아 chunk_rows개씩 생성하면서 바로 전송합니다. 전체 데이터를 메모리에 쌓지 않으므로 행 수와 관계없이 메모리 사용량이 일정합니다.",
+    tags=["generate"],
+)
+def generate_stream(req: GenerateStreamRequest = Body(...)):
+    try:
+        fields = normalize_fields(req.fields)
+        # 스트리밍이 시작되면 상태 코드를 바꿀 수 없으므로 제약 오류는 1행으로 미리 확인
+        generate_columns(fields, 1)
+        shard_blocks(req.rows, req.shard, req.shards, req.chunk_rows)
+        if req.seed is None and req.shards > 1:
+            raise ValueError("샤드 분할 생성에는 seed가 필요합니다.")
+        if req.seed is not None:
+            check_independent_blocks(fields, req.rows, req.chunk_rows)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid field constraints")
+
+    media_type, _ = FORMATS[req.format]
+    return StreamingResponse(
+        stream_dataset(
+            fields, req.rows, req.format, req.chunk_rows,
+            null_mode=req.null_mode, seed=req.seed, shard=req.shard, shards=req.shards,
+        ),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="dataset.{req.format}"'},
+    )
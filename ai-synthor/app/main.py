@@ -1,8 +1,21 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.api.endpoints.generation import router as generation_router
+from app.services.instances import start_executor, stop_executor, warm_up
+
+# 시작 시 Parser / SystemPromptProcessor를 한 번만 만들어 두고 모든 요청이 공유
+# PARSE_EXECUTOR=process면 파싱용 프로세스 풀도 미리 띄운다
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    warm_up()
+    start_executor()
+    yield
+    stop_executor()
 
 app = FastAPI(
+    lifespan=lifespan,
     title="Synthor-AI",
     version="1.0.0",
     docs_url="/docs",
@@ -0,0 +1,51 @@
+# 카드사 별칭 조회 벤치마크: python -m app.services.bench_aliases
+# KOR_TO_ENG_VALUE에 관계없는 별칭을 늘려 가며, 요청마다 사전을 훑던 방식과 AliasIndex 방식의 호출당 비용을 비교한다.
+import time
+
+from .constants_types import SUPPORTED_CARD_TYPES
+from .lexicon import AliasIndex
+from .mappings import KOR_TO_ENG_VALUE
+
+texts = [
+    "신용카드 번호는 비자카드로만",
+    "credit card type: Mastercard or JCB",
+    "아메리칸 익스프레스 카드 번호 생성",
+    "카드 번호는 아무 카드사나",  # 매칭 없음 (모든 카드사를 끝까지 확인)
+]
+
+
+def legacy(mapping, text):
+    low = text.lower()
+    for t in SUPPORTED_CARD_TYPES:
+        kor_eq = [k for k, v in mapping.items() if v == t]
+        if t.lower() in low or any(k in text for k in kor_eq):
+            return t
+    return None
+
+
+def indexed(index, text):
+    mentioned = index.mentioned(text)
+    for t in index.values:
+        if t in mentioned:
+            return t
+    return None
+
+
+def per_call_us(fn, arg, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for text in texts:
+            fn(arg, text)
+    return (time.perf_counter() - start) / (repeat * len(texts)) * 1e6
+
+
+if __name__ == "__main__":
+    print(f"{'aliases':>8} {'legacy µs/call':>15} {'index µs/call':>14}")
+    for extra in (0, 1_000, 10_000, 100_000):
+        mapping = dict(KOR_TO_ENG_VALUE)
+        mapping.update((f"별칭{i}", f"Value {i}") for i in range(extra))
+        index = AliasIndex(mapping, SUPPORTED_CARD_TYPES)
+        assert all(legacy(mapping, t) == indexed(index, t) for t in texts)
+        repeat = max(1, 2_000 // (1 + extra // 100))
+        print(f"{len(mapping):>8,} {per_call_us(legacy, mapping, repeat):>15.1f} "
+              f"{per_call_us(indexed, index, 2_000):>14.1f}")
@@ -1,4 +1,5 @@
 import re
+from ..patterns import PATTERNS
 from .base import ConstraintExtractor
 
 class AvatarExtractor(ConstraintExtractor):
@@ -9,42 +10,42 @@ class AvatarExtractor(ConstraintExtractor):
         t = text
 
         #128x128 / 128 X 128 / 128*128 / 128×128 (+ optional units)
-        m = re.search(
+        m = PATTERNS.search(
             r'(?<!\d)(\d+)\s*[xX\*×]\s*(\d+)\s*(?:px|픽셀|pixels?)?',
             t, re.I
         )
 
         #size: 128 x 128 / resolution 128x128
         if not m:
-            m = re.search(
+            m = PATTERNS.search(
                 r'(?:size|resolution|해상도)\s*[:=]?\s*(\d+)\s*[xX\*×]\s*(\d+)',
                 t, re.I
             )
 
         #"128 by 128"
         if not m:
-            m = re.search(
+            m = PATTERNS.search(
                 r'(?<!\d)(\d+)\s*(?:by|x)\s*(\d+)\b',
                 t, re.I
             )
 
         #"width 128 height 256" / "가로 128 세로 256" / "가로 0, 세로 0"
         if not m:
-            m = re.search(
+            m = PATTERNS.search(
                 r'(?:width|가로)\s*[:=]?\s*(\d+)\s*,?\s*(?:세로|height)\s*[:=]?\s*(\d+)',
                 t, re.I
             )
 
         #"세로 256 가로 128" (순서 반대) / "세로 0, 가로 0"
         if not m:
-            m = re.search(
+            m = PATTERNS.search(
                 r'(?:height|세로)\s*[:=]?\s*(\d+)\s*,?\s*(?:가로|width)\s*[:=]?\s*(\d+)',
                 t, re.I
             )
 
         #"정사각형 128", "square 128", "정방형 256", "128px square"
         if not m:
-            m_sq = re.search(
+            m_sq = PATTERNS.search(
                 r'(?:정사각형|정방형|square)\s*(\d+)\s*(?:px|픽셀|pixels?)?'
                 r'|(\d+)\s*(?:px|픽셀|pixels?)?\s*(?:정사각형|정방형|square)',
                 t, re.I
@@ -68,7 +69,7 @@ class AvatarExtractor(ConstraintExtractor):
         # 여러 형식 찾기
         found_formats = []
         for norm_fmt, pat in fmt_map.items():
-            for mfmt in re.finditer(pat, t, flags=re.I):
+            for mfmt in PATTERNS.finditer(pat, t, flags=re.I):
                 if norm_fmt not in found_formats:
                     found_formats.append(norm_fmt)
 
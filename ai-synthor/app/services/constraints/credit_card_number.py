@@ -1,14 +1,13 @@
 from .base import ConstraintExtractor
-from ..constants_types import SUPPORTED_CARD_TYPES
-from ..mappings import KOR_TO_ENG_VALUE
+from ..mappings import CARD_TYPE_ALIASES
 
 class CreditCardNumberExtractor(ConstraintExtractor):
     type_name = "credit_card_number"
 
     def extract(self, text: str) -> dict:
-        low = text.lower()
-        for t in SUPPORTED_CARD_TYPES:
-            kor_eq = [k for k, v in KOR_TO_ENG_VALUE.items() if v == t]
-            if t.lower() in low or any(k in text for k in kor_eq):
+        # 영문 카드사명(대소문자 무시)이나 별칭이 언급된 카드사 중 검사 순서상 첫 번째
+        mentioned = CARD_TYPE_ALIASES.mentioned(text)
+        for t in CARD_TYPE_ALIASES.values:
+            if t in mentioned:
                 return {"options": t}
         raise ValueError("지원하지 않는 카드사입니다.")
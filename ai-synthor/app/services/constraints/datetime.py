@@ -1,4 +1,5 @@
 import re
+from ..patterns import PATTERNS
 from datetime import datetime
 from .base import ConstraintExtractor
 
@@ -29,7 +30,7 @@ def validate_and_correct_date(date_str: str) -> str:
     ]
     
     for pattern in patterns:
-        match = re.match(pattern, date_str)
+        match = PATTERNS.match(pattern, date_str)
         if match:
             groups = match.groups()
             
@@ -103,7 +104,7 @@ class DatetimeExtractor(ConstraintExtractor):
         
         for fmt, patterns in format_patterns.items():
             for pattern in patterns:
-                if re.search(pattern, text, re.I):
+                if PATTERNS.search(pattern, text, re.I):
                     return {"format": fmt}
         
         # 날짜 예시 패턴으로 포맷 유추
@@ -115,7 +116,7 @@ class DatetimeExtractor(ConstraintExtractor):
         ]
         
         for pattern, fmt in date_examples:
-            if re.search(pattern, text):
+            if PATTERNS.search(pattern, text):
                 return {"format": fmt}
         
         return {}
@@ -125,11 +126,11 @@ class DatetimeExtractor(ConstraintExtractor):
         t = text.strip()
         
         # 문장 끝 불용어 제거 (please, 형식, 포맷 등)
-        t = re.sub(r'\s*(?:please|형식|포맷|format|으로|로)\s*$', '', t, flags=re.I)
+        t = PATTERNS.sub(r'\s*(?:please|형식|포맷|format|으로|로)\s*$', '', t, flags=re.I)
 
         # 예시 키워드가 있으면 날짜 포맷 우선 처리
         example_keywords = r'(?:^|\W)(e\.?g\.?|example|sample)[:\s]'
-        if re.search(example_keywords, t, re.I):
+        if PATTERNS.search(example_keywords, t, re.I):
             # 예시 문장에서 날짜 포맷만 추출
             format_result = self._extract_format_only(t)
             if format_result:
@@ -147,14 +148,14 @@ class DatetimeExtractor(ConstraintExtractor):
         )
 
         # "날짜 ~ 날짜" 범위 패턴 먼저 확인 (연결자 클래스 개선)
-        range_pattern = re.search(
+        range_pattern = PATTERNS.search(
             r'(?P<from>\d{4}[-/.]\d{1,2}[-/.]\d{1,2})\s*[-–—~]\s*(?P<to>\d{4}[-/.]\d{1,2}[-/.]\d{1,2})\s*(?:사이|범위|between)?',
             t, re.I
         )
         
         # yyyy-mm 범위 패턴 (2023.01 ~ 2023.12)
         if not range_pattern:
-            range_pattern = re.search(
+            range_pattern = PATTERNS.search(
                 r'(\d{4})[./-](\d{1,2})\s*[~-]\s*(\d{4})[./-](\d{1,2})',
                 t, re.I
             )
@@ -169,7 +170,7 @@ class DatetimeExtractor(ConstraintExtractor):
         
         # 한글 연월 범위 패턴 (2023년 1월 ~ 2023년 12월)
         if not range_pattern:
-            range_pattern = re.search(
+            range_pattern = PATTERNS.search(
                 r'(\d{4})\s*년\s*(\d{1,2})\s*월\s*[~-]\s*(\d{4})\s*년\s*(\d{1,2})\s*월',
                 t, re.I
             )
@@ -183,7 +184,7 @@ class DatetimeExtractor(ConstraintExtractor):
         
         # 한글 날짜 범위 패턴 (2023년 1월 5일 ~ 2023년 12월 31일)
         if not range_pattern:
-            range_pattern = re.search(
+            range_pattern = PATTERNS.search(
                 r'(\d{4})\s*년\s*(\d{1,2})\s*월\s*(\d{1,2})\s*일\s*[~-]\s*(\d{4})\s*년\s*(\d{1,2})\s*월\s*(\d{1,2})\s*일',
                 t, re.I
             )
@@ -203,7 +204,7 @@ class DatetimeExtractor(ConstraintExtractor):
             to_value = validate_and_correct_date(range_pattern.group('to'))
         else:
             # 기본 from/to 인식 (한글/영문 방향 키워드 사전 확장)
-            m_from = re.search(
+            m_from = PATTERNS.search(
             r'from\s*' + date_pattern + r'|'
             r'since\s*' + date_pattern + r'|'
             r'(?:start\s*date|start|시작(?:일| 날짜)?)\s*(?:[:=]|은|는)?\s*' + date_pattern + r'|'
@@ -217,7 +218,7 @@ class DatetimeExtractor(ConstraintExtractor):
             r'(?:생년월일|가입일|등록일시|생일|가입|등록)\s*(?:은|는)\s*(\d{4})\s*년\s*(\d{1,2})\s*월\s*부터',
                 t, re.I
             )
-            m_to = re.search(
+            m_to = PATTERNS.search(
             r'to\s*' + date_pattern + r'|'
             r'until\s*' + date_pattern + r'|'
             r'through\s*' + date_pattern + r'|'
@@ -277,14 +278,14 @@ class DatetimeExtractor(ConstraintExtractor):
 
         # 자연스러운 범위 표현: between/range/기간, ~ 구분
         if "from" not in c or "to" not in c:
-            m_between = re.search(
+            m_between = PATTERNS.search(
                 r'(?:between|기간|range|조회기간|유효기간|보고서\s*기간|기간\(포함\))\s*[:=]?\s*' + date_pattern + r'\s*(?:and|~|to|-|through|부터|까지)\s*' + date_pattern,
                 t, re.I
             )
             
             # en dash/em dash 범위 패턴
             if not m_between:
-                m_between = re.search(
+                m_between = PATTERNS.search(
                     date_pattern + r'\s*[-–—~]\s*' + date_pattern,
                     t, re.I
                 )
@@ -305,7 +306,7 @@ class DatetimeExtractor(ConstraintExtractor):
             
             # from ... through ... 패턴 추가
             if "from" not in c or "to" not in c:
-                m_through = re.search(
+                m_through = PATTERNS.search(
                     r'from\s*' + date_pattern + r'\s*through\s*' + date_pattern,
                     t, re.I
                 )
@@ -385,23 +386,23 @@ class DatetimeExtractor(ConstraintExtractor):
         earliest = None
         for fmt, patterns in fmt_map.items():
             for pat in patterns:
-                for m in re.finditer(pat, t, flags=re.IGNORECASE):
+                for m in PATTERNS.finditer(pat, t, flags=re.IGNORECASE):
                     pos = m.start()
                     if earliest is None or pos < earliest[0]:
                         earliest = (pos, fmt)
 
         if earliest is None:
             # 1. 명시적 format 키워드가 있는 경우
-            context = re.search(r'(형식|포맷|표기|방식|format|date\s*format|같은\s*형식|처럼|와\s*같이|와\s*같은)', t, re.I)
+            context = PATTERNS.search(r'(형식|포맷|표기|방식|format|date\s*format|같은\s*형식|처럼|와\s*같이|와\s*같은)', t, re.I)
             if context:
                 # yyyy sep mm sep dd
-                m_ymd = re.search(r'\b(\d{4})[\/\-\.](\d{1,2})[\/\-\.](\d{1,2})\b', t)
+                m_ymd = PATTERNS.search(r'\b(\d{4})[\/\-\.](\d{1,2})[\/\-\.](\d{1,2})\b', t)
                 # mm/dd/yyyy or dd/mm/yyyy or m/d/yyyy or d/m/yyyy
-                m_mdy = re.search(r'\b(\d{1,2})[\/\-\.](\d{1,2})[\/\-\.](\d{4})\b', t)
+                m_mdy = PATTERNS.search(r'\b(\d{1,2})[\/\-\.](\d{1,2})[\/\-\.](\d{4})\b', t)
                 # yyyy-mm
-                m_y_m = re.search(r'\b(\d{4})[\/\-\.](\d{1,2})\b', t)
+                m_y_m = PATTERNS.search(r'\b(\d{4})[\/\-\.](\d{1,2})\b', t)
                 # 2자리 연도 패턴 (yy.mm.dd, yy-mm-dd, yy/mm/dd)
-                m_yy_mm_dd = re.search(r'\b(\d{2})[\/\-\.](\d{2})[\/\-\.](\d{2})\b', t)
+                m_yy_mm_dd = PATTERNS.search(r'\b(\d{2})[\/\-\.](\d{2})[\/\-\.](\d{2})\b', t)
 
                 if m_ymd:
                     earliest = (m_ymd.start(), "yyyy-mm-dd")
@@ -422,33 +423,33 @@ class DatetimeExtractor(ConstraintExtractor):
             
             # 2. 한글 날짜 패턴 (2023년 1월 5일)
             if earliest is None:
-                m_korean_date = re.search(r'(\d{4})\s*년\s*(\d{1,2})\s*월\s*(\d{1,2})\s*일', t)
+                m_korean_date = PATTERNS.search(r'(\d{4})\s*년\s*(\d{1,2})\s*월\s*(\d{1,2})\s*일', t)
                 if m_korean_date:
                     earliest = (m_korean_date.start(), "yyyy-mm-dd")
                 else:
-                    m_korean_month = re.search(r'(\d{4})\s*년\s*(\d{1,2})\s*월', t)
+                    m_korean_month = PATTERNS.search(r'(\d{4})\s*년\s*(\d{1,2})\s*월', t)
                     if m_korean_month:
                         earliest = (m_korean_month.start(), "yyyy-mm")
             
             # 3. 단일 날짜 패턴으로 format 유추 (명시적 키워드가 없어도)
             if earliest is None:
                 # yyyy-mm-dd 패턴
-                m_ymd_single = re.search(r'^\d{4}-\d{2}-\d{2}$', t.strip())
+                m_ymd_single = PATTERNS.search(r'^\d{4}-\d{2}-\d{2}$', t.strip())
                 if m_ymd_single:
                     earliest = (m_ymd_single.start(), "yyyy-mm-dd")
                 else:
                     # yyyy-mm 패턴
-                    m_ym_single = re.search(r'^\d{4}-\d{2}$', t.strip())
+                    m_ym_single = PATTERNS.search(r'^\d{4}-\d{2}$', t.strip())
                     if m_ym_single:
                         earliest = (m_ym_single.start(), "yyyy-mm")
                     else:
                         # yyyy[./]mm 패턴 (2023.1, 2023/1)
-                        m_ym_dot = re.search(r'^\d{4}[./]\d{1,2}$', t.strip())
+                        m_ym_dot = PATTERNS.search(r'^\d{4}[./]\d{1,2}$', t.strip())
                         if m_ym_dot:
                             earliest = (m_ym_dot.start(), "yyyy-mm")
                         else:
                             # yyyy/mm/dd 패턴 → yyyy-mm-dd로 표준화
-                            m_ymd_slash = re.search(r'^\d{4}/\d{1,2}/\d{1,2}$', t.strip())
+                            m_ymd_slash = PATTERNS.search(r'^\d{4}/\d{1,2}/\d{1,2}$', t.strip())
                             if m_ymd_slash:
                                 earliest = (m_ymd_slash.start(), "yyyy-mm-dd")
 
@@ -462,7 +463,7 @@ class DatetimeExtractor(ConstraintExtractor):
             result["to"] = c["to"]
 
         # nullable 처리 - datetime 타입에서 우선 처리
-        nullable_match = re.search(
+        nullable_match = PATTERNS.search(
             r'(?:nullable(?:\s*percent)?|빈값|결측|누락|missing|null)\s*[:=]?\s*(\d{1,3})\s*%|'
             r'(\d{1,3})\s*%\s*(?:nullable|빈값|결측|누락|허용|allow)',
             t, re.I
@@ -485,12 +486,12 @@ class DatetimeExtractor(ConstraintExtractor):
             
             single_date_found = False
             for pattern in single_date_patterns:
-                match = re.search(pattern, t.strip())
+                match = PATTERNS.search(pattern, t.strip())
                 if match:
                     date_str = match.group(0)
                     # 두 자리 연도 처리 (yy.mm.dd → yyyy-mm-dd)
-                    if re.match(r'^\d{2}[./]\d{1,2}[./]\d{1,2}$', date_str):
-                        parts = re.split(r'[./]', date_str)
+                    if PATTERNS.match(r'^\d{2}[./]\d{1,2}[./]\d{1,2}$', date_str):
+                        parts = PATTERNS.split(r'[./]', date_str)
                         year = 2000 + int(parts[0])  # yy → 20yy
                         month, day = int(parts[1]), int(parts[2])
                         # 날짜 보정 적용
@@ -519,8 +520,8 @@ class DatetimeExtractor(ConstraintExtractor):
                         
                         date_str = f"{year:04d}-{month:02d}-{day:02d}"
                     # 연-월만 있는 경우 처리 (2023-01, 2023.1, 2023/1 → 2023-01-01)
-                    elif re.match(r'^\d{4}[-./]\d{1,2}$', date_str):
-                        parts = re.split(r'[-./]', date_str)
+                    elif PATTERNS.match(r'^\d{4}[-./]\d{1,2}$', date_str):
+                        parts = PATTERNS.split(r'[-./]', date_str)
                         year, month = int(parts[0]), int(parts[1])
                         # 월 검증 및 보정
                         if month < 1:
@@ -532,9 +533,9 @@ class DatetimeExtractor(ConstraintExtractor):
                         if "format" not in result or result["format"] == "yyyy-mm":
                             result["format"] = "yyyy-mm-dd"
                     # 한글 연월만 있는 경우 처리 (2023년 1월 → 2023-01-01)
-                    elif re.match(r'^\d{4}\s*년\s*\d{1,2}\s*월$', date_str):
-                        year_match = re.search(r'(\d{4})\s*년', date_str)
-                        month_match = re.search(r'(\d{1,2})\s*월', date_str)
+                    elif PATTERNS.match(r'^\d{4}\s*년\s*\d{1,2}\s*월$', date_str):
+                        year_match = PATTERNS.search(r'(\d{4})\s*년', date_str)
+                        month_match = PATTERNS.search(r'(\d{1,2})\s*월', date_str)
                         if year_match and month_match:
                             year, month = int(year_match.group(1)), int(month_match.group(1))
                             # 월 검증 및 보정
@@ -581,20 +582,20 @@ class DatetimeExtractor(ConstraintExtractor):
         # 하지만 테스트 케이스에서는 yyyy-mm 형식이어도 min_date/max_date는 yyyy-mm-dd 형식이어야 함
         # constraint_parser.py에서 from/to를 min_date/max_date로 변환할 때 yyyy-mm-dd 형식으로 변환
         # 연-월만 있는 경우 (2023-01, 2023.1, 2023/1) 처리
-        elif "from" in result and re.match(r'^\d{4}$', result["from"]):
+        elif "from" in result and PATTERNS.match(r'^\d{4}$', result["from"]):
             # from이 연도만 있는 경우 (2023) → 2023-01-01로 수정
             year = result["from"]
             result["from"] = f"{year}-01-01"
             result["format"] = "yyyy-mm-dd"  # 연-월만 있으면 yyyy-mm-dd로 설정
         # 연-월만 있는 경우 포맷을 yyyy-mm-dd로 설정
-        elif "from" in result and re.match(r'^\d{4}-\d{2}-\d{2}$', result["from"]) and result.get("format") == "yyyy-mm":
+        elif "from" in result and PATTERNS.match(r'^\d{4}-\d{2}-\d{2}$', result["from"]) and result.get("format") == "yyyy-mm":
             result["format"] = "yyyy-mm-dd"  # 연-월만 있으면 yyyy-mm-dd로 설정
         # 연-월만 있는 경우 from 값이 잘못된 경우 수정
         elif "from" in result and result["from"] == "2023" and result.get("format") == "yyyy-mm":
             result["from"] = "2023-01-01"
             result["format"] = "yyyy-mm-dd"
         # 연-월만 있는 경우 (2023-01, 2023.1, 2023/1) → 2023-01-01로 변환
-        elif "from" in result and re.match(r'^\d{4}-\d{2}$', result["from"]) and result.get("format") == "yyyy-mm":
+        elif "from" in result and PATTERNS.match(r'^\d{4}-\d{2}$', result["from"]) and result.get("format") == "yyyy-mm":
             # 2023-01 → 2023-01-01로 변환
             result["from"] = result["from"] + "-01"
             result["format"] = "yyyy-mm-dd"  # 연-월만 있으면 yyyy-mm-dd로 설정
@@ -623,7 +624,7 @@ class DatetimeExtractor(ConstraintExtractor):
         ]
         
         for pattern, detected_format in patterns:
-            match = re.match(pattern, date_str)
+            match = PATTERNS.match(pattern, date_str)
             if match:
                 groups = match.groups()
                 if detected_format == 'yyyy-mm-dd':
@@ -671,7 +672,7 @@ class DatetimeExtractor(ConstraintExtractor):
         ]
         
         for pattern, detected_format in patterns:
-            match = re.match(pattern, date_str)
+            match = PATTERNS.match(pattern, date_str)
             if match:
                 groups = match.groups()
                 if detected_format == 'yyyy-mm-dd':
@@ -1,17 +1,13 @@
 from typing import Dict, Any, Optional
 from .base import ConstraintExtractor
-from .email_address import EmailAddressConstraint
+from .email_address import parse_email_constraints
 
 
 class EmailExtractor(ConstraintExtractor):
-    """이메일 제약 조건 추출기"""
-    
-    def __init__(self):
-        super().__init__()
-        self.email_constraint = EmailAddressConstraint()
-    
+    """이메일 제약 조건 추출기 (도메인 표·매처는 email_address 모듈의 것을 공유)"""
+
     def extract(self, text: str) -> Optional[Dict[str, Any]]:
         """한글 텍스트에서 이메일 제약 조건 추출"""
-        return self.email_constraint.parse_korean_constraints(text)
-    
+        return parse_email_constraints(text)
+
     type_name = "email_address"
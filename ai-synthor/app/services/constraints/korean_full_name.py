@@ -1,4 +1,5 @@
 import re
+from ..patterns import PATTERNS
 from .base import ConstraintExtractor
 
 
@@ -10,17 +11,17 @@ class KoreanFullNameExtractor(ConstraintExtractor):
 
     def _normalize(self, text: str) -> str:
         t = text.replace('\u200b', '')
-        t = re.sub(r'\s+', ' ', text).strip()
+        t = PATTERNS.sub(r'\s+', ' ', text).strip()
         return t
 
     def _strip_josa(self, s: str) -> str:
         # 긴 꼬리
-        s = re.sub(r'(?:으로써|로써|으로서|로서)$', '', s)
-        s = re.sub(r'(?:입니다|임니다|이신)$', '', s)
+        s = PATTERNS.sub(r'(?:으로써|로써|으로서|로서)$', '', s)
+        s = PATTERNS.sub(r'(?:입니다|임니다|이신)$', '', s)
         # 단일/일반 조사 (이/가는 성씨일 가능성이 높으므로 제외)
-        s = re.sub(r'(?:으로|로|은|는|을|를|과|와|의|에|에서|에게|까지|부터|도|만|이나|나)$', '', s)
+        s = PATTERNS.sub(r'(?:으로|로|은|는|을|를|과|와|의|에|에서|에게|까지|부터|도|만|이나|나)$', '', s)
         # 안전망: 한국 성씨는 '으'로 끝나지 않음 → 남아있으면 제거
-        s = re.sub(r'으$', '', s)
+        s = PATTERNS.sub(r'으$', '', s)
         return s
 
     def extract(self, text: str) -> dict:
@@ -36,10 +37,10 @@ class KoreanFullNameExtractor(ConstraintExtractor):
             r'lastName\s+(' + self._H15 + r')(?=\s|$)',
         ]
         for p in eng_patterns:
-            m = re.search(p, t, flags=re.IGNORECASE)
+            m = PATTERNS.search(p, t, flags=re.IGNORECASE)
             if m:
                 surname = self._strip_josa(m.group(1))
-                if re.fullmatch(self._H15, surname):
+                if PATTERNS.fullmatch(self._H15, surname):
                     return {"lastName": surname}
 
         # 1) 한국어 핵심 패턴 (정확도 높은 것부터)
@@ -66,11 +67,11 @@ class KoreanFullNameExtractor(ConstraintExtractor):
             # r'성씨가\s*(' + self._H15 + r')(?=(?:으로|로)\s*(?:끝나는|시작(?:하는)?|되어\s*있는))',  # 이 패턴도 제거
         ]
         for p in primary_ko:
-            m = re.search(p, t)
+            m = PATTERNS.search(p, t)
             if m:
                 surname = self._strip_josa(m.group(1))
                 # 성씨 길이 검증만 하고, 사전 검증은 나중에 하도록 수정
-                if re.fullmatch(self._H15, surname):
+                if PATTERNS.fullmatch(self._H15, surname):
                     return {"lastName": surname}
 
         # 2) “X이라는 성(씨) … 가진/가지고 …” (비전통 성씨 허용)
@@ -78,10 +79,10 @@ class KoreanFullNameExtractor(ConstraintExtractor):
             r'(' + self._H110 + r')이라는?\s*성(?:씨)?\s*(?:을|이)?\s*(?:가진|가지고)',
         ]
         for p in iri_patterns:
-            m = re.search(p, t)
+            m = PATTERNS.search(p, t)
             if m:
                 surname = self._strip_josa(m.group(1))
-                if re.fullmatch(r'[가-힣]{1,10}', surname):
+                if PATTERNS.fullmatch(r'[가-힣]{1,10}', surname):
                     return {"lastName": surname}
 
         # 3) 명사구: “X 성/성씨 [을/를/은/는] …”, “성: X”, “X씨 …”, “X 성/성씨를 쓰는…”
@@ -94,10 +95,10 @@ class KoreanFullNameExtractor(ConstraintExtractor):
             # r'(' + self._H15 + r')\s*성(?:씨)?\s*(?:을|이)?\s*(?:가진|가지고|쓰는)\b',  # 이 패턴도 제거하여 "김씨 성을 가진 사람"에서 "김씨" 전체가 캡처되는 것을 방지
         ]
         for p in noun_patterns:
-            m = re.search(p, t)
+            m = PATTERNS.search(p, t)
             if m:
                 surname = self._strip_josa(m.group(1))
-                if re.fullmatch(self._H15, surname) or re.fullmatch(r'[가-힣]{2,10}', surname):
+                if PATTERNS.fullmatch(self._H15, surname) or PATTERNS.fullmatch(r'[가-힣]{2,10}', surname):
                     return {"lastName": surname}
 
         # 4) 느슨한 fallback — 이어지는 접사/어미가 붙으면 배제
@@ -106,17 +107,17 @@ class KoreanFullNameExtractor(ConstraintExtractor):
             r'성씨가\s*(' + self._H15 + r')(?!인|이라는|이라|라|로|으로)(?=\s|$)',
         ]
         for p in loose:
-            m = re.search(p, t)
+            m = PATTERNS.search(p, t)
             if m:
                 surname = self._strip_josa(m.group(1))
-                if re.fullmatch(self._H15, surname):
+                if PATTERNS.fullmatch(self._H15, surname):
                     return {"lastName": surname}
 
         # 5) korean_processor.py의 로직 추가 - "~씨" 패턴에서 성씨만 추출
-        lastname_match = re.search(r'([가-힣]+)씨', t)
+        lastname_match = PATTERNS.search(r'([가-힣]+)씨', t)
         if lastname_match:
             lastname = lastname_match.group(1)
-            if re.fullmatch(self._H15, lastname):
+            if PATTERNS.fullmatch(self._H15, lastname):
                 return {"lastName": lastname}
 
         # 6) 여러 성씨 처리 (예: "이씨와 박씨만", "최씨, 정씨, 강씨 중에서만")
@@ -130,11 +131,11 @@ class KoreanFullNameExtractor(ConstraintExtractor):
         ]
         
         for pattern in multiple_surnames_patterns:
-            match = re.search(pattern, t)
+            match = PATTERNS.search(pattern, t)
             if match:
                 surnames = list(match.groups())
                 # 유효한 성씨만 필터링
-                valid_surnames = [s for s in surnames if re.fullmatch(self._H15, s)]
+                valid_surnames = [s for s in surnames if PATTERNS.fullmatch(self._H15, s)]
                 if valid_surnames:
                     if len(valid_surnames) == 1:
                         return {"lastName": valid_surnames[0]}
@@ -151,7 +152,7 @@ class KoreanFullNameExtractor(ConstraintExtractor):
             "휘","흥","희"
         }
         for s in sorted(KOREAN_SURNAMES, key=len, reverse=True):
-            if re.search(r'(?<![가-힣])' + re.escape(s) + r'(?=(?:으로|로)|[^가-힣]|$)', t):
+            if PATTERNS.search(r'(?<![가-힣])' + re.escape(s) + r'(?=(?:으로|로)|[^가-힣]|$)', t):
                 return {"lastName": s}
 
         return {}
@@ -182,7 +183,7 @@ class KoreanFullNameExtractor(ConstraintExtractor):
             r"(\d{1,3})\s*이면",
         ]
         for p in patterns:
-            m = re.search(p, text, re.I)
+            m = PATTERNS.search(p, text, re.I)
             if m:
                 for g in m.groups():
                     if g and g.isdigit():
@@ -199,9 +200,13 @@ class KoreanFullNameExtractor(ConstraintExtractor):
         }
 
 
+# KoreanLastNameExtractor가 공유하는 인스턴스
+_FULL_NAME_EXTRACTOR = KoreanFullNameExtractor()
+
+
 class KoreanLastNameExtractor(ConstraintExtractor):
     type_name = "korean_last_name"
 
     def extract(self, text: str) -> dict:
         # korean_full_name과 동일 로직으로 성만 추출
-        return KoreanFullNameExtractor().extract(text)
+        return _FULL_NAME_EXTRACTOR.extract(text)
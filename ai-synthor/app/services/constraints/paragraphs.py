@@ -1,233 +1,201 @@
 import re
+from typing import Dict, Optional, Sequence
+from ..patterns import PATTERNS
 from .base import ConstraintExtractor
 
+# 패턴 목록은 모듈 로드 시 한 번만 컴파일한다 (호출마다 목록·alternation 문자열을 만들지 않는다)
+# 판정은 키워드 alternation 한 번, 개수는 정확한 개수 → 범위 → 최소/최대 순으로 패밀리별 한 번씩 검색
+
+# 문단 키워드: constraint_parser가 paragraphs 타입을 최우선으로 둘지 판단할 때 쓴다
+# (기존 키워드 목록의 모든 패턴은 이 중 하나를 포함하므로 판정 결과가 같다)
+PARAGRAPH_KEYWORDS = (r'문단', r'단락', r'본문', r'paragraph', r'section', r'blocks?\s*of\s*text')
+
+# ParagraphsExtractor 판정용 표현 (이름 그룹으로 언어별 구분)
+# 예전 한국어/영어/혼합 표현 목록(150여 개)의 각 패턴은 아래 중 하나를 포함하므로 판정 결과가 같다
+# ('최소 N (at least N)' 류 역참조 패턴은 한 alternation 안에서 다른 패턴의 그룹을 가리켜 맞은 적이 없다)
+GATE_FAMILIES = (
+    ('korean', (r'문단', r'단락', r'본문[은이을의에]')),
+    ('english', (
+        r'paragraph', r'section', r'blocks?\s*of\s*text',
+        r'your\s*(?:text|writing|answer|content|response)', r'the\s*(?:content|text|writing|answer)',
+        r'contain', r'include', r'have', r'keep', r'limit', r'provide', r'write', r'compose',
+        r'organize', r'structure', r'(?:precisely|exactly)\s*\d',
+    )),
+)
+
+_WORD = r'(one|two|three|four|five|six|seven|eight|nine|ten)'
+
+# 정확한 개수 (범위 표현이 아닌 정확한 개수만)
+EXACT_PATTERNS = (
+    r'총\s*(\d+)\s*개', r'정확히\s*(\d+)\s*개', r'정확히\s*(\d+)\s*개의',
+    r'(\d+)\s*개로\s*작성', r'(\d+)\s*개로\s*제한', r'(\d+)\s*개로\s*구성',
+    r'(\d+)\s*개\s*문단', r'(\d+)\s*개\s*단락',
+    r'exactly\s*(\d+)', r'precisely\s*(\d+)', r'exactly\s*(\d+)\s*paragraphs?',
+    r'precisely\s*(\d+)\s*paragraphs?', r'(\d+)\s*paragraphs?\s*exactly',
+    r'(\d+)\s*개\s*\(exactly\s*\1\s*paragraphs?\)', r'정확히\s*(\d+)\s*\(exactly\s*\1\s*paragraphs?\)',
+    r'(\d+)\s*paragraphs?로\s*구성되어야\s*합니다', r'(\d+)\s*paragraphs?로\s*작성되어야\s*합니다',
+    # 영어 숫자 정확한 개수 패턴들
+    rf'exactly\s*{_WORD}\s*paragraphs?', rf'precisely\s*{_WORD}\s*paragraphs?',
+    rf'{_WORD}\s*paragraphs?\s*exactly', rf'{_WORD}\s*paragraphs?\s*precisely',
+)
+
+# 범위 (목록 순서가 우선순위: 앞 패턴이 텍스트 어디에서든 맞으면 그 패턴만 쓴다)
+RANGE_PATTERNS = (
+    # 영어 숫자 패턴들 (우선순위 높음)
+    rf'between\s*{_WORD}\s*and\s*{_WORD}\s*paragraphs?', rf'between\s*{_WORD}\s*and\s*{_WORD}',
+    rf'{_WORD}\s*to\s*{_WORD}\s*paragraphs?', rf'{_WORD}\s*to\s*{_WORD}',
+    rf'from\s*{_WORD}\s*to\s*{_WORD}\s*paragraphs?', rf'from\s*{_WORD}\s*to\s*{_WORD}',
+    rf'in\s*the\s*range\s*of\s*{_WORD}\s*to\s*{_WORD}\s*paragraphs?',
+    rf'in\s*the\s*range\s*of\s*{_WORD}\s*to\s*{_WORD}',
+    rf'anywhere\s*from\s*{_WORD}\s*to\s*{_WORD}\s*paragraphs?',
+    rf'anywhere\s*from\s*{_WORD}\s*to\s*{_WORD}',
+    # 숫자 패턴들 (그룹이 하나뿐인 'N 사이' 류가 먼저 맞으면 범위 없이 끝난다)
+    r'(\d+)\s*~?\s*(\d+)', r'(\d+)\s*-\s*(\d+)', r'(\d+)\s*에서\s*(\d+)',
+    r'between\s*(\d+)\s*and\s*(\d+)', r'(\d+)\s*to\s*(\d+)',
+    r'(\d+)\s*개\s*~?\s*(\d+)\s*개', r'(\d+)\s*개\s*-\s*(\d+)\s*개',
+    r'from\s*(\d+)\s*to\s*(\d+)', r'(\d+)\s*–\s*(\d+)', r'(\d+)\s*사이',
+    r'(\d+)\s*개\s*사이', r'(\d+)\s*개\s*에서\s*(\d+)\s*개', r'(\d+)\s*개\s*범위',
+    r'in\s*the\s*range\s*of\s*(\d+)\s*to\s*(\d+)', r'anywhere\s*from\s*(\d+)\s*to\s*(\d+)',
+    r'(\d+)\s*to\s*(\d+)\s*paragraphs?', r'(\d+)\s*–\s*(\d+)\s*paragraphs?',
+    r'from\s*(\d+)\s*to\s*(\d+)\s*paragraphs?', r'(\d+)\s*to\s*(\d+)\s*개의?\s*문단',
+    r'(\d+)\s*–\s*(\d+)\s*개의?\s*문단',
+)
+
+# 최소값
+MIN_PATTERNS = (
+    r'최소\s*(\d+)', r'at\s*least\s*(\d+)', r'(\d+)\s*이상', r'(\d+)\s*개\s*이상',
+    r'(\d+)\s*개\s*이상의', r'(\d+)\s*개\s*이상으로', r'minimum\s*of\s*(\d+)',
+    r'no\s*fewer\s*than\s*(\d+)', r'a\s*minimum\s*of\s*(\d+)',
+    r'최소\s*(\d+)\s*개', r'최소\s*(\d+)\s*개의', r'최소\s*(\d+)\s*개로',
+    r'(\d+)\s*개\s*이상의\s*문단', r'(\d+)\s*개\s*이상으로\s*작성',
+    r'(\d+)\s*개\s*이상\s*포함', r'(\d+)\s*개\s*이상\s*작성',
+    r'at\s*least\s*(\d+)\s*paragraphs?', r'at\s*least\s*(\d+)\s*개',
+    r'(\d+)\s*개\s*이상\s*\(at\s*least\s*\1\s*paragraphs?\)',
+    r'최소\s*(\d+)\s*\(at\s*least\s*\1\s*paragraphs?\)',
+    # 영어 숫자 패턴들
+    rf'at\s*least\s*{_WORD}\s*paragraphs?', rf'minimum\s*of\s*{_WORD}\s*paragraphs?',
+    rf'no\s*fewer\s*than\s*{_WORD}\s*paragraphs?', rf'a\s*minimum\s*of\s*{_WORD}\s*paragraphs?',
+)
+
+# 최대값
+MAX_PATTERNS = (
+    r'최대\s*(\d+)', r'no\s*more\s*than\s*(\d+)', r'(\d+)\s*이하', r'(\d+)\s*개\s*이하',
+    r'(\d+)\s*개\s*이하의', r'(\d+)\s*개\s*이하로', r'maximum\s*of\s*(\d+)',
+    r'not\s*more\s*than\s*(\d+)', r'a\s*maximum\s*of\s*(\d+)',
+    r'최대\s*(\d+)\s*개', r'최대\s*(\d+)\s*개까지만', r'최대\s*(\d+)\s*개로',
+    r'(\d+)\s*개\s*이하로\s*작성', r'(\d+)\s*개\s*이하로\s*제한',
+    r'(\d+)\s*개\s*까지만', r'(\d+)\s*개\s*까지만\s*작성',
+    r'up\s*to\s*(\d+)', r'limit\s*to\s*(\d+)', r'limit\s*your\s*text\s*to\s*a\s*maximum\s*of\s*(\d+)',
+    r'no\s*more\s*than\s*(\d+)\s*paragraphs?', r'no\s*more\s*than\s*(\d+)\s*개',
+    r'(\d+)\s*개\s*이하\s*\(no\s*more\s*than\s*\1\s*paragraphs?\)',
+    r'최대\s*(\d+)\s*\(no\s*more\s*than\s*\1\s*paragraphs?\)',
+    # 영어 숫자 패턴들
+    rf'no\s*more\s*than\s*{_WORD}\s*paragraphs?', rf'maximum\s*of\s*{_WORD}\s*paragraphs?',
+    rf'not\s*more\s*than\s*{_WORD}\s*paragraphs?', rf'a\s*maximum\s*of\s*{_WORD}\s*paragraphs?',
+    rf'up\s*to\s*{_WORD}\s*paragraphs?',
+)
+
+_NUMBER_WORDS = {
+    'one': 1, 'two': 2, 'three': 3, 'four': 4, 'five': 5,
+    'six': 6, 'seven': 7, 'eight': 8, 'nine': 9, 'ten': 10,
+    'eleven': 11, 'twelve': 12, 'thirteen': 13, 'fourteen': 14, 'fifteen': 15,
+    'sixteen': 16, 'seventeen': 17, 'eighteen': 18, 'nineteen': 19, 'twenty': 20,
+}
+
+# 이스케이프(\x), 역참조(\1), 캡처 그룹 여는 괄호
+_GROUP_TOKEN = re.compile(r'\\(\d)|\\.|\((?!\?)')
+
+
+def _named(pattern: str, prefix: str) -> str:
+    """캡처 그룹을 prefix_1, prefix_2 ... 이름 그룹으로, \\1 같은 역참조도 같은 이름으로 바꾼다
+
+    패턴 여러 개를 alternation으로 묶어도 역참조가 자기 패턴의 그룹을 가리키도록 하기 위함
+    """
+    count = 0
+
+    def repl(m):
+        nonlocal count
+        if m.group(1):
+            return f'(?P={prefix}_{m.group(1)})'
+        if m.group(0) == '(':
+            count += 1
+            return f'(?P<{prefix}_{count}>'
+        return m.group(0)
+
+    return _GROUP_TOKEN.sub(repl, pattern)
+
+
+def _any(patterns: Sequence[str]) -> str:
+    """순서를 지킨 alternation (캡처 그룹·역참조는 패턴마다 다른 이름으로 바꾼다)"""
+    return '|'.join(f'(?:{_named(p, f"p{i}")})' for i, p in enumerate(patterns))
+
+
+_KEYWORD_RE = PATTERNS.compile('|'.join(PARAGRAPH_KEYWORDS), re.I)
+_GATE_RE = PATTERNS.compile('|'.join(f'(?P<{name}>{"|".join(ps)})' for name, ps in GATE_FAMILIES), re.I)
+_EXACT_RE = PATTERNS.compile(_any(EXACT_PATTERNS), re.I)
+_MIN_RE = PATTERNS.compile(_any(MIN_PATTERNS), re.I)
+_MAX_RE = PATTERNS.compile(_any(MAX_PATTERNS), re.I)
+# 범위는 목록 순서가 우선이라 하나로 묶으면 결과가 달라지므로 패턴별로 컴파일해 순서대로 본다
+_RANGE_RES = PATTERNS.compile_many(RANGE_PATTERNS, re.I)
+
+
+def _to_number(value: str) -> Optional[int]:
+    if value.isdigit():
+        return int(value)
+    return _NUMBER_WORDS.get(value.lower())
+
+
+def _search_number(pattern: re.Pattern, text: str) -> Optional[int]:
+    """alternation에서 맞은 패턴의 숫자 (패턴마다 숫자 그룹이 하나뿐이므로 마지막으로 닫힌 그룹)"""
+    m = pattern.search(text)
+    return _to_number(m.group(m.lastgroup)) if m else None
+
+
+def mentions_paragraphs(text: str) -> bool:
+    """문단/단락 키워드가 있는지 (constraint_parser의 paragraphs 우선 판정)"""
+    return _KEYWORD_RE.search(text) is not None
+
+
+def paragraph_counts(text: str) -> Dict[str, int]:
+    """문단 수 제약 {"at least", "but no more than"} (문단 표현이 없으면 빈 dict)"""
+    c: Dict[str, int] = {}
+    if not _GATE_RE.search(text):
+        return c
+
+    # 정확한 개수가 있으면 범위/최소/최대는 보지 않는다
+    exact_val = _search_number(_EXACT_RE, text)
+    if exact_val is not None:
+        c["at least"] = exact_val
+        c["but no more than"] = exact_val
+        return c
+
+    # 처음 맞은 범위 패턴만 사용 (그룹이 둘 미만인 'N 사이' 류면 범위 없음)
+    for pattern in _RANGE_RES:
+        m = pattern.search(text)
+        if m:
+            groups = m.groups()
+            if len(groups) >= 2:
+                min_val, max_val = _to_number(groups[0]), _to_number(groups[1])
+                if min_val is not None and max_val is not None:
+                    # 순서가 바뀐 경우 교환
+                    c["at least"] = min(min_val, max_val)
+                    c["but no more than"] = max(min_val, max_val)
+            break
+
+    # 범위가 설정되지 않았을 때만 개별 최소/최대값
+    if "at least" not in c:
+        min_val = _search_number(_MIN_RE, text)
+        if min_val is not None:
+            c["at least"] = min_val
+    if "but no more than" not in c:
+        max_val = _search_number(_MAX_RE, text)
+        if max_val is not None:
+            c["but no more than"] = max_val
+    return c
+
+
 class ParagraphsExtractor(ConstraintExtractor):
     type_name = "paragraphs"
 
     def extract(self, text: str) -> dict:
-        c = {}
-        
-        # 한국어 문단/단락 표현들
-        korean_patterns = [
-            r'문단', r'단락', r'글의\s*문단', r'본문\s*단락', r'글\s*단락',
-            r'글의\s*문단\s*수', r'본문\s*구성\s*단락', r'단락\s*수', r'문단\s*수',
-            r'글의\s*각\s*단락', r'본문의\s*각\s*문단', r'글의\s*내용\s*단락',
-            r'문단\s*개수', r'문단\s*수는', r'문단\s*개수를', r'문단\s*수를',
-            r'문단\s*개수는', r'문단\s*수는', r'문단\s*개수를', r'문단\s*수를',
-            r'본문은', r'본문이', r'본문을', r'본문의', r'본문에',
-            r'문단으로\s*구성', r'문단으로\s*작성', r'문단을\s*작성', r'문단으로\s*맞춰',
-            r'문단으로\s*유지', r'문단으로\s*제한', r'문단으로\s*범위', r'문단으로\s*사이',
-            r'문단은\s*총', r'문단\s*수는\s*총', r'문단\s*개수는\s*총',
-            r'문단은\s*정확히', r'문단\s*수는\s*정확히', r'문단\s*개수는\s*정확히',
-            r'문단을\s*총', r'문단을\s*정확히', r'문단을\s*정확히\s*(\d+)개',
-            r'문단은\s*최소', r'문단은\s*최대', r'문단\s*수는\s*최소', r'문단\s*수는\s*최대',
-            r'문단\s*개수는\s*최소', r'문단\s*개수는\s*최대', r'본문은\s*최소', r'본문은\s*최대'
-        ]
-        
-        # 영어 문단/단락 표현들
-        english_patterns = [
-            r'paragraphs?', r'text\s*paragraphs?', r'body\s*paragraphs?',
-            r'content\s*paragraphs?', r'sections?', r'blocks?\s*of\s*text',
-            r'written\s*paragraphs?', r'textual\s*paragraphs?', r'paragraph\s*units?',
-            r'paragraph\s*blocks?', r'each\s*paragraph\s*in\s*the\s*text',
-            r'paragraph\s*count', r'number\s*of\s*paragraphs?', r'paragraph\s*structure',
-            r'paragraph\s*composition', r'paragraph\s*organization', r'paragraph\s*layout',
-            r'your\s*text', r'your\s*writing', r'your\s*answer', r'your\s*content',
-            r'the\s*content', r'the\s*text', r'the\s*writing', r'the\s*answer',
-            r'composed\s*of', r'contain', r'include', r'have', r'keep', r'limit',
-            r'provide', r'write', r'compose', r'organize', r'structure',
-            r'your\s*response', r'your\s*response\s*must\s*have', r'your\s*text\s*must\s*have',
-            r'your\s*writing\s*must\s*have', r'your\s*answer\s*must\s*have',
-            r'provide\s*exactly', r'write\s*exactly', r'compose\s*exactly',
-            r'include\s*exactly', r'contain\s*exactly', r'have\s*exactly',
-            r'precisely\s*(\d+)', r'exactly\s*(\d+)', r'precisely\s*(\d+)\s*paragraphs?',
-            r'exactly\s*(\d+)\s*paragraphs?', r'(\d+)\s*paragraphs?\s*exactly',
-            r'(\d+)\s*paragraphs?\s*precisely'
-        ]
-        
-        # 한국어+영어 혼합 표현들
-        mixed_patterns = [
-            r'문단\s*\(paragraph\)', r'단락\s*\(paragraph\)', r'본문\s*문단\s*\(body\s*paragraph\)',
-            r'글\s*단락\s*\(text\s*paragraph\)', r'내용\s*단락\s*\(content\s*paragraph\)',
-            r'단락\s*수\s*\(paragraph\s*count\)', r'문단\s*수\s*\(paragraph\s*count\)',
-            r'글의\s*각\s*문단\s*\(each\s*paragraph\)', r'단락\s*블록\s*\(paragraph\s*block\)',
-            r'글의\s*문단\s*구성\s*\(paragraph\s*structure\)',
-            r'문단\s*\(3\s*to\s*5\s*paragraphs?\)', r'문단\s*\(3–5\s*paragraphs?\)',
-            r'최소\s*(\d+)\s*\(at\s*least\s*\1\)', r'최대\s*(\d+)\s*\(no\s*more\s*than\s*\1\)',
-            r'(\d+)\s*개\s*이상\s*(\d+)\s*개\s*이하\s*\(3–5\s*paragraphs?\)',
-            r'(\d+)\s*개\s*이상\s*(\d+)\s*개\s*이하\s*\(at\s*least\s*\1,\s*no\s*more\s*than\s*\2\)',
-            r'문단\s*수\s*\(3\s*to\s*5\)', r'문단\s*개수\s*\(3–5\s*paragraphs?\)',
-            r'(\d+)\s*개\s*이상\s*(\d+)\s*개\s*이하의\s*문단\s*\(at\s*least\s*\1,\s*no\s*more\s*than\s*\2\)',
-            r'(\d+)\s*–\s*(\d+)\s*개의\s*문단', r'(\d+)\s*to\s*(\d+)\s*개의\s*문단'
-        ]
-        
-        # 모든 패턴을 하나로 결합
-        all_patterns = korean_patterns + english_patterns + mixed_patterns
-        pattern_str = '|'.join(all_patterns)
-        
-        # 텍스트에서 문단/단락 관련 표현이 있는지 확인
-        if re.search(pattern_str, text, re.I):
-            # 영어 숫자를 아라비아 숫자로 변환하는 함수
-            def word_to_number(word):
-                word = word.lower()
-                number_map = {
-                    'one': 1, 'two': 2, 'three': 3, 'four': 4, 'five': 5,
-                    'six': 6, 'seven': 7, 'eight': 8, 'nine': 9, 'ten': 10,
-                    'eleven': 11, 'twelve': 12, 'thirteen': 13, 'fourteen': 14, 'fifteen': 15,
-                    'sixteen': 16, 'seventeen': 17, 'eighteen': 18, 'nineteen': 19, 'twenty': 20
-                }
-                return number_map.get(word, None)
-            
-            # 안전한 숫자 추출 함수
-            def safe_extract_number(match):
-                if match:
-                    groups = match.groups()
-                    for group in groups:
-                        if group is not None:
-                            if group.isdigit():
-                                return int(group)
-                            else:
-                                # 영어 숫자인지 확인
-                                num = word_to_number(group)
-                                if num is not None:
-                                    return num
-                return None
-            
-            # 최소값 패턴
-            min_pattern = '|'.join([
-                r'최소\s*(\d+)', r'at\s*least\s*(\d+)', r'(\d+)\s*이상', r'(\d+)\s*개\s*이상',
-                r'(\d+)\s*개\s*이상의', r'(\d+)\s*개\s*이상으로', r'minimum\s*of\s*(\d+)',
-                r'no\s*fewer\s*than\s*(\d+)', r'a\s*minimum\s*of\s*(\d+)',
-                r'최소\s*(\d+)\s*개', r'최소\s*(\d+)\s*개의', r'최소\s*(\d+)\s*개로',
-                r'(\d+)\s*개\s*이상의\s*문단', r'(\d+)\s*개\s*이상으로\s*작성',
-                r'(\d+)\s*개\s*이상\s*포함', r'(\d+)\s*개\s*이상\s*작성',
-                r'at\s*least\s*(\d+)\s*paragraphs?', r'at\s*least\s*(\d+)\s*개',
-                r'(\d+)\s*개\s*이상\s*\(at\s*least\s*\1\s*paragraphs?\)',
-                r'최소\s*(\d+)\s*\(at\s*least\s*\1\s*paragraphs?\)',
-                # 영어 숫자 패턴들
-                r'at\s*least\s*(one|two|three|four|five|six|seven|eight|nine|ten)\s*paragraphs?',
-                r'minimum\s*of\s*(one|two|three|four|five|six|seven|eight|nine|ten)\s*paragraphs?',
-                r'no\s*fewer\s*than\s*(one|two|three|four|five|six|seven|eight|nine|ten)\s*paragraphs?',
-                r'a\s*minimum\s*of\s*(one|two|three|four|five|six|seven|eight|nine|ten)\s*paragraphs?'
-            ])
-            
-            # 최대값 패턴
-            max_pattern = '|'.join([
-                r'최대\s*(\d+)', r'no\s*more\s*than\s*(\d+)', r'(\d+)\s*이하', r'(\d+)\s*개\s*이하',
-                r'(\d+)\s*개\s*이하의', r'(\d+)\s*개\s*이하로', r'maximum\s*of\s*(\d+)',
-                r'not\s*more\s*than\s*(\d+)', r'a\s*maximum\s*of\s*(\d+)',
-                r'최대\s*(\d+)\s*개', r'최대\s*(\d+)\s*개까지만', r'최대\s*(\d+)\s*개로',
-                r'(\d+)\s*개\s*이하로\s*작성', r'(\d+)\s*개\s*이하로\s*제한',
-                r'(\d+)\s*개\s*까지만', r'(\d+)\s*개\s*까지만\s*작성',
-                r'up\s*to\s*(\d+)', r'limit\s*to\s*(\d+)', r'limit\s*your\s*text\s*to\s*a\s*maximum\s*of\s*(\d+)',
-                r'no\s*more\s*than\s*(\d+)\s*paragraphs?', r'no\s*more\s*than\s*(\d+)\s*개',
-                r'(\d+)\s*개\s*이하\s*\(no\s*more\s*than\s*\1\s*paragraphs?\)',
-                r'최대\s*(\d+)\s*\(no\s*more\s*than\s*\1\s*paragraphs?\)',
-                # 영어 숫자 패턴들
-                r'no\s*more\s*than\s*(one|two|three|four|five|six|seven|eight|nine|ten)\s*paragraphs?',
-                r'maximum\s*of\s*(one|two|three|four|five|six|seven|eight|nine|ten)\s*paragraphs?',
-                r'not\s*more\s*than\s*(one|two|three|four|five|six|seven|eight|nine|ten)\s*paragraphs?',
-                r'a\s*maximum\s*of\s*(one|two|three|four|five|six|seven|eight|nine|ten)\s*paragraphs?',
-                r'up\s*to\s*(one|two|three|four|five|six|seven|eight|nine|ten)\s*paragraphs?'
-            ])
-            
-            # 범위 패턴들 (개별적으로 처리)
-            range_patterns = [
-                # 영어 숫자 패턴들 (우선순위 높음)
-                r'between\s*(one|two|three|four|five|six|seven|eight|nine|ten)\s*and\s*(one|two|three|four|five|six|seven|eight|nine|ten)\s*paragraphs?',
-                r'between\s*(one|two|three|four|five|six|seven|eight|nine|ten)\s*and\s*(one|two|three|four|five|six|seven|eight|nine|ten)',
-                r'(one|two|three|four|five|six|seven|eight|nine|ten)\s*to\s*(one|two|three|four|five|six|seven|eight|nine|ten)\s*paragraphs?',
-                r'(one|two|three|four|five|six|seven|eight|nine|ten)\s*to\s*(one|two|three|four|five|six|seven|eight|nine|ten)',
-                r'from\s*(one|two|three|four|five|six|seven|eight|nine|ten)\s*to\s*(one|two|three|four|five|six|seven|eight|nine|ten)\s*paragraphs?',
-                r'from\s*(one|two|three|four|five|six|seven|eight|nine|ten)\s*to\s*(one|two|three|four|five|six|seven|eight|nine|ten)',
-                r'in\s*the\s*range\s*of\s*(one|two|three|four|five|six|seven|eight|nine|ten)\s*to\s*(one|two|three|four|five|six|seven|eight|nine|ten)\s*paragraphs?',
-                r'in\s*the\s*range\s*of\s*(one|two|three|four|five|six|seven|eight|nine|ten)\s*to\s*(one|two|three|four|five|six|seven|eight|nine|ten)',
-                r'anywhere\s*from\s*(one|two|three|four|five|six|seven|eight|nine|ten)\s*to\s*(one|two|three|four|five|six|seven|eight|nine|ten)\s*paragraphs?',
-                r'anywhere\s*from\s*(one|two|three|four|five|six|seven|eight|nine|ten)\s*to\s*(one|two|three|four|five|six|seven|eight|nine|ten)',
-                # 숫자 패턴들
-                r'(\d+)\s*~?\s*(\d+)', r'(\d+)\s*-\s*(\d+)', r'(\d+)\s*에서\s*(\d+)',
-                r'between\s*(\d+)\s*and\s*(\d+)', r'(\d+)\s*to\s*(\d+)',
-                r'(\d+)\s*개\s*~?\s*(\d+)\s*개', r'(\d+)\s*개\s*-\s*(\d+)\s*개',
-                r'from\s*(\d+)\s*to\s*(\d+)', r'(\d+)\s*–\s*(\d+)', r'(\d+)\s*사이',
-                r'(\d+)\s*개\s*사이', r'(\d+)\s*개\s*에서\s*(\d+)\s*개', r'(\d+)\s*개\s*범위',
-                r'in\s*the\s*range\s*of\s*(\d+)\s*to\s*(\d+)', r'anywhere\s*from\s*(\d+)\s*to\s*(\d+)',
-                r'(\d+)\s*to\s*(\d+)\s*paragraphs?', r'(\d+)\s*–\s*(\d+)\s*paragraphs?',
-                r'from\s*(\d+)\s*to\s*(\d+)\s*paragraphs?', r'(\d+)\s*to\s*(\d+)\s*개의?\s*문단',
-                r'(\d+)\s*–\s*(\d+)\s*개의?\s*문단', r'(\d+)\s*to\s*(\d+)\s*개의?\s*문단'
-            ]
-            
-            # 정확한 개수 패턴 (범위 표현이 아닌 정확한 개수만)
-            exact_pattern = '|'.join([
-                r'총\s*(\d+)\s*개', r'정확히\s*(\d+)\s*개', r'정확히\s*(\d+)\s*개의',
-                r'(\d+)\s*개로\s*작성', r'(\d+)\s*개로\s*제한', r'(\d+)\s*개로\s*구성',
-                r'(\d+)\s*개\s*문단', r'(\d+)\s*개\s*단락',
-                r'exactly\s*(\d+)', r'precisely\s*(\d+)', r'exactly\s*(\d+)\s*paragraphs?',
-                r'precisely\s*(\d+)\s*paragraphs?', r'(\d+)\s*paragraphs?\s*exactly',
-                r'(\d+)\s*개\s*\(exactly\s*\1\s*paragraphs?\)', r'정확히\s*(\d+)\s*\(exactly\s*\1\s*paragraphs?\)',
-                r'(\d+)\s*paragraphs?로\s*구성되어야\s*합니다', r'(\d+)\s*paragraphs?로\s*작성되어야\s*합니다',
-                # 영어 숫자 정확한 개수 패턴들
-                r'exactly\s*(one|two|three|four|five|six|seven|eight|nine|ten)\s*paragraphs?',
-                r'precisely\s*(one|two|three|four|five|six|seven|eight|nine|ten)\s*paragraphs?',
-                r'(one|two|three|four|five|six|seven|eight|nine|ten)\s*paragraphs?\s*exactly',
-                r'(one|two|three|four|five|six|seven|eight|nine|ten)\s*paragraphs?\s*precisely'
-            ])
-            
-            # 정확한 개수 찾기 (우선순위 높음 - 정확한 개수가 있으면 기존 값을 덮어씀)
-            m_exact = re.search(exact_pattern, text, re.I)
-            if m_exact:
-                exact_val = safe_extract_number(m_exact)
-                if exact_val is not None:
-                    c["at least"] = exact_val
-                    c["but no more than"] = exact_val
-            else:
-                # 정확한 개수가 없을 때만 범위와 최소/최대값 찾기
-                
-                # 범위 찾기 (개별 패턴으로 처리)
-                for pattern in range_patterns:
-                    m_range = re.search(pattern, text, re.I)
-                    if m_range:
-                        groups = m_range.groups()
-                        if len(groups) >= 2:
-                            # 첫 번째 그룹을 최소값으로, 두 번째 그룹을 최대값으로 처리
-                            min_val = None
-                            max_val = None
-                            
-                            if groups[0] is not None:
-                                if groups[0].isdigit():
-                                    min_val = safe_extract_number(re.match(r'(\d+)', groups[0]))
-                                else:
-                                    min_val = word_to_number(groups[0])
-                            
-                            if groups[1] is not None:
-                                if groups[1].isdigit():
-                                    max_val = safe_extract_number(re.match(r'(\d+)', groups[1]))
-                                else:
-                                    max_val = word_to_number(groups[1])
-                            
-                            if min_val is not None and max_val is not None:
-                                # 최소값과 최대값이 올바른 순서인지 확인
-                                if min_val <= max_val:
-                                    c["at least"] = min_val
-                                    c["but no more than"] = max_val
-                                else:
-                                    # 순서가 바뀐 경우 교환
-                                    c["at least"] = max_val
-                                    c["but no more than"] = min_val
-                            break  # 첫 번째 매칭된 패턴만 사용
-                
-                # 범위가 설정되지 않았을 때만 개별 최소/최대값 찾기
-                if "at least" not in c:
-                    m_min = re.search(min_pattern, text, re.I)
-                    if m_min:
-                        min_val = safe_extract_number(m_min)
-                        if min_val is not None:
-                            c["at least"] = min_val
-                
-                if "but no more than" not in c:
-                    m_max = re.search(max_pattern, text, re.I)
-                    if m_max:
-                        max_val = safe_extract_number(m_max)
-                        if max_val is not None:
-                            c["but no more than"] = max_val
-        
-        return c
\ No newline at end of file
+        return paragraph_counts(text)
@@ -1,7 +1,8 @@
 import re
+from ..patterns import PATTERNS
 from .base import ConstraintExtractor
 from ..constants_types import SUPPORTED_STATES
-from ..mappings import KOR_TO_ENG_VALUE
+from ..mappings import KOR_TO_ENG_VALUE, STATE_ALIASES
 
 class StateExtractor(ConstraintExtractor):
     type_name = "state"
@@ -27,12 +28,12 @@ class StateExtractor(ConstraintExtractor):
         raw_candidates: list[str] = []
 
         for pat in patterns:
-            m = re.search(pat, t, flags=re.IGNORECASE)
+            m = PATTERNS.search(pat, t, flags=re.IGNORECASE)
             if m:
                 raw_list = m.group(1)
                 # 콤마, 슬래시, 파이프, 한글 쉼표, and/or/및/또는/그리고/와/과/하고/이랑/랑 로 분리
                 # \b를 사용해서 단어 경계에서만 매칭되도록 함
-                parts = re.split(
+                parts = PATTERNS.split(
                     r'\s*(?:,|，|、|/|\|)\s*|'
                     r'\s+(?:\band\b|\bor\b|및|또는|그리고|와|과|하고|이랑|랑)\s+',
                     raw_list,
@@ -42,13 +43,11 @@ class StateExtractor(ConstraintExtractor):
                 break  # 첫 번째 매칭만 사용
 
         # 패턴에서 못 찾으면 SUPPORTED_STATES나 별칭 스캔
+        # (지역명·지역 별칭 전체를 미리 컴파일한 alternation 하나로 한 번에 찾고, 후보 순서는 지역명 → 별칭)
         if not raw_candidates:
-            for st in SUPPORTED_STATES:
-                if re.search(r'(?<!\w)' + re.escape(st) + r'(?!\w)', t, flags=re.IGNORECASE):
-                    raw_candidates.append(st)
-            for alias, eng in KOR_TO_ENG_VALUE.items():
-                if re.search(r'(?<!\w)' + re.escape(alias) + r'(?!\w)', t, flags=re.IGNORECASE):
-                    raw_candidates.append(alias)
+            found = {name for name, _ in STATE_ALIASES.boundary_matcher.find_all(t)}
+            raw_candidates.extend(st for st in STATE_ALIASES.values if st in found)
+            raw_candidates.extend(alias for alias, _ in STATE_ALIASES.alias_items if alias in found)
 
         if not raw_candidates:
             return {}
@@ -56,12 +55,12 @@ class StateExtractor(ConstraintExtractor):
         # 정규화 함수
         def normalize_name(s: str) -> str:
             s = s.strip().strip('\'"“”‘’')
-            s = re.sub(r'\s+', ' ', s)
+            s = PATTERNS.sub(r'\s+', ' ', s)
             mapped = KOR_TO_ENG_VALUE.get(s, s)
             if mapped in SUPPORTED_STATES:
                 return mapped
             # 괄호 제거 버전도 시도
-            no_paren = re.sub(r'\s*\([^)]*\)\s*', '', s).strip()
+            no_paren = PATTERNS.sub(r'\s*\([^)]*\)\s*', '', s).strip()
             mapped2 = KOR_TO_ENG_VALUE.get(no_paren, no_paren)
             if mapped2 in SUPPORTED_STATES:
                 return mapped2
@@ -1,4 +1,5 @@
 import re
+from ..patterns import PATTERNS
 from .base import ConstraintExtractor
 
 class TimeExtractor(ConstraintExtractor):
@@ -6,9 +7,9 @@ class TimeExtractor(ConstraintExtractor):
 
     def extract(self, text: str) -> dict:
         c = {}
-        m_from = re.search(r'(오전|오후)?\s*(\d{1,2})시부터|from (\d{1,2})(am|pm)?', text, re.I)
-        m_to   = re.search(r'부터\s*(오전|오후)?\s*(\d{1,2})시까지|to (\d{1,2})(am|pm)?', text, re.I)
-        m_fmt  = re.search(r'(12시간제|24시간제|12 ?hour|24 ?hour)', text, re.I)
+        m_from = PATTERNS.search(r'(오전|오후)?\s*(\d{1,2})시부터|from (\d{1,2})(am|pm)?', text, re.I)
+        m_to   = PATTERNS.search(r'부터\s*(오전|오후)?\s*(\d{1,2})시까지|to (\d{1,2})(am|pm)?', text, re.I)
+        m_fmt  = PATTERNS.search(r'(12시간제|24시간제|12 ?hour|24 ?hour)', text, re.I)
 
         if m_from:
             if m_from.group(1):
@@ -1,7 +1,12 @@
 import re
+from .patterns import PATTERNS
 from typing import List, Tuple, Optional
 from .mappings import KOR_TO_ENG_FIELD, EN_TO_TYPE_FIELD
 
+# 컴파일된 사전의 키워드 오토마톤 (프로세스당 한 번만 생성)
+_KOR_MATCHER = KOR_TO_ENG_FIELD.matcher()
+_EN_MATCHER = EN_TO_TYPE_FIELD.matcher(lowercase=True)
+
 class FieldDetector:
     """입력 텍스트에서 가장 먼저 등장하는 타입명을 탐지"""
     def detect_first(self, text: str) -> Optional[str]:
@@ -39,7 +44,7 @@ class FieldDetector:
             r'@[a-zA-Z0-9.-]+(?:로|으로)\b',  # @domain로, @domain으로 (한글 조사 형태)
         ]
         for pattern in email_patterns:
-            match = re.search(pattern, text)
+            match = PATTERNS.search(pattern, text)
             if match:
                 return "email_address"
 
@@ -50,42 +55,21 @@ class FieldDetector:
             r'\b(?:pusan\.ac\.kr|knu\.ac\.kr|cau\.ac\.kr|sogang\.ac\.kr|kookmin\.ac\.kr|ajou\.ac\.kr|chosun\.ac\.kr|kmu\.ac\.kr|dankook\.ac\.kr)\b',
         ]
         for pattern in domain_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
+            if PATTERNS.search(pattern, text, re.IGNORECASE):
                 return "email_address"
 
-        # 한글 키워드
-        for kor, eng in KOR_TO_ENG_FIELD.items():
-            idx = text.find(kor)
-            if idx != -1:
-                # 비밀번호 컨텍스트에서 길이 관련 키워드는 제외
-                if has_password_context and eng == "number" and any(length_word in kor for length_word in ["길이", "최소 길이", "최소길이"]):
-                    continue
-                candidates.append((eng, idx, kor))
-
-        # 영문 키워드 (소문자 비교)
-        low = text.lower()
-        for eng_key, eng_value in EN_TO_TYPE_FIELD.items():
-            idx = low.find(eng_key.lower())
-            if idx != -1:
-                # 비밀번호 컨텍스트에서 길이 관련 키워드는 제외
-                if has_password_context and eng_value == "number" and any(length_word in eng_key.lower() for length_word in ["length", "minimum length", "minimum"]):
-                    continue
-                candidates.append((eng_value, idx, eng_key))
+        # 한글 키워드 (원문 기준) / 영문 키워드 (소문자 비교) - 각각 한 번의 스캔으로 후보 수집
+        for eng, idx, kor in _KOR_MATCHER.find_all(text):
+            # 비밀번호 컨텍스트에서 길이 관련 키워드는 제외
+            if has_password_context and eng == "number" and any(length_word in kor for length_word in ["길이", "최소 길이", "최소길이"]):
+                continue
+            candidates.append((eng, idx, kor))
 
-            # 공백 구문 보강
-            if " " in eng_key:
-                words = eng_key.split()
-                parts = text.split()
-                for i in range(len(parts)):
-                    if i + len(words) <= len(parts):
-                        phrase = " ".join(parts[i:i+len(words)]).lower()
-                        if phrase == eng_key.lower():
-                            pidx = low.find(phrase)
-                            if pidx != -1:
-                                # 비밀번호 컨텍스트에서 길이 관련 키워드는 제외
-                                if has_password_context and eng_value == "number" and any(length_word in phrase for length_word in ["length", "minimum length", "minimum"]):
-                                    continue
-                                candidates.append((eng_value, pidx, eng_key))
+        for eng_value, idx, eng_key in _EN_MATCHER.find_all(text.lower()):
+            # 비밀번호 컨텍스트에서 길이 관련 키워드는 제외
+            if has_password_context and eng_value == "number" and any(length_word in eng_key for length_word in ["length", "minimum length", "minimum"]):
+                continue
+            candidates.append((eng_value, idx, eng_key))
 
         if not candidates:
             return None
@@ -1,75 +1,7 @@
 from difflib import get_close_matches
 import re
 
-EN_TO_TYPE_FIELD = {
-    # 개인정보
-    "full name": "full_name", "fullname": "full_name", "name": "full_name",
-    "first name": "first_name", "given name": "first_name",
-    "last name": "last_name", "surname": "last_name",
-    "phone": "phone", "phone number": "phone",
-    # 주소
-    "address": "address", "full address": "address",
-    "street address": "street_address", "road address": "street_address",
-    "city": "city",
-    "state": "state", "province": "state", "region": "state",
-    "country": "country", "nation": "country",
-    "postal code": "postal_code", "zip code": "postal_code",
-    # 회사 및 상업
-    "company name": "company_name", "company": "company_name",
-    "job title": "job_title", "position": "job_title",
-    "department": "department_corporate", "corporate department": "department_corporate",
-    "retail department": "department_retail",
-    "product name": "product_name",
-    "product category": "product_category",
-    "catch phrase": "catch_phrase", "slogan": "catch_phrase",
-    "product description": "product_description",
-    # 기타
-    "language": "language",
-    "color": "color",
-    # 언어 중립적 데이터 타입
-    "username": "username", "user name": "username",
-    "password": "password",
-    "email": "email_address", "email address": "email_address",
-    "domain name": "domain_name",
-    "url": "url", "link": "url", "website": "url",
-    "mac address": "mac_address",
-    "ipv4 address": "ip_v4_address",
-    "ipv6 address": "ip_v6_address",
-    "user agent": "user_agent",
-    "avatar": "avatar", "profile image": "avatar",
-    "profile picture": "avatar", "profile pic": "avatar", "profile photo": "avatar",
-    "profile icon": "avatar", "profile graphic": "avatar", "profile figure": "avatar",
-    "profile character": "avatar", "user icon": "avatar", "user image": "avatar",
-    "user photo": "avatar", "account icon": "avatar", "account image": "avatar",
-    "account picture": "avatar", "character image": "avatar", "character icon": "avatar",
-    "character graphic": "avatar", "profile thumbnail": "avatar", "profile portrait": "avatar",
-    "avatar image": "avatar", "avatar picture": "avatar", "avatar photo": "avatar",
-    "avatar icon": "avatar", "avatar image file": "avatar", "avatar jpg": "avatar",
-    "avatar png": "avatar", "profile avatar": "avatar", "profile picture": "avatar",
-    "profile photo": "avatar", "character avatar": "avatar", "character image": "avatar",
-    "user avatar": "avatar", "user image": "avatar", "account avatar": "avatar",
-    "account image": "avatar",
-    # 앱 및 기기
-    "app name": "app_name",
-    "app version": "app_version",
-    "device model": "device_model",
-    "device brand": "device_brand",
-    "device os": "device_os", "os": "device_os",
-    # 금융
-    "credit card number": "credit_card_number",
-    "credit card type": "credit_card_type",
-    "product price": "product_price",
-    "currency": "currency",
-    "iban": "iban",
-    "swift bic": "swift_bic",
-    # 기타
-    "paragraph": "paragraphs", "paragraphs": "paragraphs",
-    "datetime": "datetime", "date": "datetime",
-    "time": "time",
-    "latitude": "latitude",
-    "longitude": "longitude",
-    "number": "number", "number between 1 and 100": "number",
-}
+from .mappings import ENGLISH_PROCESSOR_FIELD as EN_TO_TYPE_FIELD
 
 def get_field_type_from_eng(keyword):
     if keyword in EN_TO_TYPE_FIELD:
@@ -0,0 +1,132 @@
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from .parse_cache import CachedParser, parse_each
+
+
+class ExecutorBusy(Exception):
+    """대기 중인 작업이 max_queue에 도달해 새 작업을 받을 수 없음 (→ 503)"""
+
+
+# ---------- 워커 프로세스에서 실행되는 함수 (pickle 가능하도록 모듈 최상위) ----------
+def _init_worker() -> None:
+    from .instances import warm_up
+    warm_up()
+
+
+def _ping() -> int:
+    return os.getpid()
+
+
+def _parse_field_constraint(prompt: str) -> Dict:
+    from .instances import get_parser
+    # 캐시는 부모 프로세스에서 처리하므로 워커는 캐시 뒤의 Parser를 바로 호출
+    return get_parser().parser.parse_field_constraint(prompt)
+
+
+def _parse_batch(prompts: List[str]) -> List[Optional[Dict]]:
+    from .instances import get_parser
+    return parse_each(get_parser().parser, prompts)
+
+
+def _process_system_prompt(prompt: str) -> Dict:
+    from .instances import get_prompt_processor
+    return get_prompt_processor().process_system_prompt(prompt)
+
+
+class ParseExecutor:
+    """CPU 바운드 파싱을 프로세스 풀로 넘기는 실행기
+
+    - 각 워커는 시작 시 warm_up()으로 Parser/SystemPromptProcessor를 미리 만든다
+    - 제출 후 끝나지 않은 작업 수가 max_queue에 도달하면 ExecutorBusy를 던진다
+    - in_flight는 풀 작업이 실제로 끝날 때 줄어든다 (요청이 취소돼도 이미 실행 중인 작업은 자리를 차지한다)
+    - 카운터는 이벤트 루프 스레드에서만 바뀌므로 별도 락이 필요 없다 (완료 콜백도 루프로 넘겨 처리)
+    """
+
+    def __init__(self, workers: int, max_queue: int, start_method: str = "spawn"):
+        if workers <= 0 or max_queue <= 0:
+            raise ValueError("workers and max_queue must be positive")
+        self.workers = workers
+        self.max_queue = max_queue
+        self._pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context(start_method),
+            initializer=_init_worker,
+        )
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+
+    @classmethod
+    def from_env(cls) -> Optional["ParseExecutor"]:
+        """PARSE_EXECUTOR=process일 때만 생성 (기본은 요청 스레드에서 바로 파싱)"""
+        if os.getenv("PARSE_EXECUTOR", "inline") != "process":
+            return None
+        workers = int(os.getenv("PARSE_WORKERS", os.cpu_count() or 1))
+        max_queue = int(os.getenv("PARSE_MAX_QUEUE", workers * 16))
+        return cls(workers, max_queue, os.getenv("PARSE_START_METHOD", "spawn"))
+
+    def warm_up(self) -> None:
+        """모든 워커 프로세스를 미리 띄워 첫 요청이 프로세스 생성/초기화를 기다리지 않게 한다"""
+        for f in [self._pool.submit(_ping) for _ in range(self.workers)]:
+            f.result()
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=True, cancel_futures=True)
+
+    async def submit(self, fn: Callable, *args) -> Any:
+        if self.in_flight >= self.max_queue:
+            self.rejected += 1
+            raise ExecutorBusy()
+        loop = asyncio.get_running_loop()
+        job = self._pool.submit(fn, *args)
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        job.add_done_callback(lambda _: self._call_in_loop(loop, self._job_done))
+        return await asyncio.wrap_future(job, loop=loop)
+
+    @staticmethod
+    def _call_in_loop(loop: asyncio.AbstractEventLoop, callback: Callable) -> None:
+        try:
+            loop.call_soon_threadsafe(callback)
+        except RuntimeError:  # 이벤트 루프가 이미 닫힌 종료 시점
+            pass
+
+    def _job_done(self) -> None:
+        self.in_flight -= 1
+        self.completed += 1
+
+    async def parse_field_constraint(self, parser: CachedParser, text: str) -> Dict:
+        # 캐시 적중은 부모에서 바로 반환하고, 미스만 워커로 보낸다 (캐시 규칙은 CachedParser의 것을 그대로)
+        key, found, result = parser.lookup(text)
+        if found:
+            return result
+        return parser.remember(key, await self.submit(_parse_field_constraint, key))
+
+    async def parse_batch(self, parser: CachedParser, prompts: List[str]) -> List[Optional[Dict]]:
+        """배치 중 캐시 미스만 한 작업으로 묶어 워커에 보낸다 (실패한 항목은 None)"""
+        keys, results, misses = parser.lookup_batch(prompts)
+        if not misses:
+            return results
+        parsed = await self.submit(_parse_batch, [keys[i] for i in misses])
+        return parser.remember_batch(keys, results, misses, parsed)
+
+    async def process_system_prompt(self, prompt: str) -> Dict:
+        return await self.submit(_process_system_prompt, prompt)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "mode": "process",
+            "workers": self.workers,
+            "max_queue": self.max_queue,
+            "in_flight": self.in_flight,
+            # 워커가 바로 처리하지 못하고 기다리는 작업 수
+            "queue_depth": max(0, self.in_flight - self.workers),
+            "peak_in_flight": self.peak_in_flight,
+            "completed": self.completed,
+            "rejected": self.rejected,
+        }
@@ -4,8 +4,9 @@ Object-oriented field constraint parser.
 import re
 from typing import Dict, Any, List, Tuple, Optional
 
-from .field_constants import (
-    SUPPORTED_TYPES, CONSTRAINT_TYPES, KOR_TO_ENG_FIELD, EN_TO_TYPE_FIELD
+from .constants_types import SUPPORTED_TYPES, CONSTRAINT_TYPES
+from .mappings import (
+    FIELD_PARSER_KOR_FIELD as KOR_TO_ENG_FIELD, FIELD_PARSER_EN_FIELD as EN_TO_TYPE_FIELD
 )
 from .nullables import NullablePercentExtractor as NullablePercentParser
 # from .constraint_parsers import ConstraintParserFactory
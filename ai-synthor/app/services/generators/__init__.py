@@ -0,0 +1,12 @@
+from .base import ColumnGenerator
+from .engine import generate_columns, normalize_fields
+from .registry import GENERATORS, GeneratorRegistry, build_default_registry
+
+__all__ = [
+    "ColumnGenerator",
+    "GENERATORS",
+    "GeneratorRegistry",
+    "build_default_registry",
+    "generate_columns",
+    "normalize_fields",
+]
@@ -0,0 +1,72 @@
+# 간단 벤치마크: python -m app.services.generators [rows]
+#               python -m app.services.generators password [rows]   (비밀번호 대량 생성 + 일괄 검증)
+#               python -m app.services.generators email [rows]      (이메일 대량 생성, unique 포함)
+import sys
+import time
+
+import numpy as np
+
+from .email import EmailGenerator
+from .engine import generate_columns
+from .password import PasswordGenerator, validate_passwords
+
+
+def bench_passwords(n: int) -> None:
+    rng = np.random.default_rng(0)
+    generator = PasswordGenerator()
+    plans = [
+        {},
+        {"minimum_length": 12, "upper": 2, "lower": 2, "numbers": 2, "symbols": 2},
+        {"minimum_length": 8, "max_length": 16, "upper": 1, "numbers": 1, "symbols": 1},
+    ]
+    for constraints in plans:
+        start = time.perf_counter()
+        values = generator.generate(constraints, n, rng)
+        generated = time.perf_counter() - start
+        ok = validate_passwords(values, constraints)
+        validated = time.perf_counter() - start - generated
+        print(f"{str(constraints):<80} gen {generated:5.2f}s  validate {validated:5.2f}s  "
+              f"valid {int(ok.sum()):,}/{n:,}  e.g. {values[0]!r}")
+
+
+def bench_emails(n: int) -> None:
+    rng = np.random.default_rng(0)
+    generator = EmailGenerator()
+    plans = [
+        {},
+        {"domains": {"gmail.com": 3, "naver.com": 1}, "local_part": "name"},
+        {"unique": True},
+        {"unique": True, "domain": "example.com", "local_part": "name"},
+    ]
+    for constraints in plans:
+        start = time.perf_counter()
+        values = generator.generate(constraints, n, rng)
+        elapsed = time.perf_counter() - start
+        distinct = len(np.unique(values))
+        print(f"{str(constraints):<80} gen {elapsed:5.2f}s  distinct {distinct:,}/{n:,}  e.g. {values[0]!r}")
+
+
+if len(sys.argv) > 1 and sys.argv[1] in ("password", "email"):
+    bench = bench_passwords if sys.argv[1] == "password" else bench_emails
+    bench(int(sys.argv[2]) if len(sys.argv) > 2 else 1_000_000)
+    sys.exit(0)
+
+n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+schema = [
+    {"name": "name", "type": "korean_full_name"},
+    {"name": "email", "type": "email_address", "constraints": {"domains": ["gmail.com", "naver.com"]}},
+    {"name": "password", "type": "password", "constraints": {"minimum_length": 12, "upper": 1, "numbers": 2, "symbols": 1}},
+    {"name": "phone", "type": "phone", "constraints": {"format": "(###) ###-####"}},
+    {"name": "birth_date", "type": "datetime", "constraints": {"from": "1970-01-01", "to": "2005-12-31", "format": "yyyy-mm-dd"}},
+    {"name": "age", "type": "number", "constraints": {"min": 20, "max": 60, "decimals": 0}},
+    {"name": "score", "type": "number", "constraints": {"min": 0, "max": 100, "decimals": 2}},
+    {"name": "card", "type": "credit_card_number", "constraints": {"type": "Visa"}},
+    {"name": "state", "type": "state", "constraints": {"options": ["Seoul", "Tokyo"]}},
+]
+rng = np.random.default_rng(0)
+total = time.perf_counter()
+for field in schema:
+    start = time.perf_counter()
+    col = generate_columns([field], n, rng)[field["name"]]
+    print(f"{field['name']:>10}: {time.perf_counter() - start:6.2f}s  {col.dtype}  e.g. {col[0]!r}")
+print(f"{'total':>10}: {time.perf_counter() - total:6.2f}s for {n:,} rows x {len(schema)} columns")
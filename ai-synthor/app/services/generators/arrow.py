@@ -0,0 +1,166 @@
+"""
+생성된 열 → Arrow RecordBatch → Parquet / Arrow IPC 파일
+
+python -m app.services.generators.arrow fields.json out.parquet --rows 10000000
+
+- 열 버퍼를 Arrow 버퍼로 바로 넘긴다 (숫자는 복사 없이, 문자열은 UTF-8 data + offsets를 벡터 연산으로)
+- nullablePercent 마스크(nulls.py)는 파이썬 None 없이 validity 비트맵으로 표현한다
+- chunk 하나가 Parquet row group 하나가 되도록 파일에 순서대로 쓴다 (메모리에는 chunk 하나만)
+"""
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from .engine import generate_columns, iter_dataset_chunks, normalize_fields
+from .parallel import iter_parallel_chunks
+from .strings import as_codes
+
+_INT32_MAX = 2 ** 31 - 1
+
+
+def _validity_buffer(valid: Optional[np.ndarray]):
+    if valid is None:
+        return None, 0
+    return pa.py_buffer(np.packbits(valid, bitorder="little")), int(len(valid) - np.count_nonzero(valid))
+
+
+def string_array(values: np.ndarray, valid: Optional[np.ndarray] = None) -> pa.Array:
+    """'U' 배열 → Arrow string 배열 (UTF-8 바이트 길이를 코드 포인트 범위로 계산해 offsets를 만든다)"""
+    codes, lengths = as_codes(values.astype(str, copy=False))
+    used = codes[codes != 0]
+    if used.size == 0 or used.max() < 0x80:
+        data = used.astype(np.uint8)
+        byte_lengths = lengths
+    else:
+        per_char = 1 + (codes >= 0x80).astype(np.int64) + (codes >= 0x800) + (codes >= 0x10000)
+        byte_lengths = np.where(codes != 0, per_char, 0).sum(axis=1)
+        data = np.frombuffer(used.tobytes().decode("utf-32-le").encode("utf-8"), dtype=np.uint8)
+    large = data.size > _INT32_MAX
+    offsets = np.zeros(len(values) + 1, dtype=np.int64 if large else np.int32)
+    np.cumsum(byte_lengths, out=offsets[1:])
+    bitmap, null_count = _validity_buffer(valid)
+    return pa.Array.from_buffers(
+        pa.large_string() if large else pa.string(), len(values),
+        [bitmap, pa.py_buffer(offsets), pa.py_buffer(data)], null_count,
+    )
+
+
+def to_arrow(values: np.ndarray, valid: Optional[np.ndarray] = None) -> pa.Array:
+    if values.dtype.kind in "iuf":
+        values = np.ascontiguousarray(values)
+        bitmap, null_count = _validity_buffer(valid)
+        return pa.Array.from_buffers(pa.from_numpy_dtype(values.dtype), len(values), [bitmap, pa.py_buffer(values)], null_count)
+    if values.dtype.kind == "b":
+        return pa.array(values, mask=None if valid is None else ~valid)
+    return string_array(values, valid)
+
+
+def to_record_batch(
+    columns: Dict[str, np.ndarray],
+    fields: List[Dict[str, Any]],
+    masks: Optional[Dict[str, np.ndarray]] = None,
+) -> pa.RecordBatch:
+    """masks: {필드명: null 마스크} (True = null)"""
+    masks = masks or {}
+    arrays = []
+    for f in fields:
+        mask = masks.get(f["name"])
+        arrays.append(to_arrow(columns[f["name"]], None if mask is None else ~mask))
+    return pa.RecordBatch.from_arrays(arrays, names=[f["name"] for f in fields])
+
+
+def write_dataset(
+    fields: Iterable[Any],
+    rows: int,
+    path: str,
+    fmt: str = "parquet",
+    chunk_rows: int = 1_000_000,
+    rng: Optional[np.random.Generator] = None,
+    compression: str = "snappy",
+    null_mode: str = "random",
+    seed: Optional[int] = None,
+    shard: int = 0,
+    shards: int = 1,
+    workers: Optional[int] = None,
+) -> int:
+    """rows개를 chunk_rows개씩 생성해 path에 쓴다 (parquet: chunk마다 row group 하나). 쓴 행 수 반환
+
+    seed와 shard/shards를 주면 전체 rows행 중 해당 샤드 구간만 쓴다.
+    같은 seed·chunk_rows의 샤드 파일들을 순서대로 읽으면 단일 실행 결과와 같다.
+    workers를 주면 (seed 필요) 여러 프로세스가 공유 메모리 버퍼를 채우고 이 프로세스는 쓰기만 한다.
+    """
+    if fmt not in ("parquet", "arrow"):
+        raise ValueError(f"지원하지 않는 형식입니다: {fmt}")
+    fields = normalize_fields(fields)
+    rng = rng if rng is not None else np.random.default_rng()
+    if workers is not None:
+        if seed is None:
+            raise ValueError("병렬 생성에는 seed가 필요합니다.")
+        chunks = iter_parallel_chunks(fields, rows, seed, workers, shard, shards, chunk_rows, null_mode)
+    else:
+        chunks = iter_dataset_chunks(fields, rows, chunk_rows, rng, null_mode, seed, shard, shards)
+    writer = None
+    written = 0
+    try:
+        for columns, masks in chunks:
+            batch = to_record_batch(columns, fields, masks)
+            if writer is None:
+                writer = _open_writer(path, fmt, batch.schema, compression)
+            _write(writer, fmt, batch)
+            written += batch.num_rows
+            # 병렬 모드의 열은 공유 메모리 view이므로 다음 chunk(버퍼 해제) 전에 참조를 버린다
+            del columns, masks, batch
+        if writer is None:
+            # 0행이어도 스키마가 있는 빈 파일을 남긴다
+            batch = to_record_batch(generate_columns(fields, 0, rng), fields)
+            writer = _open_writer(path, fmt, batch.schema, compression)
+    finally:
+        if writer is not None:
+            writer.close()
+    return written
+
+
+def _open_writer(path: str, fmt: str, schema: pa.Schema, compression: str):
+    if fmt == "parquet":
+        return pq.ParquetWriter(path, schema, compression=compression)
+    return pa.ipc.new_file(path, schema)
+
+
+def _write(writer, fmt: str, batch: pa.RecordBatch) -> None:
+    if fmt == "parquet":
+        writer.write_batch(batch, row_group_size=batch.num_rows)
+    else:
+        writer.write_batch(batch)
+
+
+if __name__ == "__main__":
+    import argparse
+    import json
+
+    ap = argparse.ArgumentParser(description="필드 정의(JSON) → Parquet / Arrow 파일")
+    ap.add_argument("spec", help="AutoGenerateResponse JSON 또는 fields 목록 JSON 파일")
+    ap.add_argument("out", help="출력 파일 (.parquet / .arrow)")
+    ap.add_argument("--rows", type=int, required=True)
+    ap.add_argument("--format", choices=["parquet", "arrow"])
+    ap.add_argument("--chunk-rows", type=int, default=1_000_000)
+    ap.add_argument("--compression", default="snappy")
+    ap.add_argument("--null-mode", choices=["random", "exact"], default="random",
+                    help="random: 행마다 nullablePercent%% 확률, exact: 정확히 nullablePercent%% 행")
+    ap.add_argument("--seed", type=int, help="재현 가능한 생성용 전역 시드")
+    ap.add_argument("--shard", type=int, default=0, help="이 프로세스가 맡을 샤드 번호 (--seed 필요)")
+    ap.add_argument("--shards", type=int, default=1, help="전체 샤드 수")
+    ap.add_argument("--workers", type=int, help="공유 메모리 병렬 생성 워커 프로세스 수 (--seed 필요)")
+    args = ap.parse_args()
+
+    with open(args.spec, encoding="utf-8") as fp:
+        spec = json.load(fp)
+    fmt = args.format or ("arrow" if args.out.endswith((".arrow", ".feather")) else "parquet")
+    start = time.perf_counter()
+    n = write_dataset(spec["fields"] if isinstance(spec, dict) else spec, args.rows, args.out, fmt,
+                      args.chunk_rows, compression=args.compression, null_mode=args.null_mode,
+                      seed=args.seed, shard=args.shard, shards=args.shards, workers=args.workers)
+    elapsed = time.perf_counter() - start
+    print(f"{n:,} rows → {args.out} ({fmt}) in {elapsed:.1f}s ({n / max(elapsed, 1e-9):,.0f} rows/s)")
@@ -0,0 +1,55 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, FrozenSet, Optional
+
+import numpy as np
+
+
+class ColumnGenerator(ABC):
+    type_name: str
+    # generate()가 읽는 constraints 키 (이 밖의 키는 engine.normalize_fields가 ValueError로 거절한다)
+    constraint_keys: FrozenSet[str] = frozenset()
+
+    @abstractmethod
+    def generate(self, constraints: Dict, n: int, rng: np.random.Generator) -> np.ndarray:
+        """constraints를 만족하는 값 n개를 1차원 배열(열)로 반환.
+           constraint_keys 밖의 제약은 normalize_fields 단계에서 이미 ValueError로 걸러진다."""
+        ...
+
+    # 병렬 생성(parallel.py)은 공유 메모리에 raw 값을 채우고 쓸 때 render 한다.
+    # 기본은 raw == 최종 값이며, 날짜처럼 숫자로 들고 있다가 형식화하는 타입만 둘을 나눈다.
+    # generate()와 같은 난수를 같은 순서로 써야 render(generate_raw()) == generate() 가 된다.
+    def generate_raw(self, constraints: Dict, n: int, rng: np.random.Generator) -> np.ndarray:
+        return self.generate(constraints, n, rng)
+
+    def render(self, constraints: Dict, raw: np.ndarray) -> np.ndarray:
+        return raw
+
+    # 여러 chunk에 걸쳐 지켜야 하는 제약(email의 unique 등)은 생성 전체가 공유할 상태를 만든다.
+    # None이면 chunk마다 독립이고, 아니면 engine.iter_chunks가 같은 상태를 chunk마다 generate_chunk에 넘긴다.
+    # seed 생성의 블록은 서로 독립이어야 하므로 상태가 필요한 열은 블록 하나 안에서만 허용된다.
+    def chunk_state(self, constraints: Dict, rows: int) -> Optional[Any]:
+        return None
+
+    def generate_chunk(self, constraints: Dict, n: int, rng: np.random.Generator, state: Optional[Any]) -> np.ndarray:
+        return self.generate(constraints, n, rng)
+
+
+class ChoiceGenerator(ColumnGenerator):
+    """값 풀에서 균등하게 뽑는 생성기 (constraints.options가 있으면 그 값들로 제한)"""
+    constraint_keys = frozenset({"options"})
+
+    def __init__(self, type_name: str, pool: np.ndarray):
+        self.type_name = type_name
+        self.pool = pool
+
+    def generate(self, constraints: Dict, n: int, rng: np.random.Generator) -> np.ndarray:
+        options = constraints.get("options")
+        pool = self.pool if not options else np.array(
+            [options] if isinstance(options, str) else list(options), dtype=str
+        )
+        return choice(pool, n, rng)
+
+
+# ---------- 열 단위 헬퍼 ----------
+def choice(pool: np.ndarray, n: int, rng: np.random.Generator) -> np.ndarray:
+    return pool[rng.integers(0, len(pool), n)]
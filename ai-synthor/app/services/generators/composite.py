@@ -0,0 +1,241 @@
+# 여러 값 풀/숫자를 이어 붙여 만드는 타입들 (이름, 주소, 네트워크, 결제 등)
+from typing import Callable, Dict, Iterable
+
+import numpy as np
+
+from . import pools
+from .base import ColumnGenerator, choice
+from .strings import concat, digits, from_codes, int_to_str
+
+_HEX = np.frombuffer(b"0123456789abcdef", dtype=np.uint8)
+_LETTERS = np.array(list("ABCDEFGHIJKLMNOPQRSTUVWXYZ"), dtype=str)
+
+
+class ComposedGenerator(ColumnGenerator):
+    """build(constraints, n, rng) 함수 하나로 정의되는 생성기"""
+
+    def __init__(
+        self,
+        type_name: str,
+        build: Callable[[Dict, int, np.random.Generator], np.ndarray],
+        constraint_keys: Iterable[str] = (),
+    ):
+        self.type_name = type_name
+        self.build = build
+        self.constraint_keys = frozenset(constraint_keys)
+
+    def generate(self, constraints: Dict, n: int, rng: np.random.Generator) -> np.ndarray:
+        return self.build(constraints, n, rng)
+
+
+def hex_strings(n: int, nbytes: int, rng: np.random.Generator, sep: str = "", group: int = 1) -> np.ndarray:
+    """임의 바이트를 16진수로 (group 바이트마다 sep 삽입) — 바이트 행렬에서 한 번에 만든다"""
+    raw = rng.integers(0, 256, (n, nbytes), dtype=np.uint8)
+    nibbles = np.empty((n, nbytes * 2), dtype=np.uint8)
+    nibbles[:, 0::2] = _HEX[raw >> 4]
+    nibbles[:, 1::2] = _HEX[raw & 0x0F]
+    if sep:
+        width = group * 2
+        chunks = [nibbles[:, i:i + width] for i in range(0, nbytes * 2, width)]
+        sep_col = np.full((n, len(sep)), ord(sep), dtype=np.uint8)
+        nibbles = np.hstack([c for chunk in chunks for c in (chunk, sep_col)][:-1])
+    return from_codes(nibbles)
+
+
+# ---------- 이름 ----------
+def _first_names(constraints: Dict, male: np.ndarray, female: np.ndarray, both: np.ndarray) -> np.ndarray:
+    gender = constraints.get("gender")
+    return male if gender == "male" else female if gender == "female" else both
+
+
+def _full_name(c, n, rng):
+    first = _first_names(c, pools.FIRST_NAMES_MALE, pools.FIRST_NAMES_FEMALE, pools.FIRST_NAMES)
+    return concat(choice(first, n, rng), " ", choice(pools.LAST_NAMES, n, rng))
+
+
+def _korean_last_name(c, n, rng):
+    return np.full(n, c["lastName"]) if c.get("lastName") else choice(pools.KOREAN_LAST_NAMES, n, rng)
+
+
+def _korean_first_name(c, n, rng):
+    first = _first_names(c, pools.KOREAN_FIRST_NAMES_MALE, pools.KOREAN_FIRST_NAMES_FEMALE, pools.KOREAN_FIRST_NAMES)
+    return choice(first, n, rng)
+
+
+def _korean_full_name(c, n, rng):
+    return concat(_korean_last_name(c, n, rng), _korean_first_name(c, n, rng))
+
+
+def _first_name(c, n, rng):
+    return choice(_first_names(c, pools.FIRST_NAMES_MALE, pools.FIRST_NAMES_FEMALE, pools.FIRST_NAMES), n, rng)
+
+
+def _username(c, n, rng):
+    return concat(choice(pools.USERNAME_WORDS, n, rng), "_", choice(pools.USERNAME_WORDS, n, rng), digits(n, 2, rng))
+
+
+# ---------- 주소 ----------
+def _street_address(c, n, rng):
+    number = int_to_str(rng.integers(1, 10000, n))
+    return concat(number, " ", choice(pools.STREET_NAMES, n, rng), " ", choice(pools.STREET_SUFFIXES, n, rng))
+
+
+def _korean_street_address(c, n, rng):
+    return concat(choice(pools.KOREAN_ROADS, n, rng), " ", int_to_str(rng.integers(1, 500, n)))
+
+
+def _korean_address(c, n, rng):
+    return concat(choice(pools.KOREAN_STATES, n, rng), " ", _korean_street_address(c, n, rng))
+
+
+def _postal_code(c, n, rng):
+    return digits(n, 5, rng)
+
+
+# ---------- 인터넷 ----------
+def _domain_name(c, n, rng):
+    return concat(choice(pools.DOMAIN_WORDS, n, rng), choice(pools.TLDS, n, rng))
+
+
+def _url(c, n, rng):
+    # protocol/host/path/query string 플래그가 있으면 해당 부분만, 없으면 전체
+    flags = {k for k in ("protocol", "host", "path", "query string") if c.get(k)}
+    flags = flags or {"protocol", "host", "path", "query string"}
+    parts = []
+    if "protocol" in flags:
+        parts.append("https://" if "host" in flags else "https:")
+    if "host" in flags:
+        parts.append(concat("www.", _domain_name(c, n, rng)))
+    if "path" in flags:
+        parts.append(choice(pools.URL_PATHS, n, rng))
+    if "query string" in flags:
+        parts.append(concat("?id=", int_to_str(rng.integers(1, 100000, n))))
+    return concat(*parts)
+
+
+def _ip_v4(c, n, rng):
+    octets = [int_to_str(rng.integers(1, 255, n)) for _ in range(4)]
+    return concat(octets[0], ".", octets[1], ".", octets[2], ".", octets[3])
+
+
+def _avatar(c, n, rng):
+    size = c.get("size") or "50x50"
+    fmt = c.get("format") or "png"
+    return concat("https://robohash.org/", hex_strings(n, 8, rng), f".{fmt}?size={size}&set=set1")
+
+
+def _app_version(c, n, rng):
+    major, minor, patch = (int_to_str(rng.integers(0, hi, n)) for hi in (10, 20, 10))
+    return concat(major, ".", minor, ".", patch)
+
+
+# ---------- 결제 ----------
+# 카드사별 (앞자리 후보, 전체 길이)
+CARD_LAYOUTS = {
+    "Visa": (["4"], 16),
+    "Mastercard": (["51", "52", "53", "54", "55"], 16),
+    "American Express": (["34", "37"], 15),
+    "Amex": (["34", "37"], 15),
+    "JCB": (["3528", "3538", "3548", "3558", "3568", "3589"], 16),
+    "China UnionPay": (["62"], 16),
+    "Maestro": (["5018", "5020", "5038", "6304", "6759"], 16),
+    "Diners Club International": (["36", "38"], 14),
+}
+
+
+def luhn_complete(body: np.ndarray) -> np.ndarray:
+    """(n, k) 숫자 행렬 뒤에 Luhn 체크 숫자를 붙여 (n, k+1) 반환"""
+    doubled = body[:, ::-1].copy()
+    doubled[:, 0::2] *= 2
+    doubled[doubled > 9] -= 9
+    check = (10 - doubled.sum(axis=1) % 10) % 10
+    return np.hstack([body, check[:, None]])
+
+
+def _credit_card_number(c, n, rng):
+    card = c.get("type") or c.get("options") or "Visa"
+    prefixes, length = CARD_LAYOUTS.get(card, CARD_LAYOUTS["Visa"])
+    # 같은 카드사의 앞자리 후보는 길이가 같으므로 (후보 수, 자리 수) 숫자 행렬로 두고 행을 뽑는다
+    prefix_digits = np.array([[int(ch) for ch in p] for p in prefixes], dtype=np.int64)
+    width = prefix_digits.shape[1]
+    body = np.empty((n, length - 1), dtype=np.int64)
+    body[:, :width] = prefix_digits[rng.integers(0, len(prefixes), n)]
+    body[:, width:] = rng.integers(0, 10, (n, length - 1 - width))
+    return from_codes(luhn_complete(body) + ord("0"))
+
+
+def _credit_card_type(c, n, rng):
+    card = c.get("options")
+    return np.full(n, card) if card else choice(pools.CARD_TYPES, n, rng)
+
+
+def _iban(c, n, rng):
+    # 형식(국가 코드 + 검증 숫자 2자리 + 계좌 18자리)만 맞춘 값
+    return concat(choice(pools.IBAN_COUNTRIES, n, rng), digits(n, 2, rng), digits(n, 9, rng), digits(n, 9, rng))
+
+
+def _swift_bic(c, n, rng):
+    return concat(
+        choice(pools.SWIFT_BANKS, n, rng), choice(pools.SWIFT_COUNTRIES, n, rng),
+        choice(_LETTERS, n, rng), choice(_LETTERS, n, rng),
+    )
+
+
+# ---------- 문단 ----------
+def _paragraphs(c, n, rng):
+    lo = int(c.get("at least") or 1)
+    hi = max(int(c.get("but no more than") or lo), lo)
+    counts = rng.integers(lo, hi, n, endpoint=True)
+    out = np.empty(n, dtype=object)
+    # 같은 문단 수끼리 묶어 한 번에 조립 (문단당 3문장, 문단 사이는 빈 줄)
+    for k in np.unique(counts):
+        idx = np.flatnonzero(counts == k)
+        parts = []
+        for p in range(k * 3):
+            if p:
+                parts.append("\n\n" if p % 3 == 0 else " ")
+            parts.append(choice(pools.LOREM_SENTENCES, len(idx), rng))
+        out[idx] = concat(*parts)
+    return out.astype(str)
+
+
+COMPOSED = {
+    "full_name": _full_name,
+    "first_name": _first_name,
+    "korean_full_name": _korean_full_name,
+    "korean_first_name": _korean_first_name,
+    "korean_last_name": _korean_last_name,
+    "username": _username,
+    "address": _street_address,
+    "street_address": _street_address,
+    "korean_address": _korean_address,
+    "korean_street_address": _korean_street_address,
+    "postal_code": _postal_code,
+    "korean_postal_code": _postal_code,
+    "domain_name": _domain_name,
+    "url": _url,
+    "mac_address": lambda c, n, rng: hex_strings(n, 6, rng, ":"),
+    "ip_v4_address": _ip_v4,
+    "ip_v6_address": lambda c, n, rng: hex_strings(n, 16, rng, ":", group=2),
+    "avatar": _avatar,
+    "app_version": _app_version,
+    "credit_card_number": _credit_card_number,
+    "credit_card_type": _credit_card_type,
+    "iban": _iban,
+    "swift_bic": _swift_bic,
+    "paragraphs": _paragraphs,
+}
+
+# 타입별로 build 함수가 읽는 constraints 키 (없는 타입은 제약을 받지 않는다)
+COMPOSED_KEYS = {
+    "full_name": ("gender",),
+    "first_name": ("gender",),
+    "korean_full_name": ("gender", "lastName"),
+    "korean_first_name": ("gender",),
+    "korean_last_name": ("lastName",),
+    "url": ("protocol", "host", "path", "query string"),
+    "avatar": ("size", "format"),
+    "credit_card_number": ("type", "options"),
+    "credit_card_type": ("options",),
+    "paragraphs": ("at least", "but no more than"),
+}
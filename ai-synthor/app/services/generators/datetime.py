@@ -0,0 +1,199 @@
+import re
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .base import ColumnGenerator
+from .strings import concat, int_to_str
+
+# DatetimeExtractor가 from/to 없이 format만 주는 경우의 기본 범위
+DEFAULT_FROM = "2000-01-01"
+DEFAULT_TO = "2024-12-31"
+DEFAULT_FORMAT = "m/d/yyyy"
+
+# 날짜 토큰과 그 사이 문자열. 남는 y/m/d(예: 'yyy')나 시각 표기(hh, ss)는 조용히 버리지 않고 오류로 낸다
+_FORMAT_TOKEN_RE = re.compile(r"yyyy|yy|mm|m|dd|d|[^ymdhs]+")
+_DATE_TOKENS = ("yyyy", "yy", "mm", "m", "dd", "d")
+
+# DatetimeExtractor._normalize_date_format 이 받아 주는 날짜 표기 (from/to가 yyyy-mm-dd가 아닐 때)
+_YMD_RE = re.compile(r"(\d{4})(?:[-./](\d{1,2})(?:[-./](\d{1,2}))?)?")
+_MDY_RE = re.compile(r"(\d{1,2})[-./](\d{1,2})[-./](\d{4})")
+
+# 범위 안 모든 날짜(시각)의 형식 문자열 표를 만들어 두고 인덱싱으로 꺼낸다 (행마다 자릿수 계산을 하지 않음)
+# 표가 너무 커지는 넓은 범위나 범위보다 행이 적은 요청은 행 단위 벡터 연산(format_days)으로 처리한다
+_TABLE_MAX_DAYS = 1 << 16  # 약 180년
+# 범위·형식은 요청마다 달라지므로 표 캐시는 개수가 아니라 전체 바이트로 묶는다
+_TABLE_CACHE_BYTES = 32 << 20
+
+
+def _tokenize_format(fmt: str) -> List[str]:
+    tokens = _FORMAT_TOKEN_RE.findall(fmt)
+    if "".join(tokens) != fmt or not any(t in _DATE_TOKENS for t in tokens):
+        raise ValueError(f"지원하지 않는 날짜 형식입니다: {fmt}")
+    return tokens
+
+
+def format_days(days: np.ndarray, fmt: str) -> np.ndarray:
+    """datetime64[D] 배열을 m/d/yyyy, yyyy-mm-dd, yy.mm.dd 같은 형식 문자열로 변환"""
+    months = days.astype("datetime64[M]")
+    parts = {
+        "yyyy": lambda: int_to_str(days.astype("datetime64[Y]").astype(np.int64) + 1970, 4),
+        "yy": lambda: int_to_str((days.astype("datetime64[Y]").astype(np.int64) + 1970) % 100, 2),
+        "m": lambda: int_to_str(months.astype(np.int64) % 12 + 1),
+        "mm": lambda: int_to_str(months.astype(np.int64) % 12 + 1, 2),
+        "d": lambda: int_to_str((days - months).astype(np.int64) + 1),
+        "dd": lambda: int_to_str((days - months).astype(np.int64) + 1, 2),
+    }
+    return concat(*(parts[t]() if t in parts else t for t in _tokenize_format(fmt)))
+
+
+class DayTableCache:
+    """(lo, hi, 형식) → 형식 문자열 표. 표 크기 합이 max_bytes를 넘으면 가장 오래 쓰지 않은 표부터 버린다"""
+
+    def __init__(self, max_bytes: int = _TABLE_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._tables: "OrderedDict[Tuple[int, int, str], np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._tables)
+
+    def get(self, lo: int, hi: int, fmt: str) -> Optional[np.ndarray]:
+        with self._lock:
+            table = self._tables.get((lo, hi, fmt))
+            if table is not None:
+                self._tables.move_to_end((lo, hi, fmt))
+            return table
+
+    def put(self, lo: int, hi: int, fmt: str, table: np.ndarray) -> None:
+        if table.nbytes > self.max_bytes:
+            return
+        with self._lock:
+            if (lo, hi, fmt) in self._tables:
+                return
+            self._tables[(lo, hi, fmt)] = table
+            self.nbytes += table.nbytes
+            while self.nbytes > self.max_bytes:
+                _, old = self._tables.popitem(last=False)
+                self.nbytes -= old.nbytes
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tables.clear()
+            self.nbytes = 0
+
+
+DAY_TABLES = DayTableCache()
+
+
+def _day_table(lo: int, hi: int, fmt: str, n: int) -> Optional[np.ndarray]:
+    """일수 lo..hi 의 형식 문자열 표 (같은 제약으로 chunk를 반복 생성해도 한 번만 만든다)
+
+    캐시에 없으면 표가 n행 이하일 때만 만든다 (1행 검증 생성에 수만 행짜리 표를 만들지 않도록).
+    """
+    table = DAY_TABLES.get(lo, hi, fmt)
+    if table is None and hi - lo + 1 <= min(n, _TABLE_MAX_DAYS):
+        table = format_days(np.arange(lo, hi + 1).astype("datetime64[D]"), fmt)
+        table.setflags(write=False)
+        DAY_TABLES.put(lo, hi, fmt, table)
+    return table
+
+
+def render_days(days: np.ndarray, fmt: str, lo: int, hi: int) -> np.ndarray:
+    """[lo, hi] 범위의 int64 일수 배열 → 형식 문자열 배열"""
+    table = _day_table(lo, hi, fmt, len(days))
+    if table is not None:
+        return table[days - lo]
+    return format_days(days.astype("datetime64[D]"), fmt)
+
+
+def parse_date(value: str, unit: str = "D") -> int:
+    """'2023-01-05', '2023/1/5', '1/5/2023', '2023-01', '2023' → 1970-01-01 기준 일(unit='M'이면 월) 수"""
+    value = str(value).strip()
+    m = _YMD_RE.fullmatch(value)
+    if m:
+        year, month, day = int(m.group(1)), int(m.group(2) or 1), int(m.group(3) or 1)
+    else:
+        m = _MDY_RE.fullmatch(value)
+        if not m:
+            raise ValueError(f"지원하지 않는 날짜 값입니다: {value}")
+        month, day, year = int(m.group(1)), int(m.group(2)), int(m.group(3))
+    return int(np.datetime64(f"{year:04d}-{month:02d}-{day:02d}", unit).astype(np.int64))
+
+
+class DatetimeGenerator(ColumnGenerator):
+    """datetime: {"from", "to", "format", "granularity"} (from/to는 yyyy-mm-dd 또는 yyyy-mm)"""
+    type_name = "datetime"
+    constraint_keys = frozenset({"from", "to", "format", "granularity"})
+
+    def generate(self, constraints: Dict, n: int, rng: np.random.Generator) -> np.ndarray:
+        return self.render(constraints, self.generate_raw(constraints, n, rng))
+
+    @staticmethod
+    def _range(constraints: Dict) -> Tuple[str, int, int]:
+        """(단위, lo, hi) — 단위 'M'이면 월 수, 'D'면 일 수"""
+        unit = "M" if constraints.get("granularity") == "month" else "D"
+        lo = parse_date(constraints.get("from") or DEFAULT_FROM, unit)
+        hi = parse_date(constraints.get("to") or DEFAULT_TO, unit)
+        return (unit, lo, hi) if lo <= hi else (unit, hi, lo)
+
+    def generate_raw(self, constraints: Dict, n: int, rng: np.random.Generator) -> np.ndarray:
+        """1970-01-01 기준 일수 (int64)"""
+        _tokenize_format(constraints.get("format") or DEFAULT_FORMAT)  # 형식 오류는 생성 전에
+        unit, lo, hi = self._range(constraints)
+        values = rng.integers(lo, hi, n, endpoint=True)
+        if unit == "M":
+            values = values.astype("datetime64[M]").astype("datetime64[D]").astype(np.int64)
+        return values
+
+    def render(self, constraints: Dict, raw: np.ndarray) -> np.ndarray:
+        unit, lo, hi = self._range(constraints)
+        if unit == "M":
+            lo = int(np.datetime64(lo, "M").astype("datetime64[D]").astype(np.int64))
+            hi = int(np.datetime64(hi, "M").astype("datetime64[D]").astype(np.int64))
+        return render_days(raw, constraints.get("format") or DEFAULT_FORMAT, lo, hi)
+
+
+# '9am', '5pm', '오전9', '오후6', '9' → 시(0~24)
+_HOUR_RE = re.compile(r"(오전|오후)?\s*(\d{1,2})\s*(am|pm)?", re.I)
+
+
+def _parse_hour(value: str) -> int:
+    m = _HOUR_RE.fullmatch(value.strip())
+    if not m:
+        raise ValueError(f"지원하지 않는 시간 값입니다: {value}")
+    hour = int(m.group(2)) % 12 if (m.group(1) or m.group(3)) else int(m.group(2))
+    if m.group(1) == "오후" or (m.group(3) or "").lower() == "pm":
+        hour += 12
+    return min(hour, 24)
+
+
+class TimeGenerator(ColumnGenerator):
+    """time: {"from", "to", "format"} → 'HH:MM' (24시간제) 또는 'h:MM AM' (12시간제)"""
+    type_name = "time"
+    constraint_keys = frozenset({"from", "to", "format"})
+
+    def generate(self, constraints: Dict, n: int, rng: np.random.Generator) -> np.ndarray:
+        lo = _parse_hour(constraints["from"]) * 60 if constraints.get("from") else 0
+        hi = _parse_hour(constraints["to"]) * 60 if constraints.get("to") else 24 * 60 - 1
+        lo, hi = sorted((min(lo, 24 * 60 - 1), min(hi, 24 * 60 - 1)))
+        minutes = rng.integers(lo, hi, n, endpoint=True)
+        return _time_table("12" in str(constraints.get("format", "")))[minutes]
+
+
+@lru_cache(maxsize=2)
+def _time_table(twelve_hour: bool) -> np.ndarray:
+    """하루 1440분 각각의 시각 문자열 표"""
+    hours, mins = np.divmod(np.arange(24 * 60), 60)
+    mm = int_to_str(mins, 2)
+    if twelve_hour:
+        suffix = np.where(hours < 12, " AM", " PM")
+        table = concat(int_to_str((hours + 11) % 12 + 1), ":", mm, suffix)
+    else:
+        table = concat(int_to_str(hours, 2), ":", mm)
+    table.setflags(write=False)
+    return table
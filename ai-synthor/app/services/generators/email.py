@@ -0,0 +1,142 @@
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from . import pools
+from .base import ColumnGenerator, choice
+from .strings import FingerprintSet, concat, digits, duplicate_rows, fingerprints
+
+# 로컬 파트 형식: username = 단어 두 개 + 숫자 (skyfox042), name = 이름.성 + 숫자 (james.smith07)
+LOCAL_STYLES = ("username", "name")
+_DEFAULT_DIGITS = {"username": 3, "name": 2}
+_FIRST_NAMES = np.char.lower(pools.FIRST_NAMES)
+_LAST_NAMES = np.char.lower(pools.LAST_NAMES)
+_SEPARATORS = np.array([".", "_", ""], dtype=str)
+
+# unique일 때 중복 행만 다시 뽑는 최대 횟수
+_MAX_ROUNDS = 32
+
+
+def email_domains(constraints: Dict) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """constraints → (도메인 배열, 도메인별 확률 또는 None(균등))
+
+    - "domains": 목록 또는 {도메인: 가중치}, "domain": 문자열 또는 목록 (EmailExtractor는 여러 도메인을 목록으로 준다)
+    - "weights": domains와 같은 길이의 가중치 목록
+    """
+    domains = constraints.get("domains") or constraints.get("domain")
+    if not domains:
+        return pools.EMAIL_DOMAINS, None
+    weights = constraints.get("weights")
+    if isinstance(domains, str):
+        domains = [domains]
+    elif isinstance(domains, dict):
+        domains, weights = list(domains), list(domains.values())
+    names = np.array([str(d).strip().lstrip("@").lower() for d in domains], dtype=str)
+    if weights is None:
+        return names, None
+    p = np.asarray(weights, dtype=float)
+    if p.shape != (len(names),) or (p < 0).any() or not p.sum() > 0:
+        raise ValueError(f"weights는 domains와 같은 길이의 0 이상 값이어야 합니다: {weights}")
+    return names, p / p.sum()
+
+
+def _pick_domains(domains: np.ndarray, p: Optional[np.ndarray], n: int, rng: np.random.Generator) -> np.ndarray:
+    if p is None:
+        return choice(domains, n, rng)
+    idx = np.searchsorted(np.cumsum(p), rng.random(n), side="right")
+    return domains[np.minimum(idx, len(domains) - 1)]
+
+
+def _fill_unique(values: np.ndarray, draw, seen: FingerprintSet) -> np.ndarray:
+    """values에서 이미 나온 주소(seen 또는 같은 배열 안의 앞 행)와 겹치는 행만 draw(k)로 다시 뽑아 채운다
+
+    받아들인 주소의 지문은 seen(정렬 배열 집합)에 더하고, 다시 뽑은 행은 searchsorted로 집합과 대조한다.
+    라운드 비용은 다시 뽑은 행 수에 비례하고, seen을 chunk 사이에 유지하면 생성 전체에서 고유하다.
+    """
+    hashes = fingerprints(values)
+    fresh = ~seen.contains(hashes)
+    fresh[duplicate_rows(hashes)] = False
+    seen.add(hashes[fresh])
+    pending = np.flatnonzero(~fresh)
+    for _ in range(_MAX_ROUNDS):
+        if not len(pending):
+            return values
+        redo = draw(len(pending))
+        h = fingerprints(redo)
+        fresh = ~seen.contains(h)
+        fresh[duplicate_rows(h)] = False
+        if redo.dtype.itemsize > values.dtype.itemsize:
+            values = values.astype(redo.dtype)
+        values[pending[fresh]] = redo[fresh]
+        seen.add(h[fresh])
+        pending = pending[~fresh]
+    raise ValueError(f"고유한 이메일 {len(values):,}개를 만들지 못했습니다.")
+
+
+class UniqueEmails:
+    """unique 생성 상태: 숫자 꼬리 폭(전체 행 수 기준)과 지금까지 낸 주소의 지문 집합"""
+
+    def __init__(self, width: int):
+        self.width = width
+        self.seen = FingerprintSet()
+
+
+def _local_combinations(style: str) -> int:
+    """숫자 꼬리를 뺀 로컬 파트 조합 수"""
+    if style == "name":
+        return len(_FIRST_NAMES) * len(_SEPARATORS) * len(_LAST_NAMES)
+    return len(pools.USERNAME_WORDS) ** 2
+
+
+def _local_parts(style: str, width: int, n: int, rng: np.random.Generator) -> np.ndarray:
+    if style == "name":
+        return concat(choice(_FIRST_NAMES, n, rng), choice(_SEPARATORS, n, rng), choice(_LAST_NAMES, n, rng),
+                      digits(n, width, rng))
+    return concat(choice(pools.USERNAME_WORDS, n, rng), choice(pools.USERNAME_WORDS, n, rng), digits(n, width, rng))
+
+
+class EmailGenerator(ColumnGenerator):
+    """email_address: {"domain"} 또는 {"domains": [...] / {도메인: 가중치}, "weights"}, {"local_part", "unique"}
+
+    - 로컬 파트는 username(단어 풀) 또는 name(영문 이름/성 풀)에서 열 단위로 뽑고, 도메인은 균등 또는 가중치로 배정
+    - 도메인이 없으면 흔한 메일 도메인에서 뽑는다
+    - unique=True면 행별 64비트 지문(fingerprints)을 정렬 집합과 대조해 겹치는 행만 다시 뽑는다.
+      같은 주소는 지문도 같으므로 중복을 놓치지 않는다 (지문 충돌은 불필요한 재추출일 뿐).
+      조합 수가 전체 행 수의 2배가 될 때까지 숫자 꼬리를 늘리며, 지문 집합은 chunk_state로 chunk 사이에 유지된다.
+    """
+    type_name = "email_address"
+    constraint_keys = frozenset({"domain", "domains", "weights", "local_part", "unique"})
+
+    @staticmethod
+    def _style(constraints: Dict) -> str:
+        style = constraints.get("local_part") or "username"
+        if style not in LOCAL_STYLES:
+            raise ValueError(f"지원하지 않는 local_part 형식입니다: {style}")
+        return style
+
+    def chunk_state(self, constraints: Dict, rows: int) -> Optional[UniqueEmails]:
+        if not constraints.get("unique"):
+            return None
+        domains, p = email_domains(constraints)
+        style = self._style(constraints)
+        width = _DEFAULT_DIGITS[style]
+        used_domains = len(set(domains if p is None else domains[p > 0]))
+        while _local_combinations(style) * 10 ** width * used_domains < 2 * rows:
+            width += 1
+        return UniqueEmails(width)
+
+    def generate(self, constraints: Dict, n: int, rng: np.random.Generator) -> np.ndarray:
+        return self.generate_chunk(constraints, n, rng, self.chunk_state(constraints, n))
+
+    def generate_chunk(
+        self, constraints: Dict, n: int, rng: np.random.Generator, state: Optional[UniqueEmails],
+    ) -> np.ndarray:
+        domains, p = email_domains(constraints)
+        style = self._style(constraints)
+        width = _DEFAULT_DIGITS[style] if state is None else state.width
+
+        def draw(k: int) -> np.ndarray:
+            return concat(_local_parts(style, width, k, rng), "@", _pick_domains(domains, p, k, rng))
+
+        values = draw(n)
+        return values if state is None else _fill_unique(values, draw, state.seen)
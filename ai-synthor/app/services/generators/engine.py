@@ -0,0 +1,229 @@
+"""
+필드 스펙(AutoGenerateResponse.fields) + 행 수 → 열 단위 합성 데이터
+
+fields의 각 항목은 {"name", "type", "constraints", "nullablePercent"} 형태의 dict
+(또는 같은 속성을 가진 pydantic 모델)이고, 결과는 {필드명: numpy 배열} 이다.
+AutoGenerateResponse.count는 필드 수이므로 행 수는 따로 받는다.
+"""
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from .nulls import NULL_MODES, null_mask, null_masks
+from .registry import GENERATORS, GeneratorRegistry
+
+# 파서 출력의 다른 이름 → 생성기 키
+# (auto-generate는 min/max를 minimum/maximum으로, "서울만" 같은 단일 값은 {"value": ...}로 준다)
+CONSTRAINT_ALIASES = {"minimum": "min", "maximum": "max", "value": "options"}
+# 전역 보조 제약(qualifiers.py)은 타입과 관계없이 붙으므로 쓰지 않는 생성기에서는 무시한다
+QUALIFIER_KEYS = frozenset({"gender", "lang"})
+
+
+def normalize_constraints(name: str, constraints: Dict[str, Any], keys: FrozenSet[str]) -> Dict[str, Any]:
+    """별칭 키를 생성기 키로 바꾸고, 생성기가 모르는 키가 있으면 ValueError"""
+    out = dict(constraints)
+    for alias, key in CONSTRAINT_ALIASES.items():
+        if alias in out and key in keys:
+            value = out.pop(alias)
+            if key in out and out[key] != value:
+                raise ValueError(f"{name}: 제약 {alias}와 {key}의 값이 다릅니다.")
+            out[key] = value
+    unknown = sorted(set(out) - keys - QUALIFIER_KEYS)
+    if unknown:
+        raise ValueError(f"{name}: 지원하지 않는 제약입니다: {', '.join(unknown)}")
+    return out
+
+
+def normalize_fields(fields: Iterable[Any], registry: GeneratorRegistry = GENERATORS) -> List[Dict[str, Any]]:
+    """dict/pydantic 필드 정의를 dict로 맞추고 이름 중복·미지원 타입·미지원 제약을 검사"""
+    normalized: List[Dict[str, Any]] = []
+    seen = set()
+    for f in fields:
+        if hasattr(f, "model_dump"):
+            f = f.model_dump()
+        name, type_name = f.get("name"), f.get("type")
+        if not name:
+            raise ValueError("필드 이름이 없습니다.")
+        if name in seen:
+            raise ValueError(f"필드 이름이 중복되었습니다: {name}")
+        generator = registry.get(type_name)
+        if generator is None:
+            raise ValueError(f"지원하지 않는 타입입니다: {type_name}")
+        seen.add(name)
+        normalized.append({
+            "name": name,
+            "type": type_name,
+            "constraints": normalize_constraints(name, f.get("constraints") or {}, generator.constraint_keys),
+            "nullablePercent": int(f.get("nullablePercent") or 0),
+        })
+    return normalized
+
+
+def generate_columns(
+    fields: Iterable[Any],
+    rows: int,
+    rng: Optional[np.random.Generator] = None,
+    registry: GeneratorRegistry = GENERATORS,
+) -> Dict[str, np.ndarray]:
+    """필드마다 해당 타입 생성기로 rows개 값을 한 번에 만든다"""
+    if rows < 0:
+        raise ValueError("rows는 0 이상이어야 합니다.")
+    rng = rng if rng is not None else np.random.default_rng()
+    columns: Dict[str, np.ndarray] = {}
+    for f in normalize_fields(fields, registry):
+        columns[f["name"]] = registry.get(f["type"]).generate(f["constraints"], rows, rng)
+    return columns
+
+
+def iter_chunks(
+    fields: Iterable[Any],
+    rows: int,
+    chunk_rows: int,
+    rng: Optional[np.random.Generator] = None,
+    registry: GeneratorRegistry = GENERATORS,
+) -> Iterator[Dict[str, np.ndarray]]:
+    """rows개를 chunk_rows개씩 나눠 생성 (한 번에 chunk 하나만 메모리에 둔다)"""
+    if chunk_rows <= 0:
+        raise ValueError("chunk_rows는 1 이상이어야 합니다.")
+    fields = normalize_fields(fields, registry)
+    rng = rng if rng is not None else np.random.default_rng()
+    generators = [registry.get(f["type"]) for f in fields]
+    # email unique 같은 제약은 chunk 사이에서도 지켜지도록 상태를 전체 생성 동안 유지한다
+    states = [gen.chunk_state(f["constraints"], rows) for gen, f in zip(generators, fields)]
+    for start in range(0, rows, chunk_rows):
+        n = min(chunk_rows, rows - start)
+        yield {
+            f["name"]: gen.generate_chunk(f["constraints"], n, rng, state)
+            for gen, f, state in zip(generators, fields, states)
+        }
+
+
+def iter_masked_chunks(
+    fields: Iterable[Any],
+    rows: int,
+    chunk_rows: int,
+    rng: Optional[np.random.Generator] = None,
+    null_mode: str = "random",
+    registry: GeneratorRegistry = GENERATORS,
+) -> Iterator[Tuple[Dict[str, np.ndarray], Dict[str, np.ndarray]]]:
+    """iter_chunks + chunk마다 nullablePercent 마스크 ({필드명: bool 배열}, null이 없는 열은 빠짐)"""
+    if null_mode not in NULL_MODES:
+        raise ValueError(f"지원하지 않는 null 모드입니다: {null_mode}")
+    fields = normalize_fields(fields, registry)
+    rng = rng if rng is not None else np.random.default_rng()
+    offset = 0
+    for columns in iter_chunks(fields, rows, chunk_rows, rng, registry):
+        n = min(chunk_rows, rows - offset)
+        yield columns, null_masks(fields, n, rng, null_mode, offset)
+        offset += n
+
+
+# ── 시드 고정 · 샤드 분할 생성 ──
+# 행을 block_rows개씩 블록으로 나누고, (블록 번호, 열 번호)마다 SeedSequence(seed).spawn 과 같은
+# 독립 난수 스트림을 쓴다 (spawn_key로 바로 만들므로 앞 블록을 건너뛰는 비용이 없다).
+# 각 블록의 값은 seed·block_rows·필드 정의만으로 결정되므로, 샤드들을 병렬로 만들어 순서대로 이으면
+# 한 프로세스에서 전체를 만든 것과 정확히 같다.
+DEFAULT_BLOCK_ROWS = 100_000
+
+
+def check_independent_blocks(
+    fields: List[Dict[str, Any]],
+    rows: int,
+    block_rows: int = DEFAULT_BLOCK_ROWS,
+    registry: GeneratorRegistry = GENERATORS,
+) -> None:
+    """블록을 서로 독립으로 만드는 seed 생성에서 chunk 간 상태가 필요한 열(email unique 등)이 여러 블록에 걸치면 ValueError"""
+    if rows <= block_rows:
+        return
+    for f in fields:
+        if registry.get(f["type"]).chunk_state(f["constraints"], rows) is not None:
+            raise ValueError(
+                f"{f['name']}: seed 생성은 블록(chunk_rows)마다 독립이라 이 제약(unique 등)을 블록 사이에서 보장할 수 없습니다. "
+                "rows를 chunk_rows 이하로 하거나 seed 없이 생성하세요."
+            )
+
+
+def column_rng(seed: int, block: int, column: int) -> np.random.Generator:
+    """블록·열 전용 난수 생성기 (SeedSequence(seed).spawn(..)[block].spawn(..)[column] 과 같은 스트림)"""
+    return np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(block, column)))
+
+
+def shard_blocks(rows: int, shard: int, shards: int, block_rows: int = DEFAULT_BLOCK_ROWS) -> range:
+    """shards개 샤드 중 shard번째가 맡는 블록 번호 범위 (연속 구간, 블록 수를 고르게 나눈다)"""
+    if shards < 1 or not 0 <= shard < shards:
+        raise ValueError("shard는 0 이상 shards 미만이어야 합니다.")
+    if block_rows <= 0:
+        raise ValueError("block_rows는 1 이상이어야 합니다.")
+    blocks = -(-rows // block_rows)
+    return range(blocks * shard // shards, blocks * (shard + 1) // shards)
+
+
+def shard_rows(rows: int, shard: int, shards: int, block_rows: int = DEFAULT_BLOCK_ROWS) -> Tuple[int, int]:
+    """샤드가 맡는 행 구간 [start, end)"""
+    blocks = shard_blocks(rows, shard, shards, block_rows)
+    return min(blocks.start * block_rows, rows), min(blocks.stop * block_rows, rows)
+
+
+def generate_block(
+    fields: List[Dict[str, Any]],
+    rows: int,
+    seed: int,
+    block: int,
+    block_rows: int = DEFAULT_BLOCK_ROWS,
+    null_mode: str = "random",
+    registry: GeneratorRegistry = GENERATORS,
+    raw: bool = False,
+) -> Tuple[Dict[str, np.ndarray], Dict[str, np.ndarray]]:
+    """정규화된 필드로 block번째 블록의 (열, null 마스크)를 만든다 (raw=True면 generate_raw 값)"""
+    offset = block * block_rows
+    n = max(0, min(block_rows, rows - offset))
+    columns: Dict[str, np.ndarray] = {}
+    masks: Dict[str, np.ndarray] = {}
+    for i, f in enumerate(fields):
+        rng = column_rng(seed, block, i)
+        gen = registry.get(f["type"])
+        make = gen.generate_raw if raw else gen.generate
+        columns[f["name"]] = make(f["constraints"], n, rng)
+        mask = null_mask(n, f["nullablePercent"], rng, null_mode, offset)
+        if mask is not None:
+            masks[f["name"]] = mask
+    return columns, masks
+
+
+def iter_seeded_chunks(
+    fields: Iterable[Any],
+    rows: int,
+    seed: int,
+    shard: int = 0,
+    shards: int = 1,
+    block_rows: int = DEFAULT_BLOCK_ROWS,
+    null_mode: str = "random",
+    registry: GeneratorRegistry = GENERATORS,
+) -> Iterator[Tuple[Dict[str, np.ndarray], Dict[str, np.ndarray]]]:
+    """전체 rows행 중 shard번째 샤드를 블록 단위로 생성 (iter_masked_chunks와 같은 (열, 마스크) 형태)"""
+    if null_mode not in NULL_MODES:
+        raise ValueError(f"지원하지 않는 null 모드입니다: {null_mode}")
+    if seed < 0:
+        raise ValueError("seed는 0 이상이어야 합니다.")
+    fields = normalize_fields(fields, registry)
+    check_independent_blocks(fields, rows, block_rows, registry)
+    for block in shard_blocks(rows, shard, shards, block_rows):
+        yield generate_block(fields, rows, seed, block, block_rows, null_mode, registry)
+
+
+def iter_dataset_chunks(
+    fields: Iterable[Any],
+    rows: int,
+    chunk_rows: int,
+    rng: Optional[np.random.Generator] = None,
+    null_mode: str = "random",
+    seed: Optional[int] = None,
+    shard: int = 0,
+    shards: int = 1,
+) -> Iterator[Tuple[Dict[str, np.ndarray], Dict[str, np.ndarray]]]:
+    """seed가 있으면 재현 가능한 샤드 생성(chunk_rows = 블록 크기), 없으면 rng로 순서대로 생성"""
+    if seed is not None:
+        return iter_seeded_chunks(fields, rows, seed, shard, shards, chunk_rows, null_mode)
+    if (shard, shards) != (0, 1):
+        raise ValueError("샤드 분할 생성에는 seed가 필요합니다.")
+    return iter_masked_chunks(fields, rows, chunk_rows, rng, null_mode)
@@ -0,0 +1,66 @@
+# nullablePercent → 열별 null 마스크
+# 열 하나당 난수 호출 한 번으로 (n,) bool 마스크를 만들고, 값 버퍼 전체에 np.where 로 한 번에 적용한다.
+#   random: 행마다 독립적으로 nullablePercent% 확률 (Bernoulli)
+#   exact : 정확히 nullablePercent% 행만 null ("10개 중 2개 빈값" → 20%), 섞은 인덱스 앞쪽 k개를 고른다
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+NULL_MODES = ("random", "exact")
+
+
+def null_count(offset: int, n: int, nullable_percent: int) -> int:
+    """[offset, offset+n) 구간에 들어갈 null 개수
+
+    누적 목표치(round(끝 * p))의 차이로 계산하므로 chunk로 나눠 생성해도
+    전체 null 개수는 rows * p 를 반올림한 값과 정확히 같다.
+    """
+    p = nullable_percent / 100
+    return int(round((offset + n) * p)) - int(round(offset * p))
+
+
+def null_mask(
+    n: int,
+    nullable_percent: int,
+    rng: np.random.Generator,
+    mode: str = "random",
+    offset: int = 0,
+) -> Optional[np.ndarray]:
+    """null이 될 행 마스크 (True = null). null이 없으면 None"""
+    if mode not in NULL_MODES:
+        raise ValueError(f"지원하지 않는 null 모드입니다: {mode}")
+    if nullable_percent <= 0 or n == 0:
+        return None
+    if nullable_percent >= 100:
+        return np.ones(n, dtype=bool)
+    if mode == "random":
+        return rng.random(n) < nullable_percent / 100
+    k = null_count(offset, n, nullable_percent)
+    if k == 0:
+        return None
+    mask = np.zeros(n, dtype=bool)
+    mask[rng.permutation(n)[:k]] = True
+    return mask
+
+
+def null_masks(
+    fields: List[Dict[str, Any]],
+    n: int,
+    rng: np.random.Generator,
+    mode: str = "random",
+    offset: int = 0,
+) -> Dict[str, np.ndarray]:
+    """정규화된 필드 목록 → {필드명: 마스크} (null이 없는 열은 빠진다)"""
+    masks: Dict[str, np.ndarray] = {}
+    for f in fields:
+        mask = null_mask(n, f["nullablePercent"], rng, mode, offset)
+        if mask is not None:
+            masks[f["name"]] = mask
+    return masks
+
+
+def fill_nulls(values: np.ndarray, mask: Optional[np.ndarray], fill: str) -> np.ndarray:
+    """직렬화된 문자열 열에서 마스크 위치를 fill(예: 'null', '')로 바꾼다"""
+    if mask is None or not mask.any():
+        return values
+    return np.where(mask, fill, values)
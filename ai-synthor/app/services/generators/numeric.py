@@ -0,0 +1,45 @@
+import math
+from typing import Dict
+
+import numpy as np
+
+from .base import ColumnGenerator
+
+
+class NumberGenerator(ColumnGenerator):
+    """number: {"min", "max", "decimals"} (NumberBetweenExtractor 기본값과 같은 1~100)"""
+    type_name = "number"
+    constraint_keys = frozenset({"min", "max", "decimals"})
+
+    def generate(self, constraints: Dict, n: int, rng: np.random.Generator) -> np.ndarray:
+        lo = float(constraints.get("min", 1))
+        hi = float(constraints.get("max", 100))
+        if lo > hi:
+            lo, hi = hi, lo
+        return uniform_grid(lo, hi, int(constraints.get("decimals", 0)), n, rng)
+
+
+class UniformGenerator(ColumnGenerator):
+    """고정 범위의 실수 (latitude, longitude, product_price 등)"""
+    constraint_keys = frozenset({"min", "max"})
+
+    def __init__(self, type_name: str, lo: float, hi: float, decimals: int):
+        self.type_name = type_name
+        self.lo, self.hi, self.decimals = lo, hi, decimals
+
+    def generate(self, constraints: Dict, n: int, rng: np.random.Generator) -> np.ndarray:
+        lo = float(constraints.get("min", self.lo))
+        hi = float(constraints.get("max", self.hi))
+        return uniform_grid(lo, hi, self.decimals, n, rng)
+
+
+def uniform_grid(lo: float, hi: float, decimals: int, n: int, rng: np.random.Generator) -> np.ndarray:
+    """[lo, hi] 안에서 소수 decimals자리로 표현 가능한 값 중 균등 추출
+       decimals=0이면 int64, 아니면 float64 (정수 격자를 뽑은 뒤 나누므로 반올림 편향이 없다)"""
+    scale = 10 ** max(0, decimals)
+    a, b = math.ceil(lo * scale - 1e-9), math.floor(hi * scale + 1e-9)
+    if a > b:
+        # 범위 안에 표현 가능한 값이 없으면 lo에 가장 가까운 값으로 고정
+        a = b = round(lo * scale)
+    values = rng.integers(a, b, n, endpoint=True)
+    return values if decimals <= 0 else values / scale
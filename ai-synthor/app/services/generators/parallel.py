@@ -0,0 +1,253 @@
+"""
+공유 메모리 열 버퍼를 여러 워커 프로세스가 나눠 채우는 병렬 생성
+
+- 부모가 열마다 multiprocessing.shared_memory 버퍼를 미리 잡는다
+  (숫자: 해당 dtype, 날짜: int64 일수, 문자열: 고정폭 'U{폭}', nullablePercent 마스크: bool)
+- 워커는 맡은 블록(engine.generate_block, seed 기반)을 만들어 자기 행 구간에 바로 쓴다.
+  결과를 pickle로 돌려받지 않으므로 부모는 버퍼 view를 그대로 출력(Arrow 등)에 넘긴다.
+- 블록 값은 seed·block_rows로만 정해지므로 워커 수와 관계없이 단일 프로세스 결과와 같다.
+  (spawn 워커는 해시 시드가 각자 다르므로 값 풀·표는 집합 순서에 기대면 안 된다: pools._pool 참고)
+- 문자열 폭은 표본으로 정하고, 더 긴 값이 나온 블록은 버퍼를 넓힌 뒤 그 블록만 다시 만든다.
+"""
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .engine import DEFAULT_BLOCK_ROWS, check_independent_blocks, generate_block, normalize_fields, shard_blocks
+from .nulls import NULL_MODES
+from .registry import GENERATORS
+
+# 워커에 넘기는 버퍼 정보: {키: (공유 메모리 이름, dtype 문자열)} (마스크 키는 "필드명\0null")
+Layout = Dict[str, Tuple[str, str]]
+
+_PROBE_ROWS = 1_000
+
+
+def _mask_key(name: str) -> str:
+    return name + "\0null"
+
+
+def probe_dtypes(fields: List[Dict[str, Any]], seed: int) -> Dict[str, np.dtype]:
+    """표본 블록으로 열별 raw dtype(문자열은 폭 포함)을 정한다"""
+    columns, _ = generate_block(fields, _PROBE_ROWS, seed, 0, _PROBE_ROWS, raw=True)
+    dtypes: Dict[str, np.dtype] = {}
+    for name, values in columns.items():
+        if values.dtype.kind not in "iufbU":
+            raise ValueError(f"공유 메모리에 올릴 수 없는 열입니다: {name} ({values.dtype})")
+        dtypes[name] = values.dtype
+    return dtypes
+
+
+class SharedColumns:
+    """행 구간 [start, stop) 의 열·마스크 버퍼 (공유 메모리). with 문으로 쓰고 끝나면 해제한다
+
+    columns/masks와 chunk()가 돌려주는 배열은 공유 메모리의 view이므로 close() 전에 참조를 버려야 한다.
+    """
+
+    def __init__(self, fields: List[Dict[str, Any]], start: int, stop: int, dtypes: Dict[str, np.dtype]):
+        self.fields = fields
+        self.start = start
+        self.stop = stop
+        self._segments: Dict[str, SharedMemory] = {}
+        self.columns: Dict[str, np.ndarray] = {}
+        self.masks: Dict[str, np.ndarray] = {}
+        for f in fields:
+            self.columns[f["name"]] = self._alloc(f["name"], dtypes[f["name"]])
+            if f["nullablePercent"] > 0:
+                self.masks[f["name"]] = self._alloc(_mask_key(f["name"]), np.dtype(bool))
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+    def _alloc(self, key: str, dtype: np.dtype) -> np.ndarray:
+        shm = SharedMemory(create=True, size=max(1, len(self) * dtype.itemsize))
+        self._segments[key] = shm
+        return np.ndarray((len(self),), dtype=dtype, buffer=shm.buf)
+
+    def _free(self, key: str) -> None:
+        shm = self._segments.pop(key)
+        shm.close()
+        shm.unlink()
+
+    def widen(self, name: str, width: int) -> None:
+        """문자열 열을 'U{width}' 로 넓힌다 (이미 채운 값은 옮긴다)"""
+        old = self.columns.pop(name)
+        old_shm = self._segments.pop(name)
+        self.columns[name] = self._alloc(name, np.dtype(f"U{width}"))
+        self.columns[name][:] = old
+        del old
+        old_shm.close()
+        old_shm.unlink()
+
+    def layout(self) -> Layout:
+        arrays = dict(self.columns)
+        arrays.update((_mask_key(name), mask) for name, mask in self.masks.items())
+        return {key: (self._segments[key].name, arrays[key].dtype.str) for key in arrays}
+
+    def chunk(self, start: int, stop: int) -> Tuple[Dict[str, np.ndarray], Dict[str, np.ndarray]]:
+        """전체 행 번호 [start, stop) 의 (최종 값 열, 마스크). 숫자·문자열 열은 복사 없는 view"""
+        lo, hi = start - self.start, stop - self.start
+        columns = {}
+        for f in self.fields:
+            raw = self.columns[f["name"]][lo:hi]
+            columns[f["name"]] = GENERATORS.get(f["type"]).render(f["constraints"], raw)
+        return columns, {name: mask[lo:hi] for name, mask in self.masks.items()}
+
+    def close(self) -> None:
+        self.columns = {}
+        self.masks = {}
+        for key in list(self._segments):
+            self._free(key)
+
+    def __enter__(self) -> "SharedColumns":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+# ---------- 워커 프로세스에서 실행되는 함수 (pickle 가능하도록 모듈 최상위) ----------
+def _fill_blocks(
+    fields: List[Dict[str, Any]],
+    rows: int,
+    seed: int,
+    block_rows: int,
+    null_mode: str,
+    start: int,
+    length: int,
+    layout: Layout,
+    blocks: Sequence[int],
+) -> List[Tuple[int, str, int]]:
+    """blocks를 생성해 공유 버퍼의 해당 행 구간에 쓴다. 폭이 모자라 못 쓴 (블록, 필드명, 필요한 폭) 목록 반환"""
+    segments = {key: SharedMemory(name=shm_name) for key, (shm_name, _) in layout.items()}
+    arrays = {
+        key: np.ndarray((length,), dtype=np.dtype(dtype), buffer=segments[key].buf)
+        for key, (_, dtype) in layout.items()
+    }
+    overflow: List[Tuple[int, str, int]] = []
+    try:
+        for block in blocks:
+            columns, masks = generate_block(fields, rows, seed, block, block_rows, null_mode, raw=True)
+            lo = block * block_rows - start
+            for name, values in columns.items():
+                target = arrays[name]
+                if values.dtype.kind == "U" and values.dtype.itemsize > target.dtype.itemsize:
+                    overflow.append((block, name, values.dtype.itemsize // 4))
+                    continue
+                target[lo:lo + len(values)] = values
+            n = len(next(iter(columns.values()))) if columns else 0
+            for name, mask in masks.items():
+                arrays[_mask_key(name)][lo:lo + n] = mask
+            for f in fields:
+                if f["nullablePercent"] > 0 and f["name"] not in masks:
+                    arrays[_mask_key(f["name"])][lo:lo + n] = False
+    finally:
+        arrays.clear()
+        for shm in segments.values():
+            shm.close()
+    return overflow
+
+
+def _split(blocks: Sequence[int], parts: int) -> List[List[int]]:
+    """연속 블록을 parts개 작업으로 고르게 나눈다"""
+    parts = max(1, min(parts, len(blocks)))
+    return [list(blocks[len(blocks) * i // parts:len(blocks) * (i + 1) // parts]) for i in range(parts)]
+
+
+def fill_shared(
+    fields: List[Dict[str, Any]],
+    rows: int,
+    seed: int,
+    blocks: range,
+    block_rows: int = DEFAULT_BLOCK_ROWS,
+    null_mode: str = "random",
+    pool: Optional[ProcessPoolExecutor] = None,
+    workers: int = 1,
+) -> SharedColumns:
+    """blocks 구간을 공유 메모리에 생성 (pool이 없으면 현재 프로세스에서)"""
+    start = min(blocks.start * block_rows, rows)
+    stop = min(blocks.stop * block_rows, rows)
+    shared = SharedColumns(fields, start, stop, probe_dtypes(fields, seed))
+    try:
+        pending = list(blocks)
+        while pending:
+            tasks = _split(pending, workers)
+            args = (fields, rows, seed, block_rows, null_mode, start, len(shared), shared.layout())
+            if pool is None:
+                results = [_fill_blocks(*args, task) for task in tasks]
+            else:
+                results = list(pool.map(_fill_blocks, *zip(*(args + (task,) for task in tasks))))
+            overflow = [item for result in results for item in result]
+            for name in {name for _, name, _ in overflow}:
+                shared.widen(name, max(width for _, n, width in overflow if n == name))
+            pending = sorted({block for block, _, _ in overflow})
+    except BaseException:
+        shared.close()
+        raise
+    return shared
+
+
+def make_pool(workers: int, start_method: str = "spawn") -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context(start_method))
+
+
+def generate_shared(
+    fields: Iterable[Any],
+    rows: int,
+    seed: int,
+    workers: Optional[int] = None,
+    block_rows: int = DEFAULT_BLOCK_ROWS,
+    null_mode: str = "random",
+    start_method: str = "spawn",
+) -> SharedColumns:
+    """rows행 전체를 workers개 프로세스로 공유 메모리에 생성 (결과는 with 문으로 쓰고 해제)"""
+    if null_mode not in NULL_MODES:
+        raise ValueError(f"지원하지 않는 null 모드입니다: {null_mode}")
+    fields = normalize_fields(fields)
+    check_independent_blocks(fields, rows, block_rows)
+    workers = workers or os.cpu_count() or 1
+    blocks = shard_blocks(rows, 0, 1, block_rows)
+    if workers == 1:
+        return fill_shared(fields, rows, seed, blocks, block_rows, null_mode)
+    with make_pool(workers, start_method) as pool:
+        return fill_shared(fields, rows, seed, blocks, block_rows, null_mode, pool, workers)
+
+
+def iter_parallel_chunks(
+    fields: Iterable[Any],
+    rows: int,
+    seed: int,
+    workers: Optional[int] = None,
+    shard: int = 0,
+    shards: int = 1,
+    block_rows: int = DEFAULT_BLOCK_ROWS,
+    null_mode: str = "random",
+    window_blocks: Optional[int] = None,
+    start_method: str = "spawn",
+) -> Iterator[Tuple[Dict[str, np.ndarray], Dict[str, np.ndarray]]]:
+    """iter_seeded_chunks와 같은 블록 단위 (열, 마스크)를 병렬로 만든다
+
+    window_blocks개 블록(기본: 워커 수)씩 공유 메모리에 채운 뒤 블록별 view를 내보낸다.
+    내보낸 배열은 다음 chunk를 요청하기 전에 참조를 버려야 한다 (창이 바뀌면 버퍼를 해제한다).
+    """
+    if null_mode not in NULL_MODES:
+        raise ValueError(f"지원하지 않는 null 모드입니다: {null_mode}")
+    fields = normalize_fields(fields)
+    check_independent_blocks(fields, rows, block_rows)
+    workers = workers or os.cpu_count() or 1
+    window_blocks = window_blocks or workers
+    blocks = shard_blocks(rows, shard, shards, block_rows)
+    pool = make_pool(workers, start_method) if workers > 1 else None
+    try:
+        for first in range(blocks.start, blocks.stop, window_blocks):
+            window = range(first, min(first + window_blocks, blocks.stop))
+            with fill_shared(fields, rows, seed, window, block_rows, null_mode, pool, workers) as shared:
+                for block in window:
+                    yield shared.chunk(block * block_rows, min((block + 1) * block_rows, rows))
+    finally:
+        if pool is not None:
+            pool.shutdown()
@@ -0,0 +1,91 @@
+from typing import Dict, Tuple
+
+import numpy as np
+
+from .base import ColumnGenerator
+from .strings import code_matrix, from_codes
+
+# 문자 클래스별 알파벳 (바이트 배열로 두고 인덱스로 뽑는다)
+UPPER = np.frombuffer(b"ABCDEFGHIJKLMNOPQRSTUVWXYZ", dtype=np.uint8)
+LOWER = np.frombuffer(b"abcdefghijklmnopqrstuvwxyz", dtype=np.uint8)
+NUMBERS = np.frombuffer(b"0123456789", dtype=np.uint8)
+SYMBOLS = np.frombuffer(b"!@#$%^&*()-_=+[]{};:,.?", dtype=np.uint8)
+
+# PasswordExtractor constraints 키 → 알파벳
+CLASSES = {"upper": UPPER, "lower": LOWER, "numbers": NUMBERS, "symbols": SYMBOLS}
+# 필수 개수를 채우고 남은 칸의 기본 문자 (요구된 클래스는 여기에 더해진다)
+FILL_CLASSES = ("upper", "lower", "numbers")
+DEFAULT_LENGTH = 10
+
+# ASCII 코드 → 클래스 번호 (CLASSES 순서, 어느 클래스에도 없으면 -1). 검증용
+_CLASS_OF = np.full(128, -1, dtype=np.int8)
+for _i, _alphabet in enumerate(CLASSES.values()):
+    _CLASS_OF[_alphabet] = _i
+
+
+def password_plan(constraints: Dict) -> Tuple[Dict[str, int], int, int]:
+    """constraints → (클래스별 필수 개수, 최소 길이, 최대 길이)"""
+    counts = {k: int(constraints.get(k) or 0) for k in CLASSES}
+    required = sum(counts.values())
+    explicit_min = int(constraints.get("minimum_length") or 0)
+    min_length = max(explicit_min or DEFAULT_LENGTH, required, 1)
+    max_length = int(constraints.get("max_length") or 0)
+    if not max_length:
+        return counts, min_length, min_length
+    if max_length < max(explicit_min, required, 1):
+        raise ValueError(f"max_length({max_length})가 최소 길이/필수 문자 수보다 작습니다.")
+    # "최대 8자"만 있으면 기본 길이(10)보다 max_length가 우선
+    return counts, min(min_length, max_length), max_length
+
+
+class PasswordGenerator(ColumnGenerator):
+    """password: {"minimum_length", "max_length", "upper", "lower", "numbers", "symbols"}
+
+    - (n, 최대 길이) 바이트 버퍼를 미리 잡고, 클래스별 필수 개수만큼 해당 알파벳에서 열 블록 단위로 뽑는다
+    - 나머지 칸은 기본 조합(대문자·소문자·숫자)과 요구된 클래스를 합친 알파벳에서 한 번에 뽑는다
+      ("대문자 1개 포함"이 "대문자만"이 되지 않도록)
+    - 행마다 문자 위치를 섞어 필수 문자가 앞쪽에 몰리지 않게 한다 (길이가 다르면 각 행의 길이 안에서만)
+    """
+    type_name = "password"
+    constraint_keys = frozenset(CLASSES) | {"minimum_length", "max_length"}
+
+    def generate(self, constraints: Dict, n: int, rng: np.random.Generator) -> np.ndarray:
+        counts, min_length, max_length = password_plan(constraints)
+        fill = np.concatenate([CLASSES[k] for k, c in counts.items() if c > 0 or k in FILL_CLASSES])
+
+        buf = np.empty((n, max_length), dtype=np.uint8)
+        pos = 0
+        for k, c in counts.items():
+            if c:
+                buf[:, pos:pos + c] = CLASSES[k][rng.integers(0, len(CLASSES[k]), (n, c))]
+                pos += c
+        buf[:, pos:] = fill[rng.integers(0, len(fill), (n, max_length - pos))]
+        if min_length == max_length:
+            return from_codes(rng.permuted(buf, axis=1))
+
+        # 길이가 행마다 다르면 길이 밖 칸의 정렬 키를 1보다 크게 둬 뒤에 남기고, 그 칸은 패딩(0)으로
+        lengths = rng.integers(min_length, max_length, n, endpoint=True)
+        outside = np.arange(max_length)[None, :] >= lengths[:, None]
+        keys = rng.random((n, max_length))
+        keys[outside] = 2.0
+        buf = np.take_along_axis(buf, np.argsort(keys, axis=1), axis=1)
+        buf[outside] = 0
+        return from_codes(buf)
+
+
+def validate_passwords(values: np.ndarray, constraints: Dict) -> np.ndarray:
+    """행별로 constraints(길이, 클래스별 최소 개수)를 만족하는지 한 번에 검사 (bool 배열)"""
+    counts, min_length, max_length = password_plan(constraints)
+    codes = code_matrix(values.astype(str, copy=False))
+    present = codes != 0
+    lengths = present.sum(axis=1)
+    ok = (lengths >= min_length) & (lengths <= max_length)
+    # ASCII 밖 문자는 어느 클래스도 아니다
+    ascii_codes = np.where(codes < 128, codes, 0)
+    classes = np.where(present & (codes < 128), _CLASS_OF[ascii_codes], -1)
+    ok &= ~(present & (classes < 0)).any(axis=1)
+    for i, c in enumerate(counts.values()):
+        if c:
+            ok &= (classes == i).sum(axis=1) >= c
+    return ok
+
@@ -0,0 +1,76 @@
+from functools import lru_cache
+from typing import Dict, Sequence, Tuple
+
+import numpy as np
+
+from .base import ColumnGenerator
+from .strings import from_codes
+
+_HASH = ord("#")
+_ZERO = ord("0")
+
+
+@lru_cache(maxsize=256)
+def compile_template(fmt: str) -> Tuple[np.ndarray, np.ndarray]:
+    """형식 문자열 → (리터럴이 채워진 코드 행 (폭,), '#' 자리 인덱스). 형식마다 한 번만 계산한다"""
+    template = np.frombuffer(fmt.encode("utf-32-le"), dtype=np.uint32).copy()
+    slots = np.flatnonzero(template == _HASH)
+    template.setflags(write=False)
+    slots.setflags(write=False)
+    return template, slots
+
+
+def _prefix_codes(prefixes: Sequence[str]) -> np.ndarray:
+    """접두 숫자열들 → (접두 수, 길이) 코드 행렬 (길이가 같아야 한다)"""
+    if len({len(p) for p in prefixes}) != 1 or not all(p.isdigit() for p in prefixes):
+        raise ValueError(f"prefix는 같은 길이의 숫자열이어야 합니다: {list(prefixes)}")
+    joined = "".join(prefixes).encode("utf-32-le")
+    return np.frombuffer(joined, dtype=np.uint32).reshape(len(prefixes), -1)
+
+
+class PhoneGenerator(ColumnGenerator):
+    """phone: {"format": "###-###-####", "prefix": "010" 또는 ["010", ...]}
+
+    - 형식은 리터럴이 채워진 템플릿 행과 '#' 자리 인덱스로 미리 컴파일해 둔다
+    - (n, '#' 개수) 숫자 행렬 하나를 한 번에 뽑아 템플릿 복사본의 '#' 자리에 넣는다
+    - prefix가 있으면 앞쪽 '#' 자리를 행마다 고른 접두 숫자열로 덮는다
+      (korean_phone의 기본 접두 010은 형식이 '#'로 시작할 때만 쓴다)
+    """
+    constraint_keys = frozenset({"format", "prefix"})
+
+    def __init__(
+        self,
+        type_name: str = "phone",
+        default_format: str = "###-###-####",
+        prefixes: Sequence[str] = (),
+    ):
+        self.type_name = type_name
+        self.default_format = default_format
+        self.prefixes = tuple(prefixes)
+
+    def generate(self, constraints: Dict, n: int, rng: np.random.Generator) -> np.ndarray:
+        fmt = constraints.get("format") or self.default_format
+        prefixes = constraints.get("prefix")
+        if not prefixes and fmt.startswith("#"):
+            # 기본 접두(korean_phone: 010)는 형식이 '#'로 시작할 때만. '010-####-####'처럼
+            # 리터럴 숫자·기호로 시작하는 형식은 이미 앞자리가 정해져 있으므로 덮지 않는다
+            prefixes = self.prefixes
+        if isinstance(prefixes, str):
+            prefixes = [prefixes]
+        template, slots = compile_template(fmt)
+        if not len(slots):
+            return np.full(n, fmt)
+
+        digits = rng.integers(0, 10, (n, len(slots)), dtype=np.uint32)
+        digits += _ZERO
+        if prefixes:
+            codes = _prefix_codes(prefixes)
+            if codes.shape[1] > len(slots):
+                raise ValueError(f"prefix가 형식의 자리 수보다 깁니다: {fmt}")
+            picked = codes[rng.integers(0, len(codes), n)] if len(codes) > 1 else codes
+            digits[:, :codes.shape[1]] = picked
+
+        out = np.empty((n, len(template)), dtype=np.uint32)
+        out[:] = template
+        out[:, slots] = digits
+        return from_codes(out)
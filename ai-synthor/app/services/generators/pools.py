@@ -0,0 +1,168 @@
+# 생성기가 값을 뽑는 기본 값 풀 (모듈 로드 시 한 번만 numpy 배열로 만든다)
+import numpy as np
+
+from ..constants_types import SUPPORTED_CARD_TYPES, SUPPORTED_COUNTRIES, SUPPORTED_STATES
+
+
+def _pool(values) -> np.ndarray:
+    """값 목록 → 문자열 배열. list/tuple은 적힌 순서를 지키고, 집합·제너레이터 등은 정렬한다
+
+    집합 순서는 프로세스의 해시 시드(PYTHONHASHSEED)마다 달라 같은 seed라도 프로세스마다 값이 바뀌기 때문
+    """
+    return np.array(list(values) if isinstance(values, (list, tuple)) else sorted(set(values)), dtype=str)
+
+
+# ---------- 한국어 ----------
+KOREAN_LAST_NAMES = _pool([
+    "김", "이", "박", "최", "정", "강", "조", "윤", "장", "임", "한", "오", "서", "신", "권", "황",
+    "안", "송", "류", "전", "홍", "고", "문", "양", "손", "배", "백", "허", "유", "남", "심", "노",
+])
+KOREAN_FIRST_NAMES_MALE = _pool([
+    "민준", "서준", "도윤", "예준", "시우", "하준", "주원", "지호", "지후", "준우", "준서", "건우",
+    "도현", "현우", "지훈", "우진", "선우", "서진", "민재", "현준", "연우", "유준", "정우", "승우",
+])
+KOREAN_FIRST_NAMES_FEMALE = _pool([
+    "서연", "서윤", "지우", "서현", "민서", "하은", "하윤", "윤서", "지유", "지민", "채원", "수아",
+    "지아", "지윤", "다은", "은서", "예은", "수빈", "소율", "예린", "하린", "지원", "유나", "시은",
+])
+KOREAN_FIRST_NAMES = np.concatenate([KOREAN_FIRST_NAMES_MALE, KOREAN_FIRST_NAMES_FEMALE])
+KOREAN_STATES = _pool([
+    "서울특별시", "부산광역시", "대구광역시", "인천광역시", "광주광역시", "대전광역시", "울산광역시",
+    "세종특별자치시", "경기도", "강원특별자치도", "충청북도", "충청남도", "전북특별자치도", "전라남도",
+    "경상북도", "경상남도", "제주특별자치도",
+])
+KOREAN_CITIES = _pool([
+    "서울", "부산", "대구", "인천", "광주", "대전", "울산", "세종", "수원", "성남", "고양", "용인",
+    "창원", "청주", "천안", "전주", "포항", "김해", "제주", "춘천", "원주", "안산", "화성", "평택",
+])
+KOREAN_ROADS = _pool([
+    "세종대로", "테헤란로", "강남대로", "올림픽로", "한강대로", "중앙로", "해운대로", "동성로",
+    "월드컵로", "충장로", "대학로", "반포대로", "송파대로", "경인로", "수성로", "구월로",
+])
+KOREAN_COUNTRIES = _pool(c for c in SUPPORTED_COUNTRIES if not c.isascii())
+KOREAN_COMPANIES = _pool([
+    "한빛전자", "새솔물산", "누리소프트", "다온테크", "바른식품", "푸른건설", "하늘항공", "미래에너지",
+    "은하바이오", "가온통신", "온누리제약", "소망유통", "한결금융", "빛나래디자인", "별빛엔터",
+])
+KOREAN_JOB_TITLES = _pool([
+    "소프트웨어 엔지니어", "데이터 분석가", "마케팅 매니저", "영업 대표", "인사 담당자", "회계사",
+    "프로덕트 매니저", "디자이너", "연구원", "고객지원 상담원", "재무 분석가", "품질 관리자",
+])
+KOREAN_DEPARTMENTS_CORPORATE = _pool([
+    "인사팀", "재무팀", "마케팅팀", "영업팀", "개발팀", "연구개발팀", "법무팀", "총무팀", "기획팀", "고객지원팀",
+])
+KOREAN_DEPARTMENTS_RETAIL = _pool([
+    "식품", "의류", "가전", "가구", "도서", "화장품", "스포츠", "완구", "주방용품", "생활용품",
+])
+KOREAN_PRODUCT_NAMES = _pool([
+    "무선 이어폰", "스마트 워치", "블루투스 스피커", "접이식 의자", "스테인리스 텀블러", "면 티셔츠",
+    "가죽 지갑", "노트북 거치대", "전기 주전자", "공기청정기", "러닝화", "백팩",
+])
+KOREAN_PRODUCT_CATEGORIES = _pool([
+    "전자제품", "패션", "뷰티", "식품", "가구", "스포츠", "도서", "완구", "생활용품", "주방용품",
+])
+KOREAN_CATCH_PHRASES = _pool([
+    "더 나은 내일을 위한 선택", "일상을 바꾸는 작은 혁신", "고객과 함께 성장합니다",
+    "믿을 수 있는 품질", "당신의 시간을 아껴드립니다", "새로운 가치를 만듭니다",
+])
+KOREAN_PRODUCT_DESCRIPTIONS = _pool([
+    "가볍고 튼튼해 매일 들고 다니기 좋습니다.", "간편한 사용법으로 누구나 쉽게 쓸 수 있습니다.",
+    "고급 소재로 오래 사용할 수 있습니다.", "세련된 디자인으로 어디에나 잘 어울립니다.",
+    "에너지 효율이 높아 전기 요금을 아낄 수 있습니다.", "선물용으로도 인기가 많은 제품입니다.",
+])
+KOREAN_LANGUAGES = _pool(["한국어", "영어", "일본어", "중국어", "스페인어", "프랑스어", "독일어", "러시아어"])
+KOREAN_COLORS = _pool(["빨강", "주황", "노랑", "초록", "파랑", "남색", "보라", "검정", "흰색", "회색", "분홍", "갈색"])
+
+# ---------- 영문 ----------
+FIRST_NAMES_MALE = _pool([
+    "James", "John", "Robert", "Michael", "William", "David", "Richard", "Joseph", "Thomas", "Charles",
+    "Daniel", "Matthew", "Anthony", "Mark", "Steven", "Paul", "Andrew", "Joshua", "Kevin", "Brian",
+])
+FIRST_NAMES_FEMALE = _pool([
+    "Mary", "Patricia", "Jennifer", "Linda", "Elizabeth", "Barbara", "Susan", "Jessica", "Sarah", "Karen",
+    "Lisa", "Nancy", "Betty", "Sandra", "Ashley", "Emily", "Donna", "Michelle", "Amanda", "Melissa",
+])
+FIRST_NAMES = np.concatenate([FIRST_NAMES_MALE, FIRST_NAMES_FEMALE])
+LAST_NAMES = _pool([
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis", "Rodriguez", "Martinez",
+    "Hernandez", "Lopez", "Wilson", "Anderson", "Thomas", "Taylor", "Moore", "Jackson", "Martin", "Lee",
+])
+CITIES = _pool([
+    "New York", "Los Angeles", "Chicago", "Houston", "Phoenix", "Seattle", "Boston", "Denver",
+    "London", "Paris", "Berlin", "Tokyo", "Toronto", "Sydney", "Madrid", "Rome", "Seoul", "Busan",
+])
+STATES = _pool(SUPPORTED_STATES)
+COUNTRIES = _pool(c for c in SUPPORTED_COUNTRIES if c.isascii())
+STREET_NAMES = _pool([
+    "Main", "Oak", "Pine", "Maple", "Cedar", "Elm", "Washington", "Lake", "Hill", "Park", "Sunset", "Lincoln",
+])
+STREET_SUFFIXES = _pool(["Street", "Avenue", "Road", "Boulevard", "Lane", "Drive", "Court", "Way"])
+COMPANY_NAMES = _pool([
+    "Acme Corp", "Globex", "Initech", "Umbrella", "Stark Industries", "Wayne Enterprises", "Hooli",
+    "Vandelay Industries", "Soylent", "Cyberdyne Systems", "Wonka Industries", "Tyrell Corp",
+])
+JOB_TITLES = _pool([
+    "Software Engineer", "Data Analyst", "Marketing Manager", "Sales Representative", "HR Specialist",
+    "Accountant", "Product Manager", "Graphic Designer", "Research Scientist", "Support Agent",
+])
+DEPARTMENTS_CORPORATE = _pool([
+    "Human Resources", "Finance", "Marketing", "Sales", "Engineering", "Research and Development",
+    "Legal", "Accounting", "Product Management", "Support",
+])
+DEPARTMENTS_RETAIL = _pool([
+    "Grocery", "Clothing", "Electronics", "Home", "Books", "Beauty", "Sports", "Toys", "Garden", "Automotive",
+])
+PRODUCT_NAMES = _pool([
+    "Wireless Earbuds", "Smart Watch", "Bluetooth Speaker", "Folding Chair", "Steel Tumbler", "Cotton T-Shirt",
+    "Leather Wallet", "Laptop Stand", "Electric Kettle", "Air Purifier", "Running Shoes", "Backpack",
+])
+PRODUCT_CATEGORIES = _pool([
+    "Electronics", "Fashion", "Beauty", "Food", "Furniture", "Sports", "Books", "Toys", "Home", "Kitchen",
+])
+CATCH_PHRASES = _pool([
+    "Innovate your everyday", "Quality you can trust", "Built for tomorrow", "Simply better",
+    "Growing together", "Designed around you",
+])
+PRODUCT_DESCRIPTIONS = _pool([
+    "Lightweight and durable for everyday use.", "Easy to set up and simple to use.",
+    "Made from premium materials to last for years.", "A sleek design that fits any space.",
+    "Energy efficient and quiet in operation.", "A popular choice for gifts.",
+])
+LANGUAGES = _pool(["English", "Korean", "Japanese", "Chinese", "Spanish", "French", "German", "Russian"])
+COLORS = _pool(["Red", "Orange", "Yellow", "Green", "Blue", "Indigo", "Violet", "Black", "White", "Gray", "Pink", "Brown"])
+
+# ---------- 언어 중립 ----------
+USERNAME_WORDS = _pool([
+    "sky", "blue", "star", "moon", "sun", "tiger", "wolf", "fox", "cat", "dog", "river", "stone",
+    "happy", "cool", "pixel", "code", "neo", "lucky", "rain", "snow",
+])
+EMAIL_DOMAINS = _pool(["gmail.com", "naver.com", "daum.net", "kakao.com", "yahoo.com", "outlook.com", "hotmail.com"])
+DOMAIN_WORDS = _pool(["example", "sample", "demo", "test", "acme", "globex", "initech", "hooli", "synthor"])
+TLDS = _pool([".com", ".net", ".org", ".io", ".co.kr", ".kr"])
+URL_PATHS = _pool(["/", "/home", "/about", "/products", "/blog", "/contact", "/users", "/search"])
+CARD_TYPES = _pool(SUPPORTED_CARD_TYPES)
+CURRENCIES = _pool(["KRW", "USD", "EUR", "JPY", "CNY", "GBP", "AUD", "CAD"])
+USER_AGENTS = _pool([
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 14_1) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Safari/605.1.15",
+    "Mozilla/5.0 (iPhone; CPU iPhone OS 17_1 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Mobile/15E148",
+    "Mozilla/5.0 (Linux; Android 14; SM-S911N) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Mobile Safari/537.36",
+    "Mozilla/5.0 (X11; Linux x86_64; rv:120.0) Gecko/20100101 Firefox/120.0",
+])
+APP_NAMES = _pool(["Notely", "Fitly", "Budgetr", "Tripster", "Snapix", "Chatter", "Taskr", "Weatherly", "Readit", "Cooksy"])
+DEVICE_BRANDS = _pool(["Samsung", "Apple", "LG", "Google", "Xiaomi", "Sony", "Huawei", "OnePlus"])
+DEVICE_MODELS = _pool(["Galaxy S24", "Galaxy Z Flip5", "iPhone 15", "iPhone 15 Pro", "Pixel 8", "Xperia 1 V", "Redmi Note 13", "OnePlus 12"])
+DEVICE_OS = _pool(["Android 14", "Android 13", "iOS 17", "iOS 16", "Windows 11", "macOS 14", "Ubuntu 22.04"])
+SWIFT_BANKS = _pool(["KOEX", "SHBK", "HVBK", "CZNB", "NACF", "IBKO", "CITI", "HSBC", "DEUT", "BNPA"])
+SWIFT_COUNTRIES = _pool(["KR", "US", "GB", "DE", "FR", "JP"])
+IBAN_COUNTRIES = _pool(["DE", "FR", "GB", "ES", "IT", "NL"])
+LOREM_SENTENCES = _pool([
+    "Lorem ipsum dolor sit amet, consectetur adipiscing elit.",
+    "Sed do eiusmod tempor incididunt ut labore et dolore magna aliqua.",
+    "Ut enim ad minim veniam, quis nostrud exercitation ullamco laboris.",
+    "Duis aute irure dolor in reprehenderit in voluptate velit esse.",
+    "Excepteur sint occaecat cupidatat non proident, sunt in culpa.",
+    "Curabitur pretium tincidunt lacus, nulla gravida orci a odio.",
+    "Nullam varius, turpis et commodo pharetra, est eros bibendum elit.",
+    "Integer in mauris eu nibh euismod gravida.",
+])
@@ -0,0 +1,84 @@
+from typing import Dict, Optional
+
+from . import pools
+from .base import ChoiceGenerator, ColumnGenerator
+from .composite import COMPOSED, COMPOSED_KEYS, ComposedGenerator
+from .datetime import DatetimeGenerator, TimeGenerator
+from .email import EmailGenerator
+from .numeric import NumberGenerator, UniformGenerator
+from .password import PasswordGenerator
+from .phone import PhoneGenerator
+
+# 값 풀에서 바로 뽑는 타입
+_CHOICE_POOLS = {
+    "last_name": pools.LAST_NAMES,
+    "city": pools.CITIES,
+    "state": pools.STATES,
+    "country": pools.COUNTRIES,
+    "company_name": pools.COMPANY_NAMES,
+    "job_title": pools.JOB_TITLES,
+    "department_corporate": pools.DEPARTMENTS_CORPORATE,
+    "department_retail": pools.DEPARTMENTS_RETAIL,
+    "product_name": pools.PRODUCT_NAMES,
+    "product_category": pools.PRODUCT_CATEGORIES,
+    "catch_phrase": pools.CATCH_PHRASES,
+    "product_description": pools.PRODUCT_DESCRIPTIONS,
+    "language": pools.LANGUAGES,
+    "color": pools.COLORS,
+    "korean_city": pools.KOREAN_CITIES,
+    "korean_state": pools.KOREAN_STATES,
+    "korean_country": pools.KOREAN_COUNTRIES,
+    "korean_company_name": pools.KOREAN_COMPANIES,
+    "korean_job_title": pools.KOREAN_JOB_TITLES,
+    "korean_department_corporate": pools.KOREAN_DEPARTMENTS_CORPORATE,
+    "korean_department_retail": pools.KOREAN_DEPARTMENTS_RETAIL,
+    "korean_product_name": pools.KOREAN_PRODUCT_NAMES,
+    "korean_product_category": pools.KOREAN_PRODUCT_CATEGORIES,
+    "korean_catch_phrase": pools.KOREAN_CATCH_PHRASES,
+    "korean_product_description": pools.KOREAN_PRODUCT_DESCRIPTIONS,
+    "korean_language": pools.KOREAN_LANGUAGES,
+    "korean_color": pools.KOREAN_COLORS,
+    "currency": pools.CURRENCIES,
+    "user_agent": pools.USER_AGENTS,
+    "app_name": pools.APP_NAMES,
+    "device_model": pools.DEVICE_MODELS,
+    "device_brand": pools.DEVICE_BRANDS,
+    "device_os": pools.DEVICE_OS,
+}
+
+
+class GeneratorRegistry:
+    def __init__(self):
+        self._by_type: Dict[str, ColumnGenerator] = {}
+
+    def register(self, generator: ColumnGenerator):
+        self._by_type[generator.type_name] = generator
+
+    def get(self, type_name: str) -> Optional[ColumnGenerator]:
+        return self._by_type.get(type_name)
+
+    def types(self):
+        return self._by_type.keys()
+
+
+def build_default_registry() -> GeneratorRegistry:
+    registry = GeneratorRegistry()
+    for type_name, pool in _CHOICE_POOLS.items():
+        registry.register(ChoiceGenerator(type_name, pool))
+    for type_name, build in COMPOSED.items():
+        registry.register(ComposedGenerator(type_name, build, COMPOSED_KEYS.get(type_name, ())))
+    registry.register(NumberGenerator())
+    registry.register(UniformGenerator("latitude", -90.0, 90.0, 6))
+    registry.register(UniformGenerator("longitude", -180.0, 180.0, 6))
+    registry.register(UniformGenerator("product_price", 1.0, 1000.0, 2))
+    registry.register(DatetimeGenerator())
+    registry.register(TimeGenerator())
+    registry.register(PhoneGenerator())
+    registry.register(PhoneGenerator("korean_phone", "###-####-####", prefixes=("010",)))
+    registry.register(PasswordGenerator())
+    registry.register(EmailGenerator())
+    return registry
+
+
+# 생성기는 상태가 없으므로 모든 요청이 한 레지스트리를 공유
+GENERATORS = build_default_registry()
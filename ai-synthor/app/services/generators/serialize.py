@@ -0,0 +1,163 @@
+# 생성된 열(chunk)을 NDJSON / CSV 텍스트로 바꾸는 직렬화기
+# 행마다 json.dumps / csv.writer 를 부르지 않고, 열별 리터럴 조각의 코드 행렬을 옆으로 붙여 chunk 전체를 한 번에 만든다.
+# 이스케이프가 필요한 값(따옴표, 역슬래시, 제어문자 등)이 있는 행만 파이썬으로 처리한다.
+# nullablePercent 마스크가 있으면 NDJSON은 null, CSV는 빈 칸으로 열 전체를 한 번에 바꾼다.
+import csv
+import io
+import json
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+import numpy as np
+
+from .engine import iter_dataset_chunks
+from .nulls import fill_nulls
+from .strings import code_matrix, concat, int_to_str
+
+Part = Union[str, np.ndarray]
+
+_QUOTE, _BACKSLASH, _COMMA, _LF, _CR = (ord(c) for c in '"\\,\n\r')
+
+
+def _needs(values: np.ndarray, *chars: int, control: bool = False) -> np.ndarray:
+    """행별로 chars(또는 제어문자) 중 하나라도 포함하는지"""
+    codes = code_matrix(values)
+    hit = np.zeros(codes.shape, dtype=bool)
+    for ch in chars:
+        hit |= codes == ch
+    if control:
+        hit |= (codes < 32) & (codes != 0)
+    return hit.any(axis=1)
+
+
+def _patch(base: np.ndarray, rows: np.ndarray, fixed: Iterable[str]) -> np.ndarray:
+    """base의 rows 위치를 fixed 값으로 교체 (폭이 모자라면 넓힌다)"""
+    fixed = np.array(list(fixed), dtype=str)
+    width = max(base.dtype.itemsize, fixed.dtype.itemsize) // 4
+    out = base.astype(f"U{width}")
+    out[rows] = fixed
+    return out
+
+
+def _scalar_literals(values: np.ndarray) -> np.ndarray:
+    if values.dtype.kind in "iu":
+        return int_to_str(values)
+    if values.dtype.kind == "f":
+        return values.astype(str)
+    if values.dtype.kind == "b":
+        return np.where(values, "true", "false")
+    return None
+
+
+def json_parts(values: np.ndarray, null: Optional[np.ndarray] = None) -> List[Part]:
+    """열 → JSON 리터럴 조각 (이스케이프가 필요 없으면 따옴표를 상수 조각으로 둬 복사를 줄인다)"""
+    literals = _scalar_literals(values)
+    if literals is not None:
+        return [fill_nulls(literals, null, "null")]
+    values = values.astype(str, copy=False)
+    rows = np.flatnonzero(_needs(values, _QUOTE, _BACKSLASH, control=True))
+    if not len(rows):
+        if null is None:
+            return ['"', values, '"']
+        return [fill_nulls(concat('"', values, '"'), null, "null")]
+    out = concat('"', values, '"')
+    out = _patch(out, rows, (json.dumps(v, ensure_ascii=False) for v in values[rows].tolist()))
+    return [fill_nulls(out, null, "null")]
+
+
+def csv_parts(values: np.ndarray, null: Optional[np.ndarray] = None) -> List[Part]:
+    """열 → CSV 필드 조각 (쉼표/줄바꿈이 있으면 따옴표로 감싸고 내부 따옴표는 두 번)"""
+    literals = _scalar_literals(values)
+    if literals is not None:
+        return [fill_nulls(literals, null, "")]
+    values = values.astype(str, copy=False)
+    rows = np.flatnonzero(_needs(values, _COMMA, _LF, _CR, _QUOTE))
+    if len(rows):
+        values = _patch(values, rows, ('"' + v.replace('"', '""') + '"' for v in values[rows].tolist()))
+    return [fill_nulls(values, null, "")]
+
+
+def _join(parts: List[Part]) -> str:
+    """조각들을 행 단위로 이어 붙인 전체 텍스트
+
+    조각별 코드 행렬을 옆으로 붙이면 행 우선 순서가 곧 출력 순서이므로,
+    패딩(0)만 걸러 내면 행별 재배치 없이 한 번에 디코딩할 수 있다.
+    """
+    # 이웃한 상수 조각은 하나로 합친다
+    merged: List[Part] = []
+    for p in parts:
+        if isinstance(p, str) and not p:
+            continue
+        if isinstance(p, str) and merged and isinstance(merged[-1], str):
+            merged[-1] += p
+        else:
+            merged.append(p)
+    n = next(len(p) for p in merged if isinstance(p, np.ndarray))
+    blocks = [
+        code_matrix(p.astype(str, copy=False)) if isinstance(p, np.ndarray)
+        else np.broadcast_to(np.frombuffer(p.encode("utf-32-le"), dtype=np.uint32), (n, len(p)))
+        for p in merged
+    ]
+    codes = np.hstack(blocks)
+    return codes[codes != 0].tobytes().decode("utf-32-le")
+
+
+def ndjson_chunk(columns: Dict[str, np.ndarray], masks: Optional[Dict[str, np.ndarray]] = None) -> str:
+    masks = masks or {}
+    parts: List[Part] = []
+    for i, (name, values) in enumerate(columns.items()):
+        parts.append(("{" if i == 0 else ",") + json.dumps(name, ensure_ascii=False) + ":")
+        parts.extend(json_parts(values, masks.get(name)))
+    if not parts:
+        return ""
+    parts.append("}\n")
+    return _join(parts)
+
+
+def csv_header(names: Iterable[str]) -> str:
+    buf = io.StringIO()
+    csv.writer(buf, lineterminator="\n").writerow(list(names))
+    return buf.getvalue()
+
+
+def csv_chunk(columns: Dict[str, np.ndarray], masks: Optional[Dict[str, np.ndarray]] = None) -> str:
+    masks = masks or {}
+    parts: List[Part] = []
+    for i, (name, values) in enumerate(columns.items()):
+        if i:
+            parts.append(",")
+        parts.extend(csv_parts(values, masks.get(name)))
+    if not parts:
+        return ""
+    parts.append("\n")
+    return _join(parts)
+
+
+# 형식 이름 → (Content-Type, chunk 직렬화 함수)
+FORMATS = {
+    "ndjson": ("application/x-ndjson", ndjson_chunk),
+    "csv": ("text/csv", csv_chunk),
+}
+
+
+def stream_dataset(
+    fields: List[Dict[str, Any]],
+    rows: int,
+    fmt: str,
+    chunk_rows: int,
+    rng: Optional[np.random.Generator] = None,
+    null_mode: str = "random",
+    seed: Optional[int] = None,
+    shard: int = 0,
+    shards: int = 1,
+) -> Iterator[bytes]:
+    """chunk 단위로 생성 → 직렬화 → UTF-8 바이트를 내보낸다 (CSV 헤더는 생성 전에 바로)
+
+    seed를 주면 같은 seed·chunk_rows로 만든 샤드 출력들을 순서대로 이었을 때 단일 실행과 바이트 단위로 같다
+    (CSV 헤더는 0번 샤드에만 붙는다).
+    """
+    _, encode = FORMATS[fmt]
+    chunks = iter_dataset_chunks(fields, rows, chunk_rows, rng, null_mode, seed, shard, shards)
+    if fmt == "csv" and shard == 0:
+        yield csv_header(f["name"] for f in fields).encode("utf-8")
+    for columns, masks in chunks:
+        yield encode(columns, masks).encode("utf-8")
@@ -0,0 +1,165 @@
+# 고정폭 유니코드 배열('U')을 UCS-4 코드 행렬로 보고 조작하는 헬퍼
+# np.char.* 는 원소마다 파이썬 문자열 연산을 호출해 100만 행에서 초 단위가 걸리므로,
+# 문자열 열은 (행, 폭) uint32 행렬에서 한 번에 만든 뒤 'U{폭}' 으로 view 한다.
+from typing import List, Tuple, Union
+
+import numpy as np
+
+Part = Union[str, np.ndarray]
+
+_ZERO = ord("0")
+
+
+def code_matrix(values: np.ndarray) -> np.ndarray:
+    """'U' 배열 → 코드 행렬 (n, 폭). 복사 없이 view 한다"""
+    values = np.ascontiguousarray(values)
+    return values.view(np.uint32).reshape(len(values), values.dtype.itemsize // 4)
+
+
+def as_codes(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """'U' 배열 → (코드 행렬 (n, 폭), 행별 길이)"""
+    codes = code_matrix(values)
+    return codes, np.count_nonzero(codes, axis=1)
+
+
+def from_codes(codes: np.ndarray) -> np.ndarray:
+    """(n, 폭) 코드 행렬 → 'U{폭}' 배열 (뒤쪽 0은 패딩으로 취급된다)"""
+    codes = np.ascontiguousarray(codes, dtype=np.uint32)
+    return codes.view(f"U{codes.shape[1]}").ravel()
+
+
+_FNV_OFFSET = np.uint64(14695981039346656037)
+_FNV_PRIME = np.uint64(1099511628211)
+_FINGERPRINT_BLOCK = 1 << 14
+
+
+def fingerprints(values: np.ndarray) -> np.ndarray:
+    """'U' 배열 → 행별 64비트 FNV-1a 해시 (같은 문자열은 배열 폭과 관계없이 항상 같은 값)
+
+    열 단위로 갱신하되 캐시에 들어가는 행 블록씩 처리한다 (열 하나 = 폭만큼 건너뛰는 접근이라 통째로 하면 느리다).
+    뒤쪽 0(패딩)은 건너뛰므로 'U5'와 'U7'에 담긴 같은 문자열도 해시가 같다.
+    """
+    codes = code_matrix(values.astype(str, copy=False))
+    h = np.full(len(codes), _FNV_OFFSET, dtype=np.uint64)
+    for start in range(0, len(codes), _FINGERPRINT_BLOCK):
+        block, out = codes[start:start + _FINGERPRINT_BLOCK], h[start:start + _FINGERPRINT_BLOCK]
+        mixed = np.empty_like(out)
+        for j in range(codes.shape[1]):
+            col = block[:, j]
+            np.bitwise_xor(out, col, out=mixed)
+            mixed *= _FNV_PRIME
+            np.copyto(out, mixed, where=col != 0)
+    return h
+
+
+def duplicate_rows(hashes: np.ndarray) -> np.ndarray:
+    """해시가 앞 행과 겹치는 행 번호 (같은 값 중 처음 나온 행은 남긴다)"""
+    order = np.argsort(hashes, kind="stable")
+    ordered = hashes[order]
+    return order[1:][ordered[1:] == ordered[:-1]]
+
+
+class FingerprintSet:
+    """64비트 지문 집합 (정렬된 배열 여러 개, 크기가 비슷해지면 합친다)
+
+    chunk마다 추가해도 전체를 다시 정렬·복사하지 않도록 새 지문은 작은 정렬 배열로 붙이고,
+    앞 배열이 새 배열의 2배보다 작아지면 합친다 (배열 수는 log(크기) 이하).
+    """
+
+    def __init__(self):
+        self._runs: List[np.ndarray] = []
+
+    def __len__(self) -> int:
+        return sum(len(run) for run in self._runs)
+
+    def contains(self, hashes: np.ndarray) -> np.ndarray:
+        found = np.zeros(len(hashes), dtype=bool)
+        for run in self._runs:
+            idx = np.minimum(np.searchsorted(run, hashes), len(run) - 1)
+            found |= run[idx] == hashes
+        return found
+
+    def add(self, hashes: np.ndarray) -> None:
+        """집합에 없는 서로 다른 지문들을 더한다"""
+        if not len(hashes):
+            return
+        self._runs.append(np.sort(hashes))
+        while len(self._runs) > 1 and len(self._runs[-2]) < 2 * len(self._runs[-1]):
+            top = self._runs.pop()
+            self._runs[-1] = np.sort(np.concatenate([self._runs[-1], top]))
+
+
+def int_to_str(values: np.ndarray, width: int = 0) -> np.ndarray:
+    """정수 배열 → 10진 문자열 배열 (width가 있으면 앞을 0으로 채움, 음수는 '-'를 붙인다)"""
+    values = np.asarray(values, dtype=np.int64)
+    if len(values) and values.min() < 0:
+        return concat(np.where(values < 0, "-", ""), int_to_str(np.abs(values), width))
+    n = len(values)
+    top = int(values.max()) if n else 0
+    digits_max = max(len(str(top)), width, 1)
+    codes = np.empty((n, digits_max), dtype=np.uint32)
+    rest = values.copy()
+    for j in range(digits_max - 1, -1, -1):
+        rest, r = np.divmod(rest, 10)
+        codes[:, j] = r + _ZERO
+    if width >= digits_max:
+        return from_codes(codes)
+    # 자릿수가 행마다 다르면 왼쪽 정렬로 당기고 남는 칸은 0(패딩)으로
+    lengths = np.maximum(
+        np.searchsorted(10 ** np.arange(1, digits_max, dtype=np.int64), values, side="right") + 1, width
+    )
+    shift = (digits_max - lengths)[:, None]
+    cols = np.arange(digits_max)[None, :]
+    out = np.take_along_axis(codes, np.minimum(cols + shift, digits_max - 1), axis=1)
+    out[cols >= lengths[:, None]] = 0
+    return from_codes(out)
+
+
+def digits(n: int, width: int, rng: np.random.Generator) -> np.ndarray:
+    """0으로 채운 width자리 숫자 문자열 n개"""
+    codes = rng.integers(0, 10, (n, width), dtype=np.uint32)
+    codes += _ZERO
+    return from_codes(codes)
+
+
+def concat(*parts: Part) -> np.ndarray:
+    """문자열 열/상수를 행별로 이어 붙인다
+
+    각 조각의 코드를 행마다 현재 위치(pos)부터 한 번의 인덱싱으로 써 넣으므로
+    조각 수만큼만 반복하고 행 단위 파이썬 루프가 없다.
+    """
+    arrays = [p for p in parts if isinstance(p, np.ndarray)]
+    if not arrays:
+        return np.array("".join(parts))
+    n = len(arrays[0])
+    prepared = []
+    total = 0
+    for p in parts:
+        if isinstance(p, np.ndarray):
+            codes, lengths = as_codes(p.astype(str, copy=False))
+            prepared.append((codes, lengths))
+            total += codes.shape[1]
+        elif p:
+            prepared.append((np.frombuffer(p.encode("utf-32-le"), dtype=np.uint32), None))
+            total += len(p)
+
+    out = np.zeros(n * max(total, 1), dtype=np.uint32)
+    pos = np.arange(n, dtype=np.int64) * max(total, 1)
+    for codes, lengths in prepared:
+        width = codes.shape[-1]
+        if lengths is None:
+            # 상수 조각: 모든 행의 같은 상대 위치에 그대로 쓴다
+            out[pos[:, None] + np.arange(width)] = codes
+            pos += width
+            continue
+        if width == 0:
+            continue
+        dest = pos[:, None] + np.arange(width)
+        if (lengths == width).all():
+            out[dest] = codes
+        else:
+            # 행마다 길이가 다르면 유효한 칸(마스크)만 한 번에 옮긴다
+            valid = codes != 0
+            out[dest[valid]] = codes[valid]
+        pos += lengths
+    return from_codes(out.reshape(n, max(total, 1)))
@@ -0,0 +1,92 @@
+import threading
+from typing import Optional
+
+from .constraint_parser import Parser
+from .executor import ParseExecutor
+from .parse_cache import CachedParser
+from .system_prompt_processor import SystemPromptProcessor
+
+# 프로세스 전역으로 한 번만 만들어 재사용하는 파서/프로세서
+# (생성 후에는 내부 상태를 바꾸지 않으므로 여러 스레드가 동시에 써도 안전)
+_lock = threading.Lock()
+_parser: Optional[CachedParser] = None
+_prompt_processor: Optional[SystemPromptProcessor] = None
+_executor: Optional[ParseExecutor] = None
+
+
+def get_parser() -> CachedParser:
+    """개별 필드 제약 추론용 Parser (constraint_parser, 결과 캐시 포함)"""
+    global _parser
+    if _parser is None:
+        with _lock:
+            if _parser is None:
+                _parser = CachedParser(Parser())
+    return _parser
+
+
+def get_prompt_processor() -> SystemPromptProcessor:
+    """전체 필드 세트 자동 생성용 SystemPromptProcessor"""
+    global _prompt_processor
+    if _prompt_processor is None:
+        with _lock:
+            if _prompt_processor is None:
+                _prompt_processor = SystemPromptProcessor()
+    return _prompt_processor
+
+
+# 타입별 정규식이 대부분 첫 사용 시 컴파일되므로, 시작 시 대표 프롬프트를 한 번씩 통과시킨다
+_WARM_UP_PROMPTS = (
+    "나이는 20 이상 60 이하, 소수점 1자리, nullable 10%",
+    "age between 18 and 65, 10개 중 2개 빈값",
+    "비밀번호는 최소 10자 이상이고 대문자 2개, 숫자와 특수문자가 포함되어야 해",
+    "Password minimum 12 characters with uppercase, lowercase, numbers, symbols",
+    "전화번호는 010-1234-5678 형식", "phone format +1 (###) ###-####",
+    "between 2023-01-05 and 2023-12-31", "생년월일 yyyy-mm-dd 형식",
+    "시간은 09:00부터 18:00까지", "time 12 hour format",
+    "이메일은 naver.com만", "email only @gmail.com",
+    "url은 https로 시작", "프로필 이미지 200x200 png",
+    "state: California, New York", "국가는 한국, 미국, 일본",
+    "신용카드 번호 비자카드", "credit card type Mastercard",
+    "소개글 3~5문단", "between 2 and 4 paragraphs",
+    "성이 김씨인 한국 이름", "쇼핑몰에서 사용자 등록을 위한 정보",
+    "Create a user table with name, email, password, and phone number",
+)
+
+
+def warm_up() -> None:
+    """서버 시작 시 인스턴스를 미리 만들고 정규식을 컴파일해 첫 요청 지연을 없앤다
+
+    gunicorn에서는 부모 프로세스에서 호출되어 fork 후 워커들이 결과를 공유한다.
+    """
+    parser = get_parser()
+    processor = get_prompt_processor()
+    for prompt in _WARM_UP_PROMPTS:
+        try:
+            # 결과 캐시는 채우지 않도록 캐시 뒤의 Parser를 직접 호출
+            parser.parser.parse_field_constraint(prompt)
+            processor.process_system_prompt(prompt)
+        except Exception:
+            pass
+
+
+def get_executor() -> Optional[ParseExecutor]:
+    """프로세스 풀 실행기 (PARSE_EXECUTOR=process가 아니면 None → 요청 스레드에서 파싱)"""
+    return _executor
+
+
+def start_executor() -> Optional[ParseExecutor]:
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ParseExecutor.from_env()
+            if _executor is not None:
+                _executor.warm_up()
+    return _executor
+
+
+def stop_executor() -> None:
+    global _executor
+    with _lock:
+        if _executor is not None:
+            _executor.shutdown()
+            _executor = None
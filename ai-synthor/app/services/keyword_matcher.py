@@ -0,0 +1,74 @@
+from collections import deque
+from typing import Dict, Iterable, List, Tuple
+
+
+class KeywordMatcher:
+    """여러 키워드를 한 번의 스캔으로 찾는 Aho-Corasick 오토마톤
+
+    - 생성 시 (키워드, 값) 목록으로 오토마톤을 한 번만 만든다
+    - find_all()은 텍스트를 한 번 훑으면서 키워드별 첫 등장 위치를 모두 반환한다
+    - 탐색 비용은 사전 크기가 아니라 텍스트 길이(+ 매칭 수)에 비례한다
+    """
+
+    def __init__(self, items: Iterable[Tuple[str, str]]):
+        # 키워드 목록 (등록 순서 = 동률일 때의 우선순위)
+        self.entries: List[Tuple[str, str]] = []
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        # 상태별 출력: 해당 상태에서 끝나는 키워드 인덱스 (fail 체인 포함)
+        self._out: List[Tuple[int, ...]] = [()]
+
+        own: List[List[int]] = [[]]
+        for keyword, value in items:
+            if not keyword:
+                continue
+            idx = len(self.entries)
+            self.entries.append((keyword, value))
+            state = 0
+            for ch in keyword:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    own.append([])
+                state = nxt
+            own[state].append(idx)
+
+        # BFS로 fail 링크와 출력 집합 계산
+        self._out = [tuple(o) for o in own]
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                f = self._fail[state]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                cand = self._goto[f].get(ch, 0)
+                self._fail[nxt] = cand if cand != nxt else 0
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def find_all(self, text: str) -> List[Tuple[str, int, str]]:
+        """(값, 위치, 키워드) 후보를 키워드별 첫 등장 위치 기준으로 반환"""
+        goto, fail, out, entries = self._goto, self._fail, self._out, self.entries
+        seen = set()
+        found: List[Tuple[int, str, int, str]] = []
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for idx in out[state]:
+                if idx in seen:
+                    continue
+                seen.add(idx)
+                keyword, value = entries[idx]
+                found.append((idx, value, i - len(keyword) + 1, keyword))
+        # 등록 순서로 되돌려 기존 후보 목록과 같은 순서를 유지
+        found.sort()
+        return [(value, pos, keyword) for _, value, pos, keyword in found]
@@ -0,0 +1,125 @@
+import re
+import sys
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from .keyword_matcher import KeywordMatcher
+from .patterns import PATTERNS
+
+
+class Lexicon(Mapping):
+    """키워드 → 타입 사전을 한 번 컴파일한 불변 구조
+
+    - 키워드/타입 문자열은 intern되어 여러 사전(뷰)이 같은 객체를 공유한다
+    - dict처럼 읽을 수 있지만(Mapping) 수정할 수 없다
+    - view()는 이 사전을 원본으로 하는 처리기별 부분 사전을 만든다 (키워드 순서 + 타입이 다른 키워드만 명시)
+    - matcher()는 Aho-Corasick 오토마톤을 처음 요청할 때 한 번만 만든다
+    """
+
+    def __init__(self, items: Iterable[Tuple[str, str]]):
+        self._data = MappingProxyType({sys.intern(k): sys.intern(v) for k, v in items})
+        self._matchers: Dict[bool, KeywordMatcher] = {}
+
+    def view(self, keywords: Iterable[str], overrides: Optional[Mapping] = None) -> "Lexicon":
+        """keywords 순서대로 이 사전의 타입을 쓰는 부분 사전 (overrides의 키워드는 그 타입으로)
+
+        원본에도 overrides에도 없는 키워드는 KeyError — 처리기 사전이 원본에서 몰래 벗어나지 않도록.
+        """
+        overrides = overrides or {}
+        return Lexicon((k, overrides[k] if k in overrides else self._data[k]) for k in keywords)
+
+    # ---------- Mapping ----------
+    def __getitem__(self, keyword: str) -> str:
+        return self._data[keyword]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, keyword) -> bool:
+        return keyword in self._data
+
+    def get(self, keyword: str, default: Optional[str] = None) -> Optional[str]:
+        return self._data.get(keyword, default)
+
+    def keys(self):
+        return self._data.keys()
+
+    def values(self):
+        return self._data.values()
+
+    def items(self):
+        return self._data.items()
+
+    # ---------- 매칭 ----------
+    def matcher(self, lowercase: bool = False) -> KeywordMatcher:
+        """키워드 전체에 대한 KeywordMatcher (lowercase=True면 소문자 키워드로 구성)"""
+        m = self._matchers.get(lowercase)
+        if m is None:
+            pairs = self._data.items()
+            if lowercase:
+                pairs = ((k.lower(), v) for k, v in pairs)
+            m = self._matchers.setdefault(lowercase, KeywordMatcher(pairs))
+        return m
+
+
+class MentionMatcher:
+    r"""여러 이름을 단어 경계((?<!\w) … (?!\w)) 안에서 한 번의 스캔으로 찾는 정규식 (대소문자 무시)
+
+    - 이름들을 긴 것부터 하나의 alternation으로 묶어 생성 시 한 번만 컴파일한다
+    - 전방탐색 안에서 캡처하므로 매치가 글자를 소비하지 않아 겹치는 언급도 모두 찾는다
+      (같은 위치에서 시작하는 이름은 경계를 만족하는 가장 긴 것 하나)
+    """
+
+    def __init__(self, names: Iterable[str]):
+        self.names: Tuple[str, ...] = tuple(dict.fromkeys(n for n in names if n))
+        self._by_key: Dict[str, List[str]] = {}
+        for name in self.names:
+            self._by_key.setdefault(name.lower(), []).append(name)
+        alternation = "|".join(re.escape(n) for n in sorted(self.names, key=len, reverse=True))
+        self._pattern = PATTERNS.compile(r"(?<!\w)(?=(" + alternation + r")(?!\w))", re.IGNORECASE)
+
+    def find_all(self, text: str) -> List[Tuple[str, int]]:
+        """(이름, 위치) 목록 (텍스트 순서)"""
+        found: List[Tuple[str, int]] = []
+        for m in self._pattern.finditer(text):
+            found.extend((name, m.start()) for name in self._by_key.get(m.group(1).lower(), ()))
+        return found
+
+
+class AliasIndex:
+    """영문 값 → 별칭(한국어/영문) 역색인을 한 번 만들어 둔 불변 구조
+
+    - values: 검사 순서대로 고정한 영문 값 (set이면 현재 프로세스의 순회 순서 그대로)
+    - aliases[value]: 그 값으로 매핑되는 별칭들 (원본 사전 순서)
+    - mentioned(text): 영문 값(대소문자 무시)과 별칭(원문 그대로)을 KeywordMatcher로 한 번씩 훑어
+      언급된 값 집합을 반환한다. 비용은 사전 크기가 아니라 텍스트 길이에 비례한다
+    - boundary_matcher: 값·별칭을 단어 경계 안에서만 찾는 MentionMatcher (지역/국가 언급 스캔용)
+    """
+
+    def __init__(self, mapping: Mapping, values: Iterable[str]):
+        self.values: Tuple[str, ...] = tuple(values)
+        wanted = set(self.values)
+        self.alias_items: Tuple[Tuple[str, str], ...] = tuple(
+            (alias, value) for alias, value in mapping.items() if value in wanted
+        )
+        grouped: Dict[str, List[str]] = {v: [] for v in self.values}
+        for alias, value in self.alias_items:
+            grouped[value].append(alias)
+        self.aliases = MappingProxyType({v: tuple(a) for v, a in grouped.items()})
+        self._to_value = MappingProxyType(dict(self.alias_items))
+        self._value_matcher = KeywordMatcher((v.lower(), v) for v in self.values)
+        self._alias_matcher = KeywordMatcher(self.alias_items)
+        self.boundary_matcher = MentionMatcher(self.values + tuple(alias for alias, _ in self.alias_items))
+
+    def resolve(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        """별칭 → 영문 값 (이 색인의 값으로 매핑되는 별칭만)"""
+        return self._to_value.get(name, default)
+
+    def mentioned(self, text: str) -> Set[str]:
+        found = {value for value, _, _ in self._value_matcher.find_all(text.lower())}
+        found.update(value for value, _, _ in self._alias_matcher.find_all(text))
+        return found
@@ -1,4 +1,6 @@
 # 한/영 필드·값 매핑
+from .constants_types import SUPPORTED_CARD_TYPES, SUPPORTED_COUNTRIES, SUPPORTED_STATES
+from .lexicon import AliasIndex, Lexicon
 
 KOR_TO_ENG_FIELD = {
     # korean_full_name
@@ -509,4 +511,410 @@ EN_TO_TYPE_FIELD = {
     "nullable": "datetime",
     # 등급/점수 관련 키워드
     "score": "number", "grade": "number", "rating": "number",
-}
\ No newline at end of file
+}
+
+
+# 처리기별 사전은 위 두 사전(원본)의 뷰다: 키워드 목록(처리기가 훑는 순서)과 원본과 타입이 다른 키워드(OVERRIDES)만 적는다.
+# 타입은 OVERRIDES에 없으면 원본에서 가져오므로, 처리기 사이의 차이는 OVERRIDES에만 드러난다.
+# (예: korean_processor의 '성' → korean_last_name, english_processor의 'time' → time)
+
+# korean_processor (자연어 → 필드 세트, 한국어)
+KOREAN_PROCESSOR_KEYWORDS = (
+    # korean_full_name
+    "전체 이름", "이름 전체", "성명", "풀네임", "전성 이름", "이름", "이름 전부", "이름 풀", "이름(전체)", "이름(풀)", "이름 전체명",
+    "이름 풀네임",
+    # korean_last_name
+    "성", "성씨", "이 성", "김 성", "박 성", "최 성", "성(이)", "성(김)", "성(박)", "성(최)",
+    # korean_full_name
+    "이씨", "김씨", "박씨", "최씨",
+    # korean_first_name
+    "이름(이)", "이름(김)", "이름(박)", "이름(최)", "이름만", "이름(한글)", "이름(영문)",
+    # korean_address
+    "주소", "전체 주소", "집 주소", "거주지", "거주 주소", "거주지 주소", "거주지 전체",
+    # korean_street_address
+    "도로명 주소", "도로 주소", "도로명", "도로 전체", "도로명 전체", "도로명주소",
+    # korean_city
+    "도시", "도시 이름", "사는 도시", "거주 도시", "시",
+    # korean_state
+    "시 이름",
+    # korean_city
+    "도시 이름(한글)",
+    # korean_state
+    "시도", "도", "시/도", "시 도", "도 이름",
+    # korean_country
+    "국가", "나라", "거주 국가", "사는 나라",
+    # korean_postal_code
+    "우편번호", "우편 코드", "우편 번호", "우편코드",
+    # korean_phone
+    "전화번호", "휴대폰 번호", "핸드폰 번호", "연락처", "휴대폰", "핸드폰", "전화",
+    # korean_company_name
+    "회사명", "회사 이름", "근무처", "근무 회사",
+    # korean_job_title
+    "직책", "직위", "포지션", "직무",
+    # korean_department_corporate
+    "부서", "소속", "소속 부서", "소속팀",
+    # korean_product_name
+    "제품명", "상품명", "제품 이름", "상품 이름",
+    # korean_product_category
+    "제품 카테고리", "상품 카테고리", "제품 종류", "상품 종류",
+    # korean_catch_phrase
+    "캐치프레이즈", "슬로건", "표어",
+    # korean_product_description
+    "제품 설명", "상품 설명", "제품 소개", "상품 소개",
+    # korean_language
+    "언어", "사용 언어", "쓰는 언어",
+    # korean_color
+    "색상", "컬러", "색",
+    # username
+    "사용자명", "유저명", "계정명", "계정 이름", "유저 이름",
+    # password
+    "비밀번호", "패스워드", "비번",
+    # email_address
+    "이메일", "이메일 주소", "메일", "메일 주소",
+    # domain_name
+    "도메인", "도메인 이름",
+    # url
+    "URL", "주소(URL)", "링크", "웹주소",
+    # mac_address
+    "MAC 주소",
+    # ip_v4_address
+    "IPv4 주소",
+    # ip_v6_address
+    "IPv6 주소",
+    # user_agent
+    "유저 에이전트",
+    # avatar
+    "아바타", "프로필 사진", "프로필 이미지", "프로필 그림", "프로필 아이콘", "프로필 그림 파일", "프로필 캐릭터", "프로필 사진 파일", "프로필 얼굴",
+    "캐릭터 이미지", "캐릭터 그림", "캐릭터 아이콘", "사용자 아이콘", "사용자 이미지", "사용자 사진", "계정 아이콘", "계정 이미지", "계정 사진",
+    "계정 프로필", "아바타 이미지", "아바타 사진", "아바타 이미지 파일", "프로필 avatar", "캐릭터 avatar", "유저 avatar",
+    "계정 avatar",
+    # app_name
+    "앱 이름", "어플 이름",
+    # app_version
+    "버전", "앱 버전",
+    # device_model
+    "기기 모델",
+    # device_brand
+    "기기 브랜드",
+    # device_os
+    "OS", "운영체제",
+    # credit_card_number
+    "카드번호", "신용카드 번호",
+    # credit_card_type
+    "카드 종류", "카드 타입", "VISA MASTER 종류",
+    # currency
+    "통화", "화폐 단위",
+    # iban
+    "IBAN", "IBAN 코드",
+    # swift_bic
+    "SWIFT", "SWIFT 코드",
+    # paragraphs
+    "문단", "단락", "설명 글",
+    # datetime
+    "날짜", "일시",
+    # time
+    "시간",
+    # latitude
+    "위도",
+    # longitude
+    "경도",
+    # number
+    "숫자", "1과 100 사이 숫자", "1~100 숫자", "나이", "연령",
+)
+KOREAN_PROCESSOR_OVERRIDES = {
+    "성": "korean_last_name",
+    "성씨": "korean_last_name",
+    "이 성": "korean_last_name",
+    "김 성": "korean_last_name",
+    "박 성": "korean_last_name",
+    "최 성": "korean_last_name",
+    "성(이)": "korean_last_name",
+    "성(김)": "korean_last_name",
+    "성(박)": "korean_last_name",
+    "성(최)": "korean_last_name",
+    "도": "korean_state",
+    "시간": "time",
+}
+
+# english_processor (자연어 → 필드 세트, 영어)
+ENGLISH_PROCESSOR_KEYWORDS = (
+    # full_name
+    "full name", "fullname", "name",
+    # first_name
+    "first name", "given name",
+    # last_name
+    "last name", "surname",
+    # phone
+    "phone", "phone number",
+    # address
+    "address", "full address",
+    # street_address
+    "street address", "road address",
+    # city
+    "city",
+    # state
+    "state", "province", "region",
+    # country
+    "country", "nation",
+    # postal_code
+    "postal code", "zip code",
+    # company_name
+    "company name", "company",
+    # job_title
+    "job title", "position",
+    # department_corporate
+    "department", "corporate department",
+    # department_retail
+    "retail department",
+    # product_name
+    "product name",
+    # product_category
+    "product category",
+    # catch_phrase
+    "catch phrase", "slogan",
+    # product_description
+    "product description",
+    # language
+    "language",
+    # color
+    "color",
+    # username
+    "username", "user name",
+    # password
+    "password",
+    # email_address
+    "email", "email address",
+    # domain_name
+    "domain name",
+    # url
+    "url", "link", "website",
+    # mac_address
+    "mac address",
+    # ip_v4_address
+    "ipv4 address",
+    # ip_v6_address
+    "ipv6 address",
+    # user_agent
+    "user agent",
+    # avatar
+    "avatar", "profile image", "profile picture", "profile pic", "profile photo", "profile icon",
+    "profile graphic", "profile figure", "profile character", "user icon", "user image",
+    "user photo", "account icon", "account image", "account picture", "character image",
+    "character icon", "character graphic", "profile thumbnail", "profile portrait", "avatar image",
+    "avatar picture", "avatar photo", "avatar icon", "avatar image file", "avatar jpg",
+    "avatar png", "profile avatar", "character avatar", "user avatar", "account avatar",
+    # app_name
+    "app name",
+    # app_version
+    "app version",
+    # device_model
+    "device model",
+    # device_brand
+    "device brand",
+    # device_os
+    "device os", "os",
+    # credit_card_number
+    "credit card number",
+    # credit_card_type
+    "credit card type",
+    # product_price
+    "product price",
+    # currency
+    "currency",
+    # iban
+    "iban",
+    # swift_bic
+    "swift bic",
+    # paragraphs
+    "paragraph", "paragraphs",
+    # datetime
+    "datetime", "date",
+    # time
+    "time",
+    # latitude
+    "latitude",
+    # longitude
+    "longitude",
+    # number
+    "number", "number between 1 and 100",
+)
+ENGLISH_PROCESSOR_OVERRIDES = {
+    "time": "time",
+}
+
+# field_constraint_parser (영어)
+FIELD_PARSER_EN_KEYWORDS = (
+    # full_name
+    "full name",
+    # first_name
+    "first name",
+    # last_name
+    "last name",
+    # phone
+    "phone", "phone number",
+    # address
+    "address",
+    # street_address
+    "street address",
+    # city
+    "city",
+    # state
+    "state",
+    # country
+    "country",
+    # postal_code
+    "postal code", "zip code",
+    # company_name
+    "company name",
+    # job_title
+    "job title",
+    # department_corporate
+    "department",
+    # product_name
+    "product name",
+    # product_category
+    "product category",
+    # catch_phrase
+    "catch phrase",
+    # product_description
+    "product description",
+    # language
+    "language",
+    # color
+    "color",
+    # username
+    "username", "user name",
+    # password
+    "password",
+    # email_address
+    "email", "email address",
+    # domain_name
+    "domain", "domain name",
+    # url
+    "url",
+    # mac_address
+    "mac address",
+    # ip_v4_address
+    "ipv4 address",
+    # ip_v6_address
+    "ipv6 address",
+    # user_agent
+    "user agent",
+    # avatar
+    "avatar",
+    # app_name
+    "app name",
+    # app_version
+    "app version",
+    # device_model
+    "device model",
+    # device_brand
+    "device brand",
+    # device_os
+    "device os",
+    # credit_card_number
+    "credit card number",
+    # credit_card_type
+    "credit card type",
+    # product_price
+    "product price",
+    # currency
+    "currency",
+    # iban
+    "iban",
+    # swift_bic
+    "swift bic",
+    # paragraphs
+    "paragraphs",
+    # datetime
+    "datetime",
+    # time
+    "time",
+    # latitude
+    "latitude",
+    # longitude
+    "longitude",
+    # number
+    "number between 1 100", "number",
+    # korean_full_name
+    "korean_full_name",
+    # korean_first_name
+    "korean_first_name",
+    # korean_last_name
+    "korean_last_name",
+    # korean_phone
+    "korean_phone",
+    # korean_address
+    "korean_address",
+    # korean_street_address
+    "korean_street_address",
+    # korean_city
+    "korean_city",
+    # korean_state
+    "korean_state",
+    # korean_country
+    "korean_country",
+    # korean_postal_code
+    "korean_postal_code",
+    # korean_company_name
+    "korean_company_name",
+    # korean_job_title
+    "korean_job_title",
+    # korean_department_corporate
+    "korean_department_corporate",
+    # korean_department_retail
+    "korean_department_retail",
+    # korean_product_name
+    "korean_product_name",
+    # korean_product_category
+    "korean_product_category",
+    # korean_catch_phrase
+    "korean_catch_phrase",
+    # korean_product_description
+    "korean_product_description",
+    # korean_language
+    "korean_language",
+    # korean_color
+    "korean_color",
+)
+FIELD_PARSER_EN_OVERRIDES = {
+    "domain": "domain_name",
+    "time": "time",
+    "number between 1 100": "number",
+    "korean_first_name": "korean_first_name",
+    "korean_last_name": "korean_last_name",
+    "korean_phone": "korean_phone",
+    "korean_address": "korean_address",
+    "korean_street_address": "korean_street_address",
+    "korean_city": "korean_city",
+    "korean_state": "korean_state",
+    "korean_country": "korean_country",
+    "korean_postal_code": "korean_postal_code",
+    "korean_company_name": "korean_company_name",
+    "korean_job_title": "korean_job_title",
+    "korean_department_corporate": "korean_department_corporate",
+    "korean_department_retail": "korean_department_retail",
+    "korean_product_name": "korean_product_name",
+    "korean_product_category": "korean_product_category",
+    "korean_catch_phrase": "korean_catch_phrase",
+    "korean_product_description": "korean_product_description",
+    "korean_language": "korean_language",
+    "korean_color": "korean_color",
+}
+
+
+# 필드 사전은 모듈 로드 시 한 번만 불변 Lexicon으로 컴파일한다 (원본 dict는 남기지 않음)
+KOR_TO_ENG_FIELD = Lexicon(KOR_TO_ENG_FIELD.items())
+EN_TO_TYPE_FIELD = Lexicon(EN_TO_TYPE_FIELD.items())
+KOREAN_PROCESSOR_FIELD = KOR_TO_ENG_FIELD.view(KOREAN_PROCESSOR_KEYWORDS, KOREAN_PROCESSOR_OVERRIDES)
+# field_constraint_parser의 한국어 사전은 korean_processor 사전에서 나이/연령만 빠진 것
+FIELD_PARSER_KOR_FIELD = KOR_TO_ENG_FIELD.view(
+    (k for k in KOREAN_PROCESSOR_KEYWORDS if k not in ("나이", "연령")), KOREAN_PROCESSOR_OVERRIDES
+)
+ENGLISH_PROCESSOR_FIELD = EN_TO_TYPE_FIELD.view(ENGLISH_PROCESSOR_KEYWORDS, ENGLISH_PROCESSOR_OVERRIDES)
+FIELD_PARSER_EN_FIELD = EN_TO_TYPE_FIELD.view(FIELD_PARSER_EN_KEYWORDS, FIELD_PARSER_EN_OVERRIDES)
+
+# 값 사전의 역색인 (영문 값 → 별칭). 카드사/지역/국가 extractor가 요청마다 KOR_TO_ENG_VALUE를 훑지 않도록 한 번만 만든다
+CARD_TYPE_ALIASES = AliasIndex(KOR_TO_ENG_VALUE, SUPPORTED_CARD_TYPES)
+STATE_ALIASES = AliasIndex(KOR_TO_ENG_VALUE, SUPPORTED_STATES)
+COUNTRY_ALIASES = AliasIndex(KOR_TO_ENG_VALUE, SUPPORTED_COUNTRIES)
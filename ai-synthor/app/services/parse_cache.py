@@ -0,0 +1,157 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+# 전각 ASCII(！~～) → 반각, 전각 공백 → 일반 공백
+_FULLWIDTH_TO_ASCII = {c: c - 0xFEE0 for c in range(0xFF01, 0xFF5F)}
+_FULLWIDTH_TO_ASCII[0x3000] = 0x20
+
+
+def normalize_prompt(text: str) -> str:
+    """캐시 키용 프롬프트 정규화
+
+    - 전각 영숫자/기호를 반각으로 접는다
+    - 연속 공백(탭/개행 포함)을 한 칸으로 줄이고 양끝 공백을 제거한다
+    - 대소문자는 접지 않는다: state/country/email 추출기가 대소문자를 구분하므로
+      접으면 결과가 달라진다 (예: "only France" → country, "only france" → None)
+    """
+    return " ".join(text.translate(_FULLWIDTH_TO_ASCII).split())
+
+
+class ParseResultCache:
+    """정규화된 프롬프트 → 파싱 결과를 보관하는 LRU + TTL 캐시
+
+    - maxsize를 넘으면 가장 오래 쓰지 않은 항목부터 제거 (evictions)
+    - ttl(초)이 지나면 다음 조회 때 만료 처리 (expirations)
+    - 저장/반환 시 모두 깊은 복사를 하므로 호출자가 결과를 수정해도 캐시는 안전
+    """
+
+    def __init__(self, maxsize: int = 4096, ttl: Optional[float] = 3600.0):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return False, None
+            stored_at, value = entry
+            if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+                del self._data[key]
+                self.expirations += 1
+                self.misses += 1
+                return False, None
+            self._data.move_to_end(key)
+            self.hits += 1
+        return True, copy.deepcopy(value)
+
+    def put(self, key: str, value: Any) -> None:
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._data[key] = (time.monotonic(), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+def parse_each(parser, keys: List[str]) -> List[Optional[Dict]]:
+    """keys를 차례로 파싱 (예외가 난 항목은 None)"""
+    results: List[Optional[Dict]] = []
+    for key in keys:
+        try:
+            results.append(parser.parse_field_constraint(key))
+        except Exception:
+            results.append(None)
+    return results
+
+
+class CachedParser:
+    """Parser.parse_field_constraint 앞단에 결과 캐시를 둔 래퍼
+
+    정규화된 프롬프트로 파싱하므로 같은 키는 항상 같은 결과를 가진다.
+    constraint_parser.Parser도 입력을 같은 방식으로 정규화하므로 캐시를 거치지 않은 결과와도 같다.
+    예외가 난 프롬프트는 캐시하지 않는다.
+    캐시 조회(lookup)와 저장(remember)을 나눠 두어, 미스만 다른 곳(프로세스 풀 등)에서 파싱해도 같은 규칙을 쓴다.
+    """
+
+    def __init__(self, parser, cache: Optional[ParseResultCache] = None):
+        self.parser = parser
+        self.cache = cache if cache is not None else ParseResultCache()
+
+    def lookup(self, text: str) -> Tuple[str, bool, Any]:
+        """(정규화 키, 적중 여부, 결과)"""
+        key = normalize_prompt(text)
+        found, result = self.cache.get(key)
+        return key, found, result
+
+    def remember(self, key: str, result: Dict) -> Dict:
+        self.cache.put(key, result)
+        return result
+
+    def parse_field_constraint(self, text: str) -> Dict:
+        key, found, result = self.lookup(text)
+        if found:
+            return result
+        return self.remember(key, self.parser.parse_field_constraint(key))
+
+    def lookup_batch(self, prompts: List[str]) -> Tuple[List[str], List[Optional[Dict]], List[int]]:
+        """(정규화 키들, 결과 목록(미스 자리는 None), 미스 위치들)"""
+        keys: List[str] = []
+        results: List[Optional[Dict]] = []
+        misses: List[int] = []
+        for i, text in enumerate(prompts):
+            key, found, result = self.lookup(text)
+            keys.append(key)
+            results.append(result if found else None)
+            if not found:
+                misses.append(i)
+        return keys, results, misses
+
+    def remember_batch(
+        self, keys: List[str], results: List[Optional[Dict]], misses: List[int], parsed: List[Optional[Dict]],
+    ) -> List[Optional[Dict]]:
+        """미스 자리를 parsed로 채우고 성공한 항목만 캐시한다"""
+        for i, result in zip(misses, parsed):
+            results[i] = result if result is None else self.remember(keys[i], result)
+        return results
+
+    def parse_batch(self, prompts: List[str]) -> List[Optional[Dict]]:
+        """배치 파싱 (실패한 항목은 None)"""
+        keys, results, misses = self.lookup_batch(prompts)
+        return self.remember_batch(keys, results, misses, parse_each(self.parser, [keys[i] for i in misses]))
+
+    def stats(self) -> Dict[str, Any]:
+        return self.cache.stats()
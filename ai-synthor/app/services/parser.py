@@ -1,5 +1,7 @@
 # app/services/parser.py
 import re
+from .patterns import PATTERNS
+from .signals import AT, DATE_SEP, DIGIT, EMAIL_PROVIDER, HANGUL, scan_signals
 from typing import Dict
 from .detectors import FieldDetector
 from .nullables import NullablePercentExtractor
@@ -24,6 +26,62 @@ from .constraints.number_between import NumberBetweenExtractor
 from .constraints.korean_full_name import KoreanFullNameExtractor, KoreanLastNameExtractor
 from .constraints.email_address import EmailAddressConstraint
 
+# 나이/연령 관련 키워드가 있으면 datetime으로 인식하지 않음
+_AGE_KEYWORDS = ('나이', '연령', '연령대', '나이대', '세', '살', 'age')
+
+# 이메일 도메인/패턴이 있으면 datetime으로 인식하지 않음 ('@' 또는 메일 서비스 이름이 있어야 매칭 가능)
+_EMAIL_PATTERNS = (
+    r'@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}',  # @domain.com
+    r'@[a-zA-Z0-9.-]+형',  # @domain형
+    r'@[a-zA-Z0-9.-]+(?:로|으로)\b',  # @domain로, @domain으로
+    r'\b(?:naver\.com|gmail\.com|yahoo\.com|hotmail\.com|outlook\.com|daum\.net|nate\.com|hanmail\.net|icloud\.com|protonmail\.com)\b',  # 일반 도메인
+    r'\b(?:naver|gmail|yahoo|hotmail|outlook|daum|nate|hanmail|icloud|protonmail)\s+account\b',  # 도메인 account
+    r'\b(?:naver|gmail|yahoo|hotmail|outlook|daum|nate|hanmail|icloud|protonmail)\s+mail\b',  # 도메인 mail
+    r'\b(?:naver|gmail|yahoo|hotmail|outlook|daum|nate|hanmail|icloud|protonmail)\s+email\b',  # 도메인 email
+)
+
+# 한국어 이름 패턴이 있으면 datetime으로 인식하지 않음 (한글이 있어야 매칭 가능)
+_KOREAN_NAME_PATTERNS = (
+    r'성이\s*[가-힣]{1,2}',  # 성이 김, 성이 이, 성이 박 등
+    r'성씨가\s*[가-힣]{1,2}',  # 성씨가 김, 성씨가 이 등
+    r'[가-힣]{1,2}씨',  # 김씨, 이씨, 박씨 등
+    r'[가-힣]{1,2}\s*성',  # 김 성, 이 성 등
+)
+
+# 날짜/포맷 지시어
+_DATETIME_INDICATORS = (
+    r'\b(?:format|date\s*format|m/d/yyyy|mm/dd/yyyy|d/m/yyyy|yyyy-mm-dd|yyyy-mm)\b',
+    r'\b(?:e\.?g\.?|example|sample|예시는|샘플|예|샘)[:\s]',
+    r'\d{4}[-/.]\d{1,2}[-/.]\d{1,2}',
+    r'\d{1,2}[-/.]\d{1,2}[-/.]\d{4}',
+    r'\d{2}[-/.]\d{1,2}[-/.]\d{1,2}',
+    r'\b(?:from|to|through|between|range|기간|조회기간|시작일|종료일|start|end)\b',
+    r'\b(?:nullable|빈값|결측|누락|use|포맷|형식|fmt)\b',
+    r'\b(?:d/m/yyyy|m/d/yyyy|mm/dd/yyyy|yyyy-mm-dd|yyyy-mm)\b',
+    r'\b(?:only|같은|형식|포맷만|설정)\b',
+)
+
+# 날짜 패턴이 있으면 무조건 datetime (숫자와 구분자가 있어야 매칭 가능)
+_DATE_PATTERNS = (
+    r'\d{4}[-/.]\d{1,2}[-/.]\d{1,2}',  # 2023-07-09, 2023/07/09
+    r'\d{1,2}[-/.]\d{1,2}[-/.]\d{4}',  # 25/12/2023, 12/25/2023
+    r'\d{2}[-/.]\d{1,2}[-/.]\d{1,2}',  # 23/12/25
+    r'\d{4}[-/.]\d{1,2}',  # 2023-01, 2023.1
+    r'\d+[-/.]\d+[-/.]\d+',  # 숫자-숫자-숫자
+)
+
+
+def _any_of(patterns, flags: int = 0):
+    """패턴 목록을 하나의 alternation으로 묶는다 (any(p.search) 와 같은 판정을 한 번의 스캔으로)"""
+    return PATTERNS.compile("|".join(f"(?:{p})" for p in patterns), flags)
+
+
+_EMAIL_RE = _any_of(_EMAIL_PATTERNS, re.I)
+_KOREAN_NAME_RE = _any_of(_KOREAN_NAME_PATTERNS)
+_DATETIME_INDICATOR_RE = _any_of(_DATETIME_INDICATORS, re.I)
+_DATE_RE = _any_of(_DATE_PATTERNS)
+
+
 class Parser:
     def __init__(self):
         self.detector = FieldDetector()
@@ -45,85 +103,39 @@ class Parser:
             reg.register(ext)
         return reg
 
-    def parse_field_constraint(self, text: str) -> Dict:
+    def _is_datetime_text(self, text: str, signals: int) -> bool:
+        """datetime으로 강제할지 판단 (우선순위: DatePattern > EmailDomain/나이/한국어 이름 > DateFormat)
+
+        정규식 묶음은 필요한 신호 비트가 켜져 있을 때만, 결론이 나면 바로 멈춘다.
+        """
+        # 날짜 패턴(숫자 + 구분자)이 있으면 무조건 datetime
+        if signals & DIGIT and signals & DATE_SEP:
+            if _DATE_RE.search(text):
+                return True
+
+        # 날짜/포맷 지시어가 없으면 datetime 아님
+        if not _DATETIME_INDICATOR_RE.search(text):
+            return False
+
         # 나이/연령 관련 키워드가 있으면 datetime으로 인식하지 않음
-        age_keywords = ['나이', '연령', '연령대', '나이대', '세', '살', 'age']
-        has_age_keyword = any(keyword in text for keyword in age_keywords)
-        
-        # 이메일 도메인 패턴이 있으면 datetime으로 인식하지 않음
-        email_domain_patterns = [
-            r'@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}',  # @domain.com
-            r'@[a-zA-Z0-9.-]+형',  # @domain형
-            r'\b(?:naver\.com|gmail\.com|yahoo\.com|hotmail\.com|outlook\.com|daum\.net|nate\.com|hanmail\.net|icloud\.com|protonmail\.com)\b',  # 일반 도메인
-            r'\b(?:naver|gmail|yahoo|hotmail|outlook|daum|nate|hanmail|icloud|protonmail)\s+account\b',  # 도메인 account
-            r'\b(?:naver|gmail|yahoo|hotmail|outlook|daum|nate|hanmail|icloud|protonmail)\s+mail\b',  # 도메인 mail
-            r'\b(?:naver|gmail|yahoo|hotmail|outlook|daum|nate|hanmail|icloud|protonmail)\s+email\b',  # 도메인 email
-        ]
-        has_email_domain = any(re.search(pattern, text, re.I) for pattern in email_domain_patterns)
-        
-        # 한국어 이름 패턴이 있으면 datetime으로 인식하지 않음
-        korean_name_patterns = [
-            r'성이\s*[가-힣]{1,2}',  # 성이 김, 성이 이, 성이 박 등
-            r'성씨가\s*[가-힣]{1,2}',  # 성씨가 김, 성씨가 이 등
-            r'[가-힣]{1,2}씨',  # 김씨, 이씨, 박씨 등
-            r'[가-힣]{1,2}\s*성',  # 김 성, 이 성 등
-        ]
-        has_korean_name = any(re.search(pattern, text) for pattern in korean_name_patterns)
-        
-        # 날짜/포맷 지시어가 있으면 datetime 타입으로 고정 (우선순위: EmailDomain > DateFormat > Nullable% > NumberBetween)
-        datetime_indicators = [
-            r'\b(?:format|date\s*format|m/d/yyyy|mm/dd/yyyy|d/m/yyyy|yyyy-mm-dd|yyyy-mm)\b',
-            r'\b(?:e\.?g\.?|example|sample|예시는|샘플|예|샘)[:\s]',
-            r'\d{4}[-/.]\d{1,2}[-/.]\d{1,2}',
-            r'\d{1,2}[-/.]\d{1,2}[-/.]\d{4}',
-            r'\d{2}[-/.]\d{1,2}[-/.]\d{1,2}',
-            r'\b(?:from|to|through|between|range|기간|조회기간|시작일|종료일|start|end)\b',
-            r'\b(?:nullable|빈값|결측|누락|use|포맷|형식|fmt)\b',
-            r'\b(?:d/m/yyyy|m/d/yyyy|mm/dd/yyyy|yyyy-mm-dd|yyyy-mm)\b',
-            r'\b(?:only|같은|형식|포맷만|설정)\b',
-        ]
-        
-        is_datetime_text = any(re.search(pattern, text, re.I) for pattern in datetime_indicators)
-
-        # 이메일 도메인/패턴이 보이면 datetime 우선순위를 끈다
-        email_first_patterns = [
-            r'@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}',    # @domain.com
-            r'@[a-zA-Z0-9.-]+형',                 # @domain형
-            r'@[a-zA-Z0-9.-]+(?:로|으로)\b',     # @domain로, @domain으로
-            r'\b(?:naver\.com|gmail\.com|yahoo\.com|hotmail\.com|outlook\.com|daum\.net|nate\.com|hanmail\.net|icloud\.com|protonmail\.com)\b',
-        ]
-        if any(re.search(p, text, re.I) for p in email_first_patterns):
-            is_datetime_text = False
-        
-        # 나이 관련 키워드가 있으면 datetime으로 인식하지 않음
-        if has_age_keyword:
-            is_datetime_text = False
-            
-        # 이메일 도메인 패턴이 있으면 datetime으로 인식하지 않음
-        if has_email_domain:
-            is_datetime_text = False
-            
+        if any(keyword in text for keyword in _AGE_KEYWORDS):
+            return False
+
+        # 이메일 도메인/패턴이 보이면 datetime으로 인식하지 않음
+        if signals & (AT | EMAIL_PROVIDER):
+            if _EMAIL_RE.search(text):
+                return False
+
         # 한국어 이름 패턴이 있으면 datetime으로 인식하지 않음
-        if has_korean_name:
-            is_datetime_text = False
-        
-        # 추가 날짜 감지: 날짜 패턴이 있으면 무조건 datetime
-        date_patterns = [
-            r'\d{4}[-/.]\d{1,2}[-/.]\d{1,2}',  # 2023-07-09, 2023/07/09
-            r'\d{1,2}[-/.]\d{1,2}[-/.]\d{4}',  # 25/12/2023, 12/25/2023
-            r'\d{2}[-/.]\d{1,2}[-/.]\d{1,2}',  # 23/12/25
-            r'\d{4}[-/.]\d{1,2}',  # 2023-01, 2023.1
-        ]
-        has_date_pattern = any(re.search(pattern, text) for pattern in date_patterns)
-        
-        # 날짜 패턴이 있으면 무조건 datetime으로 설정
-        if has_date_pattern:
-            is_datetime_text = True
-        
-        # 더 강력한 날짜 감지: 숫자-숫자-숫자 패턴이 있으면 무조건 datetime
-        if re.search(r'\d+[-/.]\d+[-/.]\d+', text):
-            is_datetime_text = True
-        
+        if signals & HANGUL:
+            if _KOREAN_NAME_RE.search(text):
+                return False
+
+        return True
+
+    def parse_field_constraint(self, text: str) -> Dict:
+        is_datetime_text = self._is_datetime_text(text, scan_signals(text))
+
         field = self.detector.detect_first(text)
         if not field:
             if is_datetime_text:
@@ -180,3 +192,44 @@ class Parser:
             return {"type": field, "constraints": constraints, "nullablePercent": nullable}
         else:
             return {"type": field, "constraints": {}, "nullablePercent": nullable}
+
+
+if __name__ == "__main__":
+    # 마이크로 벤치마크: python -m app.services.parser
+    # detect_first 이전 단계(datetime 판별)와 parse_field_constraint 전체의 호출당 지연
+    import time
+    from .test_nlp_end_to_end import test_cases
+
+    email = PATTERNS.compile_many(_EMAIL_PATTERNS, re.I)
+    korean_name = PATTERNS.compile_many(_KOREAN_NAME_PATTERNS)
+    indicators = PATTERNS.compile_many(_DATETIME_INDICATORS, re.I)
+    dates = PATTERNS.compile_many(_DATE_PATTERNS)
+
+    def eager_is_datetime_text(text: str) -> bool:
+        # 게이트 이전 방식: 모든 정규식 묶음을 패턴별로 항상 실행
+        has_age_keyword = any(keyword in text for keyword in _AGE_KEYWORDS)
+        has_email = any([p.search(text) for p in email])
+        has_korean_name = any([p.search(text) for p in korean_name])
+        is_datetime_text = any([p.search(text) for p in indicators])
+        if has_age_keyword or has_email or has_korean_name:
+            is_datetime_text = False
+        if any([p.search(text) for p in dates]):
+            is_datetime_text = True
+        return is_datetime_text
+
+    def per_call_us(fn, rounds: int = 50) -> float:
+        for t in test_cases:
+            fn(t)
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for t in test_cases:
+                fn(t)
+        return (time.perf_counter() - start) / (rounds * len(test_cases)) * 1e6
+
+    parser = Parser()
+    gated = lambda t: parser._is_datetime_text(t, scan_signals(t))
+    assert all(eager_is_datetime_text(t) == gated(t) for t in test_cases)
+
+    print(f"datetime 판별 (전체 실행)  : {per_call_us(eager_is_datetime_text):7.1f} us/call")
+    print(f"datetime 판별 (신호 게이트): {per_call_us(gated):7.1f} us/call")
+    print(f"parse_field_constraint 전체: {per_call_us(parser.parse_field_constraint, 10):7.1f} us/call")
@@ -0,0 +1,79 @@
+import re
+import threading
+import time
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+Pattern = re.Pattern
+Match = re.Match
+
+
+class PatternBank:
+    """모든 extractor가 공유하는 정규식 저장소
+
+    - 같은 (패턴, 플래그)는 한 번만 컴파일하고 프로세스 수명 동안 유지한다
+      (re 모듈 내부 캐시는 슬롯 수가 제한되어 있어 패턴이 많으면 계속 재컴파일됨)
+    - compile()은 컴파일된 객체(핸들)를 돌려주므로 모듈 상수로 보관해 재사용한다
+    - search/match/... 는 re 모듈과 같은 시그니처로 동적 패턴에도 쓸 수 있다
+    - stats()로 패턴 수와 누적 컴파일 시간을 확인할 수 있다
+    """
+
+    def __init__(self):
+        self._compiled: Dict[Tuple[str, int], Pattern] = {}
+        self._compile_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._compiled)
+
+    def compile(self, pattern, flags: int = 0) -> Pattern:
+        if isinstance(pattern, Pattern):
+            if flags:
+                raise ValueError("cannot process flags argument with a compiled pattern")
+            return pattern
+        key = (pattern, flags)
+        compiled = self._compiled.get(key)
+        if compiled is None:
+            with self._lock:
+                compiled = self._compiled.get(key)
+                if compiled is None:
+                    start = time.perf_counter()
+                    compiled = re.compile(pattern, flags)
+                    self._compile_seconds += time.perf_counter() - start
+                    self._compiled[key] = compiled
+        return compiled
+
+    def compile_many(self, patterns: Iterable[str], flags: int = 0) -> Tuple[Pattern, ...]:
+        return tuple(self.compile(p, flags) for p in patterns)
+
+    # ---------- re 호환 헬퍼 ----------
+    def search(self, pattern, string: str, flags: int = 0) -> Optional[Match]:
+        return self.compile(pattern, flags).search(string)
+
+    def match(self, pattern, string: str, flags: int = 0) -> Optional[Match]:
+        return self.compile(pattern, flags).match(string)
+
+    def fullmatch(self, pattern, string: str, flags: int = 0) -> Optional[Match]:
+        return self.compile(pattern, flags).fullmatch(string)
+
+    def finditer(self, pattern, string: str, flags: int = 0) -> Iterator[Match]:
+        return self.compile(pattern, flags).finditer(string)
+
+    def findall(self, pattern, string: str, flags: int = 0) -> List:
+        return self.compile(pattern, flags).findall(string)
+
+    def sub(self, pattern, repl, string: str, count: int = 0, flags: int = 0) -> str:
+        return self.compile(pattern, flags).sub(repl, string, count)
+
+    def split(self, pattern, string: str, maxsplit: int = 0, flags: int = 0) -> List[str]:
+        return self.compile(pattern, flags).split(string, maxsplit)
+
+    def stats(self) -> Dict[str, float]:
+        """컴파일된 패턴 수와 누적 컴파일 시간(ms)"""
+        return {
+            "patterns": len(self._compiled),
+            "compile_ms": round(self._compile_seconds * 1000, 3),
+        }
+
+
+# 프로세스 전역 저장소
+PATTERNS = PatternBank()
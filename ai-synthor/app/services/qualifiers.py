@@ -1,4 +1,5 @@
 import re
+from .patterns import PATTERNS
 
 class GlobalQualifiersExtractor:
     """성별/언어/나이 등 전역 보조 제약"""
@@ -9,7 +10,7 @@ class GlobalQualifiersExtractor:
         if "남자" in text or "male" in low:   c["gender"] = "male"
         if "영어" in text or "english" in low: c["lang"] = "en"
         if "한국어" in text or "korean" in low: c["lang"] = "ko"
-        m = re.search(r"(\d+)세 미만|under (\d+)", text)
+        m = PATTERNS.search(r"(\d+)세 미만|under (\d+)", text)
         if m:
             c["max"] = int(m.group(1) or m.group(2)) - 1  # 배타적 처리
         # 도메인 제약 조건은 email_address 타입에만 적용되므로 여기서는 제거
@@ -0,0 +1,38 @@
+import re
+from .patterns import PATTERNS
+
+# 프롬프트 한 건에서 뽑는 신호 비트
+# 각 정규식 묶음은 자기 신호 비트가 켜져 있을 때만 실행한다
+DIGIT = 1 << 0           # 숫자 (\d와 같은 범위 이상)
+AT = 1 << 1              # '@'
+HANGUL = 1 << 2          # 한글 음절 (가-힣)
+DATE_SEP = 1 << 3        # 날짜 구분자 '-', '/', '.'
+EMAIL_PROVIDER = 1 << 4  # naver, gmail 등 메일 서비스 이름 (대소문자 무시)
+
+ALL_SIGNALS = DIGIT | AT | HANGUL | DATE_SEP | EMAIL_PROVIDER
+
+_DATE_SEPARATORS = frozenset("-/.")
+_EMAIL_PROVIDER_RE = PATTERNS.compile(
+    r'naver|gmail|yahoo|hotmail|outlook|daum|nate|hanmail|icloud|protonmail', re.I
+)
+
+
+def scan_signals(text: str) -> int:
+    """텍스트를 한 번 훑어 신호 비트셋을 만든다
+
+    문자 종류는 고유 문자 집합에서 한 번에 판별하고,
+    키워드 부류는 하나로 묶은 정규식으로 한 번만 검사한다.
+    """
+    bits = 0
+    for ch in set(text):
+        if ch.isdigit():
+            bits |= DIGIT
+        elif ch == "@":
+            bits |= AT
+        elif ch in _DATE_SEPARATORS:
+            bits |= DATE_SEP
+        elif "가" <= ch <= "힣":
+            bits |= HANGUL
+    if _EMAIL_PROVIDER_RE.search(text):
+        bits |= EMAIL_PROVIDER
+    return bits
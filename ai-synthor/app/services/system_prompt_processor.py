@@ -289,14 +289,15 @@ class SystemPromptProcessor:
         return field_name.lower().replace(" ", "_").replace("-", "_")
     
     def _parse_constraints_with_existing_parsers(self, prompt: str, field_type: str) -> Dict[str, Any]:
-        """기존 constraint parser들을 사용해서 제약 조건을 파싱합니다."""
+        """기존 constraint parser들을 사용해서 제약 조건을 파싱합니다.
+
+        extractor는 요청마다 새로 만들지 않고 self.parser에 등록된 인스턴스를 재사용합니다.
+        """
         constraints = {}
         
         # nullable 퍼센트 파싱 (기존 nullables 모듈 사용)
         try:
-            from .nullables import NullablePercentExtractor
-            nullable_extractor = NullablePercentExtractor()
-            nullable_percent = nullable_extractor.extract(prompt)
+            nullable_percent = self.parser.nullables.extract(prompt)
             if nullable_percent:
                 constraints["nullable_percent"] = nullable_percent
         except:
@@ -305,8 +306,7 @@ class SystemPromptProcessor:
         # 필드 타입별로 적절한 constraint parser 사용
         if field_type == "password":
             try:
-                from .constraints.password import PasswordExtractor
-                password_extractor = PasswordExtractor()
+                password_extractor = self.parser.registry.get("password")
                 password_constraints = password_extractor.extract(prompt)
                 if password_constraints:
                     constraints.update(password_constraints)
@@ -331,8 +331,7 @@ class SystemPromptProcessor:
         
         elif field_type in ["phone", "korean_phone"]:
             try:
-                from .constraints.phone import PhoneExtractor
-                phone_extractor = PhoneExtractor()
+                phone_extractor = self.parser.registry.get("phone")
                 phone_constraints = phone_extractor.extract(prompt)
                 if phone_constraints:
                     constraints.update(phone_constraints)
@@ -367,8 +366,7 @@ class SystemPromptProcessor:
         
         elif field_type == "datetime":
             try:
-                from .constraints.datetime import DatetimeExtractor
-                datetime_extractor = DatetimeExtractor()
+                datetime_extractor = self.parser.registry.get("datetime")
                 datetime_constraints = datetime_extractor.extract(prompt)
                 if datetime_constraints:
                     constraints.update(datetime_constraints)
@@ -421,8 +419,7 @@ class SystemPromptProcessor:
         
         elif field_type == "number":
             try:
-                from .constraints.number_between import NumberBetweenExtractor
-                number_extractor = NumberBetweenExtractor()
+                number_extractor = self.parser.registry.get("number")
                 number_constraints = number_extractor.extract(prompt)
                 if number_constraints:
                     constraints.update(number_constraints)
@@ -461,8 +458,7 @@ class SystemPromptProcessor:
         
         elif field_type == "avatar":
             try:
-                from .constraints.avatar import AvatarExtractor
-                avatar_extractor = AvatarExtractor()
+                avatar_extractor = self.parser.registry.get("avatar")
                 avatar_constraints = avatar_extractor.extract(prompt)
                 if avatar_constraints:
                     constraints.update(avatar_constraints)
@@ -497,8 +493,7 @@ class SystemPromptProcessor:
         
         elif field_type == "email_address":
             try:
-                from .constraints.email import EmailExtractor
-                email_extractor = EmailExtractor()
+                email_extractor = self.parser.registry.get("email_address")
                 email_constraints = email_extractor.extract(prompt)
                 if email_constraints:
                     constraints.update(email_constraints)
@@ -521,8 +516,7 @@ class SystemPromptProcessor:
         
         elif field_type == "paragraphs":
             try:
-                from .constraints.paragraphs import ParagraphsExtractor
-                paragraphs_extractor = ParagraphsExtractor()
+                paragraphs_extractor = self.parser.registry.get("paragraphs")
                 paragraphs_constraints = paragraphs_extractor.extract(prompt)
                 if paragraphs_constraints:
                     constraints.update(paragraphs_constraints)
@@ -546,8 +540,7 @@ class SystemPromptProcessor:
         
         elif field_type in ["full_name", "korean_full_name"]:
             try:
-                from .constraints.korean_full_name import KoreanFullNameExtractor
-                name_extractor = KoreanFullNameExtractor()
+                name_extractor = self.parser.registry.get("korean_full_name")
                 name_constraints = name_extractor.extract(prompt)
                 # 명시적으로 성씨를 요청하지 않은 경우 빈 객체 유지
                 if name_constraints and "lastName" in name_constraints:
@@ -563,8 +556,7 @@ class SystemPromptProcessor:
         
         elif field_type in ["address", "korean_address"]:
             try:
-                from .constraints.default import DefaultExtractor
-                address_extractor = DefaultExtractor()
+                address_extractor = self.parser.default_extractor
                 address_constraints = address_extractor.extract(prompt)
                 if address_constraints:
                     constraints.update(address_constraints)
@@ -573,8 +565,7 @@ class SystemPromptProcessor:
         
         elif field_type in ["city", "korean_city"]:
             try:
-                from .constraints.default import DefaultExtractor
-                city_extractor = DefaultExtractor()
+                city_extractor = self.parser.default_extractor
                 city_constraints = city_extractor.extract(prompt)
                 if city_constraints:
                     constraints.update(city_constraints)
@@ -583,8 +574,7 @@ class SystemPromptProcessor:
         
         elif field_type in ["state", "korean_state"]:
             try:
-                from .constraints.state import StateExtractor
-                state_extractor = StateExtractor()
+                state_extractor = self.parser.registry.get("state")
                 state_constraints = state_extractor.extract(prompt)
                 if state_constraints:
                     constraints.update(state_constraints)
@@ -593,8 +583,7 @@ class SystemPromptProcessor:
         
         elif field_type in ["country", "korean_country"]:
             try:
-                from .constraints.country import CountryExtractor
-                country_extractor = CountryExtractor()
+                country_extractor = self.parser.registry.get("country")
                 country_constraints = country_extractor.extract(prompt)
                 if country_constraints:
                     constraints.update(country_constraints)
@@ -603,8 +592,7 @@ class SystemPromptProcessor:
         
         elif field_type in ["postal_code", "korean_postal_code"]:
             try:
-                from .constraints.default import DefaultExtractor
-                postal_extractor = DefaultExtractor()
+                postal_extractor = self.parser.default_extractor
                 postal_constraints = postal_extractor.extract(prompt)
                 if postal_constraints:
                     constraints.update(postal_constraints)
@@ -623,8 +611,7 @@ class SystemPromptProcessor:
         
         elif field_type == "time":
             try:
-                from .constraints.time import TimeExtractor
-                time_extractor = TimeExtractor()
+                time_extractor = self.parser.registry.get("time")
                 time_constraints = time_extractor.extract(prompt)
                 if time_constraints:
                     constraints.update(time_constraints)
@@ -633,9 +620,7 @@ class SystemPromptProcessor:
         
         # 전역 qualifiers 파싱 (기존 qualifiers 모듈 사용)
         try:
-            from .qualifiers import GlobalQualifiersExtractor
-            qualifiers_extractor = GlobalQualifiersExtractor()
-            global_constraints = qualifiers_extractor.extract(prompt)
+            global_constraints = self.parser.qualifiers.extract(prompt)
             if global_constraints:
                 constraints.update(global_constraints)
         except:
@@ -0,0 +1,62 @@
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from .generators.arrow import string_array, to_arrow, write_dataset
+
+_FIELDS = [
+    {"name": "name", "type": "korean_full_name", "nullablePercent": 10},
+    {"name": "age", "type": "number", "constraints": {"min": 1, "max": 99}, "nullablePercent": 20},
+    {"name": "lat", "type": "latitude"},
+]
+
+
+def test_string_array_encodes_multibyte_text():
+    values = np.array(["", "abc", "한글", "é", "😀x", "null"])
+    valid = np.array([1, 1, 1, 0, 1, 1], dtype=bool)
+    arr = string_array(values, valid)
+    assert arr.type == pa.string()
+    assert arr.to_pylist() == ["", "abc", "한글", None, "😀x", "null"]
+    assert arr.null_count == 1
+    assert string_array(np.array(["a", "bb"])).to_pylist() == ["a", "bb"]
+
+
+def test_to_arrow_keeps_dtypes_and_validity():
+    valid = np.array([True, False, True])
+    ints = to_arrow(np.array([1, 2, 3], dtype=np.int64), valid)
+    floats = to_arrow(np.array([0.5, 1.5, 2.5]))
+    bools = to_arrow(np.array([True, False, True]), valid)
+    assert ints.type == pa.int64() and ints.to_pylist() == [1, None, 3]
+    assert floats.type == pa.float64() and floats.null_count == 0
+    assert bools.to_pylist() == [True, None, True]
+
+
+@pytest.mark.parametrize("fmt", ["parquet", "arrow"])
+def test_write_dataset_round_trips(tmp_path, fmt):
+    path = tmp_path / f"out.{fmt}"
+    assert write_dataset(_FIELDS, 2_500, str(path), fmt, chunk_rows=1_000, seed=4) == 2_500
+    if fmt == "parquet":
+        meta = pq.ParquetFile(path).metadata
+        assert meta.num_row_groups == 3
+        table = pq.read_table(path)
+    else:
+        table = pa.ipc.open_file(str(path)).read_all()
+    assert table.column_names == ["name", "age", "lat"] and table.num_rows == 2_500
+    ages = [v for v in table.column("age").to_pylist() if v is not None]
+    assert 1 <= min(ages) and max(ages) <= 99
+    assert 0 < table.column("name").null_count < 2_500 and table.column("lat").null_count == 0
+
+
+def test_write_dataset_zero_rows_keeps_schema(tmp_path):
+    path = tmp_path / "empty.parquet"
+    assert write_dataset(_FIELDS, 0, str(path)) == 0
+    table = pq.read_table(path)
+    assert table.num_rows == 0 and table.column_names == ["name", "age", "lat"]
+
+
+def test_write_dataset_rejects_bad_options(tmp_path):
+    with pytest.raises(ValueError):
+        write_dataset(_FIELDS, 10, str(tmp_path / "x.csv"), "csv")
+    with pytest.raises(ValueError):
+        write_dataset(_FIELDS, 10, str(tmp_path / "x.parquet"), workers=2)
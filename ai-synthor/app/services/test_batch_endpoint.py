@@ -0,0 +1,51 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from .instances import get_parser
+
+prompts = [
+    "나이는 20 이상 60 이하, 소수점 1자리, nullable 10%",
+    "비밀번호 최소 10자, 대문자 1개, 숫자 2개 포함",
+    "이메일은 naver.com만",
+]
+
+
+@pytest.fixture(scope="module")
+def client():
+    with TestClient(app) as c:
+        yield c
+
+
+def test_batch_matches_single_requests_in_order(client):
+    response = client.post("/api/fields/ai-suggest/batch", json={"prompts": prompts})
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [r["index"] for r in results] == [0, 1, 2]
+    for prompt, item in zip(prompts, results):
+        single = client.post("/api/fields/ai-suggest", json={"prompt": prompt}).json()
+        assert item["error"] is None and item["result"] == single
+
+
+def test_batch_reports_failures_per_item(client, monkeypatch):
+    parser = get_parser()
+    original = parser.parser.parse_field_constraint
+
+    def flaky(text):
+        if "실패" in text:
+            raise RuntimeError("boom")
+        return original(text)
+
+    monkeypatch.setattr(parser.parser, "parse_field_constraint", flaky)
+    response = client.post("/api/fields/ai-suggest/batch", json={"prompts": ["실패하는 프롬프트", prompts[0]]})
+    assert response.status_code == 200
+    failed, ok = response.json()["results"]
+    assert failed == {"index": 0, "result": None, "error": "Failed to parse constraints"}
+    assert ok["error"] is None and ok["result"]["type"]
+    # 실패한 프롬프트는 캐시하지 않는다
+    assert parser.lookup("실패하는 프롬프트")[1] is False
+
+
+@pytest.mark.parametrize("body", [{"prompts": []}, {"prompts": ["x"] * 201}, {}])
+def test_batch_validates_request_size(client, body):
+    assert client.post("/api/fields/ai-suggest/batch", json=body).status_code == 422
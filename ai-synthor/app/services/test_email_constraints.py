@@ -0,0 +1,70 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from .constraints.email import EmailExtractor
+from .constraints.email_address import SUPPORTED_DOMAINS, parse_email_constraints
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+@pytest.mark.parametrize("text, expected", [
+    # 지원 도메인 직접 지정
+    ("naver.com으로요", "naver.com"),
+    ("이메일은 naver.com만", "naver.com"),
+    ("Email only gmail.com", "gmail.com"),
+    ("to gmail.com", "gmail.com"),
+    # 한글/영문 별칭 + 표현
+    ("Naver email", "naver.com"),
+    ("네이버 메일", "naver.com"),
+    ("서울대 주소", "snu.ac.kr"),
+    # 임의 도메인
+    ("sju.com 메일", "sju.com"),
+    # @도메인형
+    ("@sju.ac.kr형으로", "sju.ac.kr"),
+    ("@sju.ac.kr email", "sju.ac.kr"),
+    ("@sju.ac.kr 도메인형", "sju.ac.kr"),
+])
+def test_single_domain(text, expected):
+    assert parse_email_constraints(text) == {"domain": expected}
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("naver.com 또는 daum.net", ["naver.com", "daum.net"]),
+    ("gmail.com or naver.com only", ["gmail.com", "naver.com"]),
+    ("daum.net, naver.com, gmail.com", ["daum.net", "naver.com"]),
+    # 별칭 표현("구글 이메일")이 먼저 맞으면 단일 도메인
+    ("네이버나 구글 이메일", "gmail.com"),
+    ("네이버 또는 다음 메일", "daum.net"),
+])
+def test_multiple_domains(text, expected):
+    assert parse_email_constraints(text) == {"domain": expected}
+
+
+@pytest.mark.parametrize("text", ["@도메인형", "이메일은 아무거나", "이메일은 naver.com과 gmail.com 중 하나"])
+def test_no_domain(text):
+    assert EmailExtractor().extract(text) is None
+
+
+# 지원 도메인이 여러 개 직접 지정되면 SUPPORTED_DOMAINS 순서를 따른다 (예전에는 set 순회라 PYTHONHASHSEED에 따라 달랐다)
+_MULTI = ["gmail.com으로요 아니면 naver.com으로요", "to daum.net or to naver.com"]
+
+
+def test_several_named_domains_follow_declared_order():
+    assert [parse_email_constraints(t) for t in _MULTI] == [{"domain": "naver.com"}, {"domain": "naver.com"}]
+    assert SUPPORTED_DOMAINS.index("naver.com") < SUPPORTED_DOMAINS.index("gmail.com")
+    code = (
+        "from app.services.constraints.email_address import parse_email_constraints\n"
+        f"print([parse_email_constraints(t) for t in {_MULTI!r}])\n"
+    )
+    outputs = {
+        subprocess.run(
+            [sys.executable, "-c", code], cwd=ROOT, env=dict(os.environ, PYTHONHASHSEED=str(seed)),
+            capture_output=True, text=True, check=True,
+        ).stdout
+        for seed in (0, 4)
+    }
+    assert len(outputs) == 1
@@ -0,0 +1,62 @@
+import asyncio
+import time
+
+import pytest
+
+from .executor import ExecutorBusy, ParseExecutor
+from .parse_cache import CachedParser
+
+
+class _CountingParser:
+    def __init__(self):
+        self.calls = []
+
+    def parse_field_constraint(self, text):
+        self.calls.append(text)
+        return {"type": "number", "constraints": {"text": text}}
+
+
+@pytest.fixture(scope="module")
+def executor():
+    ex = ParseExecutor(workers=1, max_queue=2)
+    ex.warm_up()
+    yield ex
+    ex.shutdown()
+
+
+def test_cancelled_request_keeps_its_slot_until_the_job_finishes(executor):
+    async def scenario():
+        task = asyncio.ensure_future(executor.submit(time.sleep, 0.5))
+        await asyncio.sleep(0.1)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        # 워커에서는 아직 실행 중이므로 자리를 돌려주지 않고, max_queue(2)를 넘는 제출은 거절된다
+        assert executor.in_flight == 1
+        queued = asyncio.ensure_future(executor.submit(time.sleep, 0))
+        await asyncio.sleep(0)
+        with pytest.raises(ExecutorBusy):
+            await executor.submit(time.sleep, 0)
+        await queued
+        for _ in range(50):
+            if executor.in_flight == 0:
+                break
+            await asyncio.sleep(0.05)
+        assert executor.in_flight == 0
+
+    asyncio.run(scenario())
+
+
+def test_executor_uses_cached_parser_rules(executor):
+    parser = CachedParser(_CountingParser())
+    parser.remember("나이 20 이상", {"cached": True})
+
+    async def scenario():
+        # 캐시 적중은 정규화된 키로 부모에서 바로 반환된다
+        assert await executor.parse_field_constraint(parser, "  나이   20 이상 ") == {"cached": True}
+        return await executor.parse_batch(parser, ["나이 20 이상", "이메일은 naver.com만"])
+
+    results = asyncio.run(scenario())
+    assert results[0] == {"cached": True}
+    assert results[1]["type"] == "email_address"
+    assert len(parser.cache) == 2 and parser.parser.calls == []
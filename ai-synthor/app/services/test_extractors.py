@@ -0,0 +1,34 @@
+import pytest
+
+from .constraints.country import CountryExtractor
+from .constraints.state import StateExtractor
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("미국만", {"options": "United States"}),
+    ("일본만", {"options": "Japan"}),
+    ("only France", {"options": "France"}),
+    ("지역은 서울 또는 부산", {}),
+    ("nothing here", {}),
+])
+def test_country_extractor(text, expected):
+    assert CountryExtractor().extract(text) == expected
+
+
+# "…만 / only …" 후보가 국가명 하나로 정규화되지 않으면 (여러 국가, 다른 말이 붙은 경우 포함) 추측하지 않는다
+@pytest.mark.parametrize("text", ["국가 미국만", "Japan Korea amex 만", "only france", "only Narnia", "캘리포니아만"])
+def test_country_extractor_rejects_unresolved_candidates(text):
+    with pytest.raises(ValueError):
+        CountryExtractor().extract(text)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("캘리포니아만", {"options": ["California"]}),
+    ("only California", {"options": ["California"]}),
+    ("주는 뉴욕", {"options": ["New York"]}),
+    ("지역은 서울 또는 부산", {"options": ["Seoul"]}),
+    ("미국만", {}),
+    ("nothing here", {}),
+])
+def test_state_extractor(text, expected):
+    assert StateExtractor().extract(text) == expected
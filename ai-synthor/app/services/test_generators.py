@@ -0,0 +1,271 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from .generators import generate_columns
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+def _run_with_hash_seed(code: str, hash_seed: int) -> str:
+    """PYTHONHASHSEED를 고정한 새 인터프리터에서 code를 실행하고 stdout을 돌려준다"""
+    env = dict(os.environ, PYTHONHASHSEED=str(hash_seed))
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, env=env, capture_output=True, text=True, check=True,
+    )
+    return result.stdout
+
+
+def test_country_pools_do_not_depend_on_hash_seed():
+    code = (
+        "import numpy as np\n"
+        "from app.services.generators import generate_columns\n"
+        "fields = [{'name': 'c', 'type': 'country'}, {'name': 'k', 'type': 'korean_country'}]\n"
+        "cols = generate_columns(fields, 200, np.random.default_rng(42))\n"
+        "print('|'.join(cols['c']), '|'.join(cols['k']))\n"
+    )
+    assert _run_with_hash_seed(code, 1) == _run_with_hash_seed(code, 2)
+
+
+def test_generate_columns_is_reproducible_with_rng():
+    fields = [{"name": "n", "type": "number", "constraints": {"min": 1, "max": 9}}, {"name": "c", "type": "city"}]
+    a = generate_columns(fields, 100, np.random.default_rng(7))
+    b = generate_columns(fields, 100, np.random.default_rng(7))
+    assert all((a[k] == b[k]).all() for k in a)
+    assert ((a["n"] >= 1) & (a["n"] <= 9)).all()
+
+
+def _all_type_fields():
+    from .generators import GENERATORS
+    return [{"name": f"c_{t}", "type": t, "nullablePercent": 10 * (i % 3)} for i, t in enumerate(sorted(GENERATORS.types()))]
+
+
+def _materialize(chunks):
+    """(열, 마스크) chunk들을 복사해 이어 붙인다 (병렬 chunk는 공유 메모리 view라 다음 chunk 전에 복사)"""
+    columns, masks = {}, {}
+    for cols, ms in chunks:
+        for name, values in cols.items():
+            columns.setdefault(name, []).append(np.array(values, copy=True))
+        for name, mask in ms.items():
+            masks.setdefault(name, []).append(np.array(mask, copy=True))
+    return ({k: np.concatenate(v) for k, v in columns.items()}, {k: np.concatenate(v) for k, v in masks.items()})
+
+
+def test_parallel_chunks_equal_seeded_chunks():
+    from .generators.engine import iter_seeded_chunks
+    from .generators.parallel import iter_parallel_chunks
+
+    fields = _all_type_fields()
+    serial_cols, serial_masks = _materialize(iter_seeded_chunks(fields, 2345, 11, block_rows=500))
+    parallel_cols, parallel_masks = _materialize(iter_parallel_chunks(fields, 2345, 11, workers=2, block_rows=500))
+    assert serial_cols.keys() == parallel_cols.keys()
+    for name in serial_cols:
+        assert serial_cols[name].tolist() == parallel_cols[name].tolist(), name
+    assert serial_masks.keys() == parallel_masks.keys()
+    for name in serial_masks:
+        assert (serial_masks[name] == parallel_masks[name]).all(), name
+
+
+def test_parallel_parquet_equals_serial(tmp_path):
+    import pyarrow.parquet as pq
+    from .generators.arrow import write_dataset
+
+    fields = _all_type_fields()
+    write_dataset(fields, 2345, str(tmp_path / "serial.parquet"), chunk_rows=500, seed=5)
+    write_dataset(fields, 2345, str(tmp_path / "parallel.parquet"), chunk_rows=500, seed=5, workers=2)
+    assert pq.read_table(tmp_path / "serial.parquet").equals(pq.read_table(tmp_path / "parallel.parquet"))
+
+
+_SEEDED_DIGEST = (
+    "import hashlib\n"
+    "from app.services.generators import GENERATORS\n"
+    "from app.services.generators.engine import iter_seeded_chunks\n"
+    "fields = [{'name': t, 'type': t, 'nullablePercent': 20} for t in sorted(GENERATORS.types())]\n"
+    "h = hashlib.sha256()\n"
+    "for shard in range(3):\n"
+    "    for cols, masks in iter_seeded_chunks(fields, 1000, 2024, shard, 3, block_rows=100):\n"
+    "        for name in sorted(cols):\n"
+    "            h.update(name.encode() + str(cols[name].tolist()).encode() + masks[name].tobytes())\n"
+    "print(h.hexdigest())\n"
+)
+
+
+def test_seeded_generation_is_identical_across_processes():
+    assert _run_with_hash_seed(_SEEDED_DIGEST, 0) == _run_with_hash_seed(_SEEDED_DIGEST, 12345)
+
+
+def test_shards_concatenate_to_single_run():
+    from .generators.engine import iter_seeded_chunks
+
+    fields = _all_type_fields()
+    whole_cols, whole_masks = _materialize(iter_seeded_chunks(fields, 1000, 3, block_rows=128))
+    sharded = [_materialize(iter_seeded_chunks(fields, 1000, 3, shard, 4, block_rows=128)) for shard in range(4)]
+    for name, values in whole_cols.items():
+        assert values.tolist() == [v for cols, _ in sharded for v in cols[name].tolist()], name
+    for name, mask in whole_masks.items():
+        assert (mask == np.concatenate([masks[name] for _, masks in sharded])).all(), name
+
+
+def test_datetime_formats():
+    from .generators.datetime import format_days
+
+    days = np.array(["2004-04-07", "1999-12-31"], dtype="datetime64[D]")
+    assert format_days(days, "yy-mm-dd").tolist() == ["04-04-07", "99-12-31"]
+    assert format_days(days, "mm/dd/yy").tolist() == ["04/07/04", "12/31/99"]
+    assert format_days(days, "m/d/yyyy").tolist() == ["4/7/2004", "12/31/1999"]
+    for fmt in ("hh:mm", "yyy-mm-dd", "yyyy-mm-dd hh:mm:ss", "MM/DD"):
+        with pytest.raises(ValueError):
+            format_days(days, fmt)
+
+
+def test_day_tables_are_bounded_and_skipped_for_small_requests(monkeypatch):
+    from .generators import datetime as dt
+
+    cache = dt.DayTableCache(max_bytes=1 << 20)
+    monkeypatch.setattr(dt, "DAY_TABLES", cache)
+    lo, hi = dt.parse_date("2000-01-01"), dt.parse_date("2024-12-31")
+    days = np.arange(lo, lo + 3)
+    # 1행·3행 요청은 9천 일 범위의 표를 만들지 않고 직접 형식화한다
+    assert dt.render_days(days, "yyyy-mm-dd", lo, hi).tolist() == ["2000-01-01", "2000-01-02", "2000-01-03"]
+    assert len(cache) == 0
+
+    many = np.random.default_rng(0).integers(lo, hi, 20_000, endpoint=True)
+    for fmt in ("yyyy-mm-dd", "m/d/yyyy", "yyyy년 mm월 dd일", "dd.mm.yyyy", "mm/dd/yy"):
+        expected = dt.format_days(many.astype("datetime64[D]"), fmt)
+        assert (dt.render_days(many, fmt, lo, hi) == expected).all()
+        assert cache.nbytes <= cache.max_bytes
+    assert 0 < len(cache) < 5
+
+
+def test_korean_phone_prefix_respects_literal_format():
+    rng = np.random.default_rng(3)
+    fields = [
+        {"name": "default", "type": "korean_phone"},
+        {"name": "literal", "type": "korean_phone", "constraints": {"format": "010-####-####"}},
+        {"name": "explicit", "type": "phone", "constraints": {"format": "###-####-####", "prefix": ["011", "016"]}},
+    ]
+    cols = generate_columns(fields, 500, rng)
+    assert all(v.startswith("010-") and len(v) == 13 for v in cols["default"])
+    # 리터럴 010 뒤의 '#' 자리는 접두로 덮이지 않고 임의 숫자여야 한다
+    assert all(v.startswith("010-") for v in cols["literal"])
+    assert len({v[4:7] for v in cols["literal"]}) > 100
+    assert {v[:4] for v in cols["explicit"]} == {"011-", "016-"}
+
+
+def test_email_unique_holds_across_chunks():
+    from .generators.engine import iter_chunks
+
+    fields = [{"name": "e", "type": "email_address", "constraints": {"unique": True, "domain": "example.com"}}]
+    values = [v for cols in iter_chunks(fields, 30_000, 1_000, np.random.default_rng(1)) for v in cols["e"].tolist()]
+    assert len(values) == len(set(values)) == 30_000
+    assert all(v.endswith("@example.com") for v in values)
+
+
+def test_email_unique_rejects_independent_seeded_blocks():
+    from .generators.engine import iter_seeded_chunks
+
+    fields = [{"name": "e", "type": "email_address", "constraints": {"unique": True}}]
+    with pytest.raises(ValueError):
+        next(iter_seeded_chunks(fields, 2_000, 0, block_rows=1_000))
+    # 블록 하나에 들어가면 허용
+    (cols, _), = iter_seeded_chunks(fields, 1_000, 0, block_rows=1_000)
+    assert len(set(cols["e"].tolist())) == 1_000
+
+
+def test_fingerprints_ignore_padding_width():
+    from .generators.strings import FingerprintSet, fingerprints
+
+    narrow, wide = np.array(["a@x.io", "bc"], dtype="U6"), np.array(["a@x.io", "bc"], dtype="U20")
+    assert (fingerprints(narrow) == fingerprints(wide)).all()
+    seen = FingerprintSet()
+    seen.add(fingerprints(narrow))
+    assert seen.contains(fingerprints(wide)).all()
+
+
+def test_every_type_generates_requested_rows():
+    fields = _all_type_fields()
+    cols = generate_columns(fields, 50, np.random.default_rng(0))
+    assert list(cols) == [f["name"] for f in fields]
+    for name, values in cols.items():
+        assert values.shape == (50,), name
+    assert all(v.shape == (0,) for v in generate_columns(fields, 0, np.random.default_rng(0)).values())
+
+
+def test_choice_options_restrict_pool():
+    rng = np.random.default_rng(1)
+    fields = [
+        {"name": "several", "type": "city", "constraints": {"options": ["서울", "부산"]}},
+        {"name": "single", "type": "country", "constraints": {"options": "Korea"}},
+        {"name": "empty", "type": "color", "constraints": {"options": []}},
+    ]
+    cols = generate_columns(fields, 200, rng)
+    assert set(cols["several"].tolist()) == {"서울", "부산"}
+    assert set(cols["single"].tolist()) == {"Korea"}
+    # 빈 options는 기본 풀을 쓴다
+    assert len(set(cols["empty"].tolist())) > 2
+
+
+def test_number_constraints():
+    rng = np.random.default_rng(2)
+    fields = [
+        {"name": "default", "type": "number"},
+        {"name": "swapped", "type": "number", "constraints": {"min": 10, "max": 5}},
+        {"name": "decimal", "type": "number", "constraints": {"min": 0.15, "max": 0.45, "decimals": 1}},
+        {"name": "empty_grid", "type": "number", "constraints": {"min": 0.11, "max": 0.14, "decimals": 1}},
+    ]
+    cols = generate_columns(fields, 1_000, rng)
+    assert cols["default"].dtype.kind == "i" and cols["default"].min() >= 1 and cols["default"].max() <= 100
+    assert set(cols["swapped"].tolist()) == set(range(5, 11))
+    assert set(cols["decimal"].tolist()) == {0.2, 0.3, 0.4}
+    assert set(cols["empty_grid"].tolist()) == {0.1}
+
+
+def test_normalize_fields_errors():
+    from .generators.engine import normalize_fields
+
+    assert normalize_fields([{"name": "a", "type": "city", "nullablePercent": None}]) == [
+        {"name": "a", "type": "city", "constraints": {}, "nullablePercent": 0}
+    ]
+    for fields in (
+        [{"type": "city"}],
+        [{"name": "a", "type": "city"}, {"name": "a", "type": "state"}],
+        [{"name": "a", "type": "no_such_type"}],
+    ):
+        with pytest.raises(ValueError):
+            normalize_fields(fields)
+    with pytest.raises(ValueError):
+        generate_columns([{"name": "a", "type": "city"}], -1)
+
+
+def test_auto_generate_response_feeds_generate_columns():
+    from .instances import get_prompt_processor
+
+    processor = get_prompt_processor()
+    number = processor.process_system_prompt("10 이상 50 이하 소수점 2자리 number 4개")["fields"]
+    state = processor.process_system_prompt("서울만 state로 5개")["fields"]
+    assert number[0]["constraints"]["minimum"] == 10 and state[0]["constraints"] == {"value": "Seoul"}
+    cols = generate_columns(number + state, 500, np.random.default_rng(4))
+    ages = cols[number[0]["name"]]
+    assert ages.min() >= 10 and ages.max() <= 50 and (np.round(ages, 2) == ages).all()
+    assert set(cols[state[0]["name"]].tolist()) == {"Seoul"}
+
+
+def test_constraint_aliases_and_unknown_keys():
+    from .generators.engine import normalize_fields
+
+    (f,) = normalize_fields([{"name": "n", "type": "number", "constraints": {"minimum": 1, "maximum": 3, "gender": "male"}}])
+    assert f["constraints"] == {"min": 1, "max": 3, "gender": "male"}
+    (f,) = normalize_fields([{"name": "c", "type": "credit_card_type", "constraints": {"value": "Visa"}}])
+    assert f["constraints"] == {"options": "Visa"}
+    for field in (
+        {"name": "n", "type": "number", "constraints": {"minimun": 1}},
+        {"name": "n", "type": "number", "constraints": {"min": 1, "minimum": 2}},
+        {"name": "s", "type": "state", "constraints": {"max": 3}},
+        {"name": "p", "type": "password", "constraints": {"length": 8}},
+    ):
+        with pytest.raises(ValueError):
+            normalize_fields([field])
@@ -0,0 +1,35 @@
+import random
+
+from .keyword_matcher import KeywordMatcher
+
+
+def _naive(items, text):
+    """키워드마다 str.find — KeywordMatcher.find_all과 같은 (값, 첫 위치, 키워드)를 등록 순서로"""
+    found = []
+    for keyword, value in items:
+        pos = text.find(keyword) if keyword else -1
+        if pos >= 0:
+            found.append((value, pos, keyword))
+    return found
+
+
+def test_overlapping_keywords_report_first_positions_in_registration_order():
+    items = [("이메일 주소", "email_address"), ("주소", "korean_address"), ("메일", "email_address"), ("", "skip")]
+    matcher = KeywordMatcher(items)
+    assert len(matcher) == 3
+    assert matcher.find_all("주소와 이메일 주소, 메일") == [
+        ("email_address", 4, "이메일 주소"),
+        ("korean_address", 0, "주소"),
+        ("email_address", 5, "메일"),
+    ]
+    assert matcher.find_all("") == []
+
+
+def test_matches_naive_search_on_random_text():
+    rng = random.Random(0)
+    alphabet = "abc가나 "
+    items = [("".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4))), f"v{i}") for i in range(60)]
+    matcher = KeywordMatcher(items)
+    for _ in range(300):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+        assert matcher.find_all(text) == _naive(items, text)
@@ -0,0 +1,23 @@
+import pytest
+
+from app.utils.language_detect import detect_supported_language, hangul_share
+from app.utils.language_samples import EXTRA_LABELS, PROMPT_LABELS
+
+
+@pytest.mark.parametrize("text, expected", PROMPT_LABELS)
+def test_end_to_end_prompts(text, expected):
+    assert detect_supported_language(text) == expected
+
+
+def test_hangul_share_scores_mixed_input():
+    assert hangul_share("age between 20 and 30") == 0.0
+    assert hangul_share("나이는 정수만") == 1.0
+    # 필드명만 한국어인 혼합 입력은 ko, 영어 문장 속 한국어 예시 한 단어는 en
+    assert detect_supported_language("연령 greater than or equal to 21") == "ko"
+    assert detect_supported_language("Generate customer records with name, email and a nickname such as 하늘") == "en"
+
+
+def test_extra_inputs_with_fallback():
+    pytest.importorskip("langdetect")
+    for text, expected in EXTRA_LABELS:
+        assert detect_supported_language(text, fallback=True) == expected, text
@@ -0,0 +1,22 @@
+import pytest
+
+from .lexicon import Lexicon
+from .mappings import (
+    EN_TO_TYPE_FIELD, ENGLISH_PROCESSOR_FIELD, FIELD_PARSER_KOR_FIELD, KOR_TO_ENG_FIELD, KOREAN_PROCESSOR_FIELD,
+)
+
+
+def test_view_keeps_order_and_overrides():
+    base = Lexicon([("이름", "korean_full_name"), ("성", "korean_full_name"), ("나이", "number")])
+    view = base.view(["나이", "성"], {"성": "korean_last_name"})
+    assert list(view.items()) == [("나이", "number"), ("성", "korean_last_name")]
+    with pytest.raises(KeyError):
+        base.view(["없는 키워드"])
+
+
+def test_processor_lexicons_are_views_of_the_base_lexicons():
+    assert KOREAN_PROCESSOR_FIELD["성"] == "korean_last_name" and KOR_TO_ENG_FIELD["성"] == "korean_full_name"
+    assert ENGLISH_PROCESSOR_FIELD["time"] == "time" and EN_TO_TYPE_FIELD["time"] == "number"
+    assert "나이" in KOREAN_PROCESSOR_FIELD and "나이" not in FIELD_PARSER_KOR_FIELD
+    # 뷰는 원본과 같은 문자열 객체를 공유한다
+    assert next(k for k in KOREAN_PROCESSOR_FIELD if k == "이메일") is next(k for k in KOR_TO_ENG_FIELD if k == "이메일")
@@ -83,13 +83,14 @@ test_cases = [
       
 ]
 
-parser = Parser()
+if __name__ == "__main__":
+    parser = Parser()
 
-for i, text in enumerate(test_cases, 1):
-    print(f"## 입력: {text}")
-    try:
-        result = parser.parse_field_constraint(text)
-        print(f"{result}")
-    except Exception as e:
-        print(f"Error: {e}")
-    print()
\ No newline at end of file
+    for i, text in enumerate(test_cases, 1):
+        print(f"## 입력: {text}")
+        try:
+            result = parser.parse_field_constraint(text)
+            print(f"{result}")
+        except Exception as e:
+            print(f"Error: {e}")
+        print()
\ No newline at end of file
@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from .generators.nulls import fill_nulls, null_count, null_mask, null_masks
+
+
+def test_null_mask_edges():
+    rng = np.random.default_rng(0)
+    assert null_mask(100, 0, rng) is None
+    assert null_mask(0, 50, rng) is None
+    assert null_mask(10, 100, rng, "exact").all()
+    with pytest.raises(ValueError):
+        null_mask(10, 10, rng, "sometimes")
+
+
+def test_random_mode_is_close_to_percent():
+    mask = null_mask(100_000, 30, np.random.default_rng(1))
+    assert mask.dtype == bool and mask.shape == (100_000,)
+    assert abs(mask.mean() - 0.3) < 0.01
+
+
+def test_exact_mode_hits_percent_across_chunks():
+    rng = np.random.default_rng(2)
+    # 10개 중 2개 빈값
+    assert null_mask(10, 20, rng, "exact").sum() == 2
+    # 7행씩 나눠 만들어도 누적 null 수는 round(rows * p)
+    total, offset = 0, 0
+    for n in (7, 7, 7, 7, 5):
+        mask = null_mask(n, 15, rng, "exact", offset)
+        total += 0 if mask is None else int(mask.sum())
+        offset += n
+    assert total == null_count(0, 33, 15) == round(33 * 0.15)
+
+
+def test_null_masks_skip_columns_without_nulls():
+    fields = [{"name": "a", "nullablePercent": 0}, {"name": "b", "nullablePercent": 50}]
+    masks = null_masks(fields, 20, np.random.default_rng(3), "exact")
+    assert list(masks) == ["b"] and masks["b"].sum() == 10
+
+
+def test_fill_nulls():
+    values = np.array(["x", "y", "z"])
+    assert fill_nulls(values, None, "null") is values
+    assert fill_nulls(values, np.array([False, True, False]), "null").tolist() == ["x", "null", "z"]
@@ -0,0 +1,67 @@
+import pytest
+
+from .constraint_parser import Parser
+from .constraints.paragraphs import ParagraphsExtractor, mentions_paragraphs
+
+
+def _range(lo, hi):
+    return {"at least": lo, "but no more than": hi}
+
+
+@pytest.mark.parametrize("text, expected", [
+    # 정확한 개수 (역참조 패턴 포함)
+    ("3개 (exactly 3 paragraphs)", _range(3, 3)),
+    ("정확히 4 (exactly 4 paragraphs)", _range(4, 4)),
+    ("정확히 3개의 문단", _range(3, 3)),
+    ("총 5개 문단으로 작성", _range(5, 5)),
+    ("exactly two paragraphs", _range(2, 2)),
+    ("본문은 3개 문단", _range(3, 3)),
+    # 범위 (순서가 바뀌면 교환)
+    ("between two and four paragraphs", _range(2, 4)),
+    ("from three to five paragraphs", _range(3, 5)),
+    ("문단은 2에서 5", _range(2, 5)),
+    ("paragraphs between 2 and 6", _range(2, 6)),
+    ("문단 6~3", _range(3, 6)),
+    ("문단 1-3개", _range(1, 3)),
+    # 최소 / 최대
+    ("최소 2 (at least 2 paragraphs)", {"at least": 2}),
+    ("at least 2 paragraphs", {"at least": 2}),
+    ("문단 최대 4개", {"but no more than": 4}),
+    ("no more than 5 paragraphs", {"but no more than": 5}),
+    # 그룹이 하나뿐인 'N 사이'가 먼저 맞으면 범위도 최소/최대도 없다
+    ("문단 5 사이", {}),
+    ("5 사이 문단", {}),
+    # 문단 표현은 있지만 개수 표현이 없는 경우
+    ("write it in one section", {}),
+    ("두 문단", {}),
+    ("3 paragraphs", {}),
+])
+def test_paragraph_counts(text, expected):
+    assert ParagraphsExtractor().extract(text) == expected
+
+
+# 기존 표현 목록의 동작을 그대로 고정한다 (정확한 개수 패턴 '(\d+)\s*개\s*문단'이 먼저 맞고, 'at most'는 목록에 없다)
+@pytest.mark.parametrize("text, expected", [
+    ("최소 3개 문단", _range(3, 3)),
+    ("최소 2개 최대 5개 문단", _range(5, 5)),
+    ("at most 3 paragraphs", {}),
+])
+def test_paragraph_counts_legacy_precedence(text, expected):
+    assert ParagraphsExtractor().extract(text) == expected
+
+
+@pytest.mark.parametrize("text", ["age between 20 and 30", "나이 20~30세", "3 to 5", "이름은 홍길동"])
+def test_no_gate_means_no_counts(text):
+    assert ParagraphsExtractor().extract(text) == {}
+    assert not mentions_paragraphs(text)
+
+
+@pytest.mark.parametrize("text, expected_type", [
+    ("문단 2~4개", "paragraphs"),
+    ("단락 2개", "paragraphs"),
+    ("write it in one section", "paragraphs"),
+    ("나이 20~30세", "number"),
+    ("between 2023-01-05 and 2023-12-31", "datetime"),
+])
+def test_parser_paragraph_gate(text, expected_type):
+    assert Parser().parse_field_constraint(text)["type"] == expected_type
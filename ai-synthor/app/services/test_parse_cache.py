@@ -0,0 +1,96 @@
+import pytest
+
+from . import parse_cache
+from .parse_cache import CachedParser, ParseResultCache, normalize_prompt
+
+
+class _FakeParser:
+    def __init__(self):
+        self.calls = []
+
+    def parse_field_constraint(self, text):
+        self.calls.append(text)
+        if text == "boom":
+            raise RuntimeError(text)
+        return {"type": "text", "constraints": {"prompt": text}}
+
+
+def test_normalize_prompt_folds_width_and_spaces_but_not_case():
+    assert normalize_prompt("  ＡＢＣ１２３！\t\n이메일　만 ") == "ABC123! 이메일 만"
+    assert normalize_prompt("only France") != normalize_prompt("only france")
+
+
+def test_lru_evicts_least_recently_used():
+    cache = ParseResultCache(maxsize=2, ttl=None)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == (True, 1)
+    cache.put("c", 3)
+    assert cache.get("b") == (False, None)
+    assert cache.get("a") == (True, 1) and cache.get("c") == (True, 3)
+    assert cache.evictions == 1 and len(cache) == 2
+
+
+def test_ttl_expires_entries(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(parse_cache.time, "monotonic", lambda: now[0])
+    cache = ParseResultCache(maxsize=4, ttl=10)
+    cache.put("a", 1)
+    now[0] += 10
+    assert cache.get("a") == (True, 1)
+    now[0] += 0.5
+    assert cache.get("a") == (False, None)
+    assert cache.expirations == 1 and len(cache) == 0
+
+
+def test_values_are_deep_copied():
+    cache = ParseResultCache()
+    value = {"constraints": {"min": 1}}
+    cache.put("k", value)
+    value["constraints"]["min"] = 99
+    _, got = cache.get("k")
+    got["constraints"]["min"] = 42
+    assert cache.get("k") == (True, {"constraints": {"min": 1}})
+
+
+def test_stats_and_invalid_size():
+    cache = ParseResultCache(maxsize=3, ttl=None)
+    cache.put("a", 1)
+    cache.get("a")
+    cache.get("b")
+    stats = cache.stats()
+    assert (stats["size"], stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 1, 1, 0.5)
+    assert ParseResultCache().stats()["hit_rate"] == 0.0
+    with pytest.raises(ValueError):
+        ParseResultCache(maxsize=0)
+
+
+def test_cached_parser_shares_entries_between_equivalent_prompts():
+    inner = _FakeParser()
+    parser = CachedParser(inner)
+    first = parser.parse_field_constraint("이메일  만")
+    assert parser.parse_field_constraint(" 이메일\t만") == first
+    assert inner.calls == ["이메일 만"]
+    assert parser.stats()["hits"] == 1
+
+
+def test_cached_parser_batch_keeps_order_and_skips_failures():
+    inner = _FakeParser()
+    parser = CachedParser(inner)
+    parser.parse_field_constraint("a")
+    results = parser.parse_batch(["b", "boom", "a", "b "])
+    assert [r and r["constraints"]["prompt"] for r in results] == ["b", None, "a", "b"]
+    # 배치 안의 중복 미스는 각각 파싱하지만 실패는 캐시하지 않는다
+    assert inner.calls == ["a", "b", "boom", "b"]
+    assert parser.lookup("boom")[1] is False
+    with pytest.raises(RuntimeError):
+        parser.parse_field_constraint("boom")
+
+
+@pytest.mark.parametrize("text", ["  e.g. ", "e.g.", "나이는  20 이상\t60 이하", "ＡＧＥ between 20 and 30", " 이메일은 naver.com만 "])
+def test_cached_and_uncached_parser_agree(text):
+    from .constraint_parser import Parser
+
+    plain = Parser()
+    assert CachedParser(Parser()).parse_field_constraint(text) == plain.parse_field_constraint(text)
+    assert plain.parse_field_constraint(text) == plain.parse_field_constraint(normalize_prompt(text))
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from .generators.password import PasswordGenerator, password_plan, validate_passwords
+
+_GEN = PasswordGenerator()
+
+
+@pytest.mark.parametrize("constraints", [
+    {},
+    {"minimum_length": 12, "upper": 2, "numbers": 3},
+    {"minimum_length": 8, "max_length": 16, "symbols": 1, "lower": 1},
+    {"max_length": 8},
+    {"upper": 4, "lower": 4, "numbers": 4, "symbols": 4},
+])
+def test_generated_passwords_satisfy_constraints(constraints):
+    values = _GEN.generate(constraints, 2_000, np.random.default_rng(0))
+    assert values.shape == (2_000,)
+    assert validate_passwords(values, constraints).all()
+    _, min_length, max_length = password_plan(constraints)
+    lengths = np.char.str_len(values)
+    assert lengths.min() == min_length and lengths.max() == max_length
+
+
+def test_required_characters_are_shuffled():
+    # 필수 기호는 앞자리에 고정되지 않는다 (나머지 칸에는 기호가 아닌 문자도 섞인다)
+    values = _GEN.generate({"minimum_length": 10, "symbols": 1}, 2_000, np.random.default_rng(1))
+    first_symbol = [next(i for i, ch in enumerate(v) if not ch.isalnum()) for v in values.tolist()]
+    assert len(set(first_symbol)) > 5
+
+
+def test_password_plan():
+    assert password_plan({}) == ({"upper": 0, "lower": 0, "numbers": 0, "symbols": 0}, 10, 10)
+    assert password_plan({"upper": 7, "numbers": 6})[1:] == (13, 13)
+    assert password_plan({"max_length": 8})[1:] == (8, 8)
+    with pytest.raises(ValueError):
+        password_plan({"minimum_length": 12, "max_length": 8})
+    with pytest.raises(ValueError):
+        password_plan({"upper": 5, "numbers": 5, "max_length": 8})
+
+
+def test_validate_passwords_rejects_violations():
+    constraints = {"minimum_length": 6, "upper": 1, "numbers": 1}
+    values = np.array(["Abc123", "abc123", "ABCDEF", "Ab1", "Ab12한글", "Ab1!@#"])
+    assert validate_passwords(values, constraints).tolist() == [True, False, False, False, False, True]
+
+
+@pytest.mark.parametrize("constraints", [{"minimum_length": 8, "upper": 1}, {"minimum_length": 24, "upper": 20}, {"numbers": 2, "symbols": 1}])
+def test_free_positions_use_mixed_classes(constraints):
+    values = _GEN.generate(constraints, 500, np.random.default_rng(2))
+    joined = "".join(values.tolist())
+    # 요구되지 않은 클래스도 나머지 칸에 나온다
+    assert any(ch.isupper() for ch in joined) and any(ch.islower() for ch in joined) and any(ch.isdigit() for ch in joined)
+    assert not all(v.isupper() for v in values.tolist())
+    assert validate_passwords(values, constraints).all()
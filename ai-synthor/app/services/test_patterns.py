@@ -0,0 +1,47 @@
+import re
+import threading
+
+import pytest
+
+from .patterns import PATTERNS, PatternBank
+
+
+def test_compiles_each_pattern_and_flag_pair_once():
+    bank = PatternBank()
+    a = bank.compile(r"(\d+)\s*세")
+    assert bank.compile(r"(\d+)\s*세") is a
+    assert bank.compile(r"(\d+)\s*세", re.I) is not a
+    assert bank.compile(a) is a
+    with pytest.raises(ValueError):
+        bank.compile(a, re.I)
+    assert len(bank) == 2 and bank.stats()["patterns"] == 2
+
+
+def test_re_compatible_helpers():
+    bank = PatternBank()
+    text = "나이 20세 이상 60세 이하"
+    assert bank.search(r"(\d+)세", text).group(1) == "20"
+    assert bank.findall(r"(\d+)세", text) == ["20", "60"]
+    assert [m.start() for m in bank.finditer(r"\d+", text)] == [3, 10]
+    assert bank.sub(r"\d+", "N", text, count=1) == "나이 N세 이상 60세 이하"
+    assert bank.split(r"\s+", text, maxsplit=1) == ["나이", "20세 이상 60세 이하"]
+    assert bank.match(r"나이", text) and not bank.fullmatch(r"나이", text)
+    assert bank.search(r"AGE", "age", re.I)
+
+
+def test_concurrent_compiles_share_one_object():
+    bank = PatternBank()
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(bank.compile(r"x{3,}y"))) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len({id(p) for p in results}) == 1 and len(bank) == 1
+
+
+def test_extractors_populate_the_shared_bank():
+    from .constraint_parser import Parser
+
+    Parser().parse_field_constraint("나이 20세 이상")
+    assert len(PATTERNS) > 0
@@ -0,0 +1,50 @@
+import csv
+import io
+import json
+
+import numpy as np
+
+from .generators.serialize import FORMATS, csv_chunk, csv_header, ndjson_chunk, stream_dataset
+
+_TRICKY = np.array(['plain', 'say "hi"', "a,b", "line\nbreak", "back\\slash", "탭\t한글", ""])
+
+
+def test_ndjson_matches_json_dumps():
+    columns = {"s": _TRICKY, "n": np.arange(7), "f": np.linspace(0, 1, 7), "b": np.arange(7) % 2 == 0}
+    masks = {"n": np.array([0, 1, 0, 0, 0, 0, 1], dtype=bool), "s": np.array([0, 0, 1, 0, 0, 0, 0], dtype=bool)}
+    lines = ndjson_chunk(columns, masks).splitlines()
+    assert len(lines) == 7
+    for i, line in enumerate(lines):
+        row = json.loads(line)
+        assert list(row) == ["s", "n", "f", "b"]
+        assert row["s"] == (None if masks["s"][i] else _TRICKY[i])
+        assert row["n"] == (None if masks["n"][i] else i)
+        assert row["f"] == float(columns["f"][i]) and row["b"] == bool(columns["b"][i])
+
+
+def test_csv_round_trips_through_csv_reader():
+    columns = {"s": _TRICKY, "n": np.arange(7)}
+    masks = {"n": np.array([1, 0, 0, 0, 0, 0, 0], dtype=bool)}
+    text = csv_header(["s", "이름,쉼표"]) + csv_chunk(columns, masks)
+    rows = list(csv.reader(io.StringIO(text)))
+    assert rows[0] == ["s", "이름,쉼표"]
+    assert [r[0] for r in rows[1:]] == _TRICKY.tolist()
+    assert [r[1] for r in rows[1:]] == [""] + [str(i) for i in range(1, 7)]
+
+
+def test_empty_columns_serialize_to_nothing():
+    assert ndjson_chunk({}) == csv_chunk({}) == ""
+    assert set(FORMATS) == {"ndjson", "csv"}
+
+
+def test_seeded_shards_concatenate_byte_for_byte():
+    fields = [
+        {"name": "name", "type": "korean_full_name", "nullablePercent": 0},
+        {"name": "email", "type": "email_address", "nullablePercent": 10},
+        {"name": "age", "type": "number", "nullablePercent": 20},
+    ]
+    for fmt in FORMATS:
+        whole = b"".join(stream_dataset(fields, 1000, fmt, 128, seed=9))
+        shards = b"".join(b"".join(stream_dataset(fields, 1000, fmt, 128, seed=9, shard=s, shards=3)) for s in range(3))
+        assert whole == shards, fmt
+        assert whole.count(b"\n") == 1000 + (fmt == "csv")
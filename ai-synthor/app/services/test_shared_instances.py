@@ -0,0 +1,66 @@
+import asyncio
+
+from .constraints.base import ConstraintExtractor
+from .constraints.email_address import EmailAddressConstraint
+from .detectors import FieldDetector
+from .nullables import NullablePercentExtractor
+from .qualifiers import GlobalQualifiersExtractor
+from .instances import get_parser, get_prompt_processor, warm_up
+from app.api.endpoints.generation import (
+    AutoGenerateRequest, BatchPromptRequest, PromptRequest,
+    ai_suggest, ai_suggest_batch, auto_generate_fields,
+)
+
+prompts = [
+    "나이는 20 이상 60 이하, 소수점 1자리, nullable 10%",
+    "비밀번호 최소 10자, 대문자 1개, 숫자 2개 포함",
+    "이메일은 naver.com만, 전화번호는 010으로 시작, 생년월일 yyyy-mm-dd",
+    "쇼핑몰에서 사용자 등록을 위한 정보",
+    "Create a user table with name, email, password, and phone number",
+    "프로필 이미지 200x200, 주소, 도시, 국가, 우편번호, 소개글 3문단",
+]
+
+
+def _all_subclasses(cls):
+    for sub in cls.__subclasses__():
+        yield sub
+        yield from _all_subclasses(sub)
+
+
+def _count_allocations(monkeypatch):
+    """extractor 계열 클래스의 __init__ 호출 수를 센다"""
+    created = []
+    classes = {
+        ConstraintExtractor, EmailAddressConstraint, FieldDetector,
+        NullablePercentExtractor, GlobalQualifiersExtractor,
+        *_all_subclasses(ConstraintExtractor),
+    }
+    for cls in classes:
+        original = cls.__init__
+
+        def counting_init(self, *args, __original=original, **kwargs):
+            created.append(type(self).__name__)
+            __original(self, *args, **kwargs)
+
+        monkeypatch.setattr(cls, "__init__", counting_init)
+    return created
+
+
+def test_instances_are_shared():
+    warm_up()
+    assert get_parser() is get_parser()
+    assert get_prompt_processor() is get_prompt_processor()
+
+
+def test_request_path_allocates_no_extractors(monkeypatch):
+    warm_up()
+    created = _count_allocations(monkeypatch)
+
+    parser = get_parser()
+    processor = get_prompt_processor()
+    for prompt in prompts:
+        asyncio.run(ai_suggest(PromptRequest(prompt=prompt), parser=parser, executor=None))
+        asyncio.run(auto_generate_fields(AutoGenerateRequest(prompt=prompt), processor=processor, executor=None))
+    asyncio.run(ai_suggest_batch(BatchPromptRequest(prompts=prompts), parser=parser, executor=None))
+
+    assert created == []
@@ -1,16 +1,140 @@
-from langdetect import detect
+from typing import Tuple
 
-def detect_supported_language(text: str) -> str:
+try:
+    from langdetect import DetectorFactory, detect_langs
+except ImportError:  # langdetect는 fallback 전용 선택 의존성
+    detect_langs = None
+else:
+    DetectorFactory.seed = 0  # 결과가 매번 같도록 import 시 한 번만 고정
+
+# 한글 음절 하나는 라틴 문자 여러 개 분량이므로 가중치를 준다 (낱자모는 1)
+_SYLLABLE_WEIGHT = 2.0
+# 가중 한글 비중이 이 값 이상이면 'ko' ("연령 greater than or equal to 21" ≈ 0.17)
+_KO_MIN_SHARE = 0.15
+# 이 값 이상 _KO_MIN_SHARE 미만은 애매한 입력: fallback=True면 langdetect에 맡긴다
+_AMBIGUOUS_MIN_SHARE = 0.05
+# 라틴 문자만 있는 긴 문장일 때만 langdetect로 영어 여부를 재확인한다
+# (짧은 프롬프트에서는 langdetect가 오히려 자주 틀림)
+_FALLBACK_MIN_LATIN = 20
+_FALLBACK_MIN_PROB = 0.9
+
+
+def _is_jamo(code: int) -> bool:
+    return (
+        0x1100 <= code <= 0x11FF      # 자모
+        or 0x3130 <= code <= 0x318F   # 호환용 자모
+        or 0xA960 <= code <= 0xA97F   # 자모 확장-A
+        or 0xD7B0 <= code <= 0xD7FF   # 자모 확장-B
+    )
+
+
+def _is_latin(code: int) -> bool:
+    return (
+        0x41 <= code <= 0x5A or 0x61 <= code <= 0x7A
+        or (0xC0 <= code <= 0x24F and code not in (0xD7, 0xF7))  # 악센트 포함 라틴 문자
+        or 0xFF21 <= code <= 0xFF3A or 0xFF41 <= code <= 0xFF5A  # 전각 라틴
+    )
+
+
+def count_scripts(text: str) -> Tuple[int, int, int, int]:
+    """한 번의 순회로 (한글 음절, 한글 자모, 라틴, 기타 문자) 글자 수를 센다 (숫자/기호/공백 제외)"""
+    syllables = jamo = latin = other = 0
+    for ch in text:
+        code = ord(ch)
+        if code < 0x80:
+            if (0x41 <= code <= 0x5A) or (0x61 <= code <= 0x7A):
+                latin += 1
+        elif 0xAC00 <= code <= 0xD7A3:
+            syllables += 1
+        elif _is_jamo(code):
+            jamo += 1
+        elif _is_latin(code):
+            latin += 1
+        elif ch.isalpha():
+            other += 1
+    return syllables, jamo, latin, other
+
+
+def hangul_share(text: str) -> float:
+    """한글/라틴 글자 중 한글의 가중 비중 (0~1, 둘 다 없으면 0)"""
+    syllables, jamo, latin, _ = count_scripts(text)
+    hangul = syllables * _SYLLABLE_WEIGHT + jamo
+    return hangul / (hangul + latin) if hangul + latin else 0.0
+
+
+def _langdetect_best(text: str) -> Tuple[str, float]:
+    """langdetect의 최상위 (언어, 확률). 설치되어 있지 않거나 실패하면 ('', 0.0)"""
+    if detect_langs is None:
+        return "", 0.0
+    try:
+        best = detect_langs(text)[0]
+    except Exception:
+        return "", 0.0
+    return best.lang, best.prob
+
+
+def detect_supported_language(text: str, fallback: bool = False) -> str:
     """
     주어진 텍스트의 언어를 감지하고,
     'ko' 또는 'en'인 경우만 반환한다.
     그 외 언어는 'unsupported'를 반환한다.
+
+    문자 체계(한글/라틴) 비율 점수로 판단하므로 결정적이고 빠르다.
+    - 한글/라틴보다 다른 문자(한자, 가나, 키릴 등)가 많거나 글자가 없으면 'unsupported'
+    - 한글 가중 비중(hangul_share)이 _KO_MIN_SHARE 이상이면 'ko'
+      ("나이 between 20 and 30" 같은 혼합 입력 포함), 아니면 'en'
+    fallback=True이면 langdetect로 한 번 더 본다.
+    - 한글 비중이 애매한 구간이면 langdetect가 ko라고 할 때만 'ko'
+    - 라틴 문자만 있는 긴 입력은 영어가 아닌 라틴 계열 언어(프랑스어 등)를 'unsupported'로 거른다
     """
-    try:
-        lang = detect(text)
-        if lang in ["ko", "en"]:
-            return lang
-        else:
+    syllables, jamo, latin, other = count_scripts(text)
+    letters = syllables + jamo + latin
+    if other > letters or letters == 0:
+        return "unsupported"
+    share = hangul_share(text)
+    if share >= _KO_MIN_SHARE:
+        return "ko"
+    if fallback:
+        if share >= _AMBIGUOUS_MIN_SHARE:
+            return "ko" if _langdetect_best(text)[0] == "ko" else "en"
+        if not share and latin >= _FALLBACK_MIN_LATIN:
+            lang, prob = _langdetect_best(text)
+            if lang and lang != "en" and prob >= _FALLBACK_MIN_PROB:
+                return "unsupported"
+    return "en"
+
+
+if __name__ == "__main__":
+    # 정확도/지연 비교: python -m app.utils.language_detect
+    # 정답은 language_samples의 수작업 라벨 (test_nlp_end_to_end.py 프롬프트 + 그 밖의 입력)
+    import time
+    from langdetect import detect
+    from app.utils.language_samples import LABELS
+
+    def langdetect_supported(text: str) -> str:
+        try:
+            lang = detect(text)
+        except Exception:
             return "unsupported"
-    except Exception:
-        return "unsupported"
\ No newline at end of file
+        return lang if lang in ("ko", "en") else "unsupported"
+
+    texts = [t for t, _ in LABELS]
+    expected = [lang for _, lang in LABELS]
+    langdetect_supported(texts[0])  # 프로파일 로딩은 측정에서 제외
+
+    candidates = [
+        ("langdetect", langdetect_supported),
+        ("script ratio", detect_supported_language),
+        ("+ fallback", lambda t: detect_supported_language(t, fallback=True)),
+    ]
+    for name, fn in candidates:
+        rounds = 20
+        start = time.perf_counter()
+        for _ in range(rounds):
+            got = [fn(t) for t in texts]
+        elapsed = (time.perf_counter() - start) / (rounds * len(texts))
+        correct = sum(g == e for g, e in zip(got, expected))
+        print(f"{name:>12}: accuracy {correct}/{len(texts)}, {elapsed * 1e6:.1f} us/prompt")
+        for t, g, e in zip(texts, got, expected):
+            if g != e:
+                print(f"{'':>14}- {t!r}: {g} (expected {e})")
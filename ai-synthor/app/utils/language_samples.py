@@ -0,0 +1,96 @@
+# detect_supported_language 정확도 측정용 수작업 라벨 ('ko' = 한국어 처리기, 'en' = 영어 처리기 대상)
+# 혼합 입력은 필드명·한정어가 한국어로 쓰였으면 'ko'로 라벨링했다
+# PROMPT_LABELS는 test_nlp_end_to_end.test_cases와 같은 순서, EXTRA_LABELS는 그 밖의 까다로운 입력
+PROMPT_LABELS = [
+    ('나이는 20 이상 60 이하, 소수점 1자리, nullable 10%', 'ko'),
+    ('나이 120 이하', 'ko'),
+    ('age between 25 and 65', 'en'),
+    ('연령 30 이상 50 이하', 'ko'),
+    ('나이 20~30세', 'ko'),
+    ('연령 25-35세', 'ko'),
+    ('나이는 18부터 65까지', 'ko'),
+    ('나이 1세 이상 100세 이하', 'ko'),
+    ('연령대 30~50', 'ko'),
+    ('15세부터 20세까지', 'ko'),
+    ('age between 20 and 30', 'en'),
+    ('age from 18 to 65', 'en'),
+    ('age 25-35', 'en'),
+    ('age at least 21 and at most 30', 'en'),
+    ('age greater than or equal to 18 and less than or equal to 65', 'en'),
+    ('나이 between 20 and 30', 'ko'),
+    ('연령 from 18 to 65', 'ko'),
+    ('나이 21세 이상 and 30세 이하', 'ko'),
+    ('age 18세 이상 65세 이하', 'ko'),
+    ('나이 18세 이상', 'ko'),
+    ('연령 21세 이상', 'ko'),
+    ('나이는 최소 20세', 'ko'),
+    ('나이 19세 초과', 'ko'),
+    ('연령 greater than 17세', 'ko'),
+    ('age at least 18', 'en'),
+    ('age greater than or equal to 21', 'en'),
+    ('age over 18', 'en'),
+    ('minimum age is 20', 'en'),
+    ('age greater than 17', 'en'),
+    ('나이 at least 18', 'ko'),
+    ('연령 greater than or equal to 21', 'ko'),
+    ('age 20세 이상', 'ko'),
+    ('최소 age 18', 'ko'),
+    ('나이 65세 이하', 'ko'),
+    ('연령 30세 이하', 'ko'),
+    ('나이는 최대 50세', 'ko'),
+    ('나이 70세 미만', 'ko'),
+    ('연령 less than 40세', 'ko'),
+    ('age at most 65', 'en'),
+    ('age less than or equal to 30', 'en'),
+    ('maximum age is 50', 'en'),
+    ('age under 70', 'en'),
+    ('age less than 40', 'en'),
+    ('나이 at most 65', 'ko'),
+    ('연령 less than or equal to 30', 'ko'),
+    ('age 최대 50세', 'ko'),
+    ('age 40세 이하', 'ko'),
+    ('나이는 정확히 30세', 'ko'),
+    ('연령 25세로 고정', 'ko'),
+    ('나이 40세 동일', 'ko'),
+    ('나이 값은 18세', 'ko'),
+    ('age exactly 30', 'en'),
+    ('exact age is 25', 'en'),
+    ('age fixed at 40', 'en'),
+    ('age equals 18', 'en'),
+    ('나이는 exactly 30', 'ko'),
+    ('연령 fixed at 25', 'ko'),
+    ('age는 정확히 40세', 'ko'),
+    ('나이 소수점 1자리', 'ko'),
+    ('나이 소수 2자리', 'ko'),
+    ('나이는 정수만', 'ko'),
+    ('age decimals 2', 'en'),
+    ('integer age only', 'en'),
+    ('age 소수점 2자리', 'ko'),
+    ('integer 나이 only', 'ko'),
+    ('나이 빈값 10% 허용', 'ko'),
+    ('연령 결측치 5%', 'ko'),
+    ('나이는 NULL 20%', 'ko'),
+    ('age nullable 10%', 'en'),
+    ('null age 5%', 'en'),
+    ('missing age 20%', 'en'),
+    ('나이 nullable 10%', 'ko'),
+    ('age 결측치 5%', 'ko'),
+    ('연령 NULL 15%', 'ko'),
+    ('number min 3 max 3 decimals 3', 'en'),
+]
+
+EXTRA_LABELS = [
+    ("쇼핑몰에서 사용자 등록을 위한 정보", "ko"),
+    ("프로필 이미지 200x200, 주소, 도시, 국가, 우편번호, 소개글 3문단", "ko"),
+    ("이메일은 naver.com만, 전화번호는 010으로 시작, 생년월일 yyyy-mm-dd", "ko"),
+    ("ㅋㅋ 나이 20", "ko"),
+    ("Create a user table with name, email, password, and phone number", "en"),
+    ("Generate customer records with name, email and a nickname such as 하늘", "en"),
+    ("Créer une table des utilisateurs avec nom, adresse e-mail et mot de passe", "unsupported"),
+    ("ユーザーテーブルを作成してください", "unsupported"),
+    ("创建一个用户表", "unsupported"),
+    ("Создать таблицу пользователей", "unsupported"),
+    ("12345 !!!", "unsupported"),
+]
+
+LABELS = PROMPT_LABELS + EXTRA_LABELS
@@ -0,0 +1,50 @@
+# 운영용 gunicorn 설정: gunicorn -c gunicorn.conf.py app.main:app
+#
+# 파싱은 순수 파이썬 정규식 작업(CPU 바운드)이라 스레드가 아니라 프로세스 수로 확장한다.
+# 환경 변수
+#   PORT            바인드 포트 (기본 8000)
+#   WEB_CONCURRENCY 워커 수 (기본: 사용 가능한 CPU 수)
+#   LOG_LEVEL       debug / info / warning / error (기본 info)
+#   ACCESS_LOG      1이면 요청별 access 로그 출력 (기본 끔)
+#   WORKER_TIMEOUT  응답 없는 워커를 재시작하기까지의 초 (기본 60)
+import gc
+import os
+
+
+def _cpu_count() -> int:
+    # 컨테이너 CPU 제한(affinity)을 우선 반영
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+workers = int(os.getenv("WEB_CONCURRENCY", _cpu_count()))
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# 부모 프로세스에서 앱(정규식/사전 모듈)을 먼저 import한 뒤 fork → 워커들이 copy-on-write로 공유
+preload_app = True
+
+loglevel = os.getenv("LOG_LEVEL", "info")
+accesslog = "-" if os.getenv("ACCESS_LOG") == "1" else None
+errorlog = "-"
+
+timeout = int(os.getenv("WORKER_TIMEOUT", "60"))
+graceful_timeout = 30
+keepalive = 5
+
+
+def when_ready(server):
+    # 워커를 띄우기 전에 부모에서 Parser/SystemPromptProcessor를 만들어 두고,
+    # 지금까지 만든 객체를 GC 추적 대상에서 빼서 워커에서 GC가 페이지를 건드려 복사되지 않게 한다
+    from app.services.instances import warm_up
+    from app.services.patterns import PATTERNS
+
+    warm_up()
+    gc.freeze()
+    stats = PATTERNS.stats()
+    server.log.info(
+        "warm-up done: %d patterns compiled in %.1f ms, %d workers",
+        stats["patterns"], stats["compile_ms"], server.num_workers,
+    )
@@ -0,0 +1,140 @@
+"""
+간단한 부하 테스트 (표준 라이브러리만 사용)
+
+# 이미 떠 있는 서버에 부하
+python loadtest.py --url http://localhost:8000 --concurrency 16 --duration 10
+
+# 워커 수별로 gunicorn을 직접 띄워 처리량 비교 (gunicorn.conf.py 사용)
+python loadtest.py --spawn --workers 1 2 4 --concurrency 32 --duration 10
+"""
+import argparse
+import http.client
+import itertools
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from typing import Dict, List
+from urllib.parse import urlparse
+
+# 캐시 효과를 빼기 위해 프롬프트 뒤에 번호를 붙여 매번 다른 요청으로 보낸다
+PROMPTS = [
+    ("/api/fields/ai-suggest", "나이는 20 이상 60 이하, 소수점 1자리, nullable 10%"),
+    ("/api/fields/ai-suggest", "비밀번호는 최소 10자 이상이고 숫자와 특수문자가 포함되어야 해"),
+    ("/api/fields/ai-suggest", "between 2023-01-05 and 2023-12-31"),
+    ("/api/fields/ai-suggest", "이메일은 naver.com만"),
+    ("/api/fields/ai-suggest", "Password minimum 12 characters with uppercase and symbols"),
+    ("/api/fields/auto-generate", "쇼핑몰에서 사용자 등록을 위한 정보"),
+]
+
+
+def _worker(url, deadline: float, counter, latencies: List[float], errors: List[int]):
+    target = urlparse(url)
+    conn = http.client.HTTPConnection(target.hostname, target.port or 80, timeout=30)
+    headers = {"Content-Type": "application/json"}
+    while time.perf_counter() < deadline:
+        i = next(counter)
+        path, prompt = PROMPTS[i % len(PROMPTS)]
+        body = json.dumps({"prompt": f"{prompt} #{i}"})
+        start = time.perf_counter()
+        try:
+            conn.request("POST", path, body=body, headers=headers)
+            resp = conn.getresponse()
+            resp.read()
+            if resp.status != 200:
+                errors.append(resp.status)
+        except (OSError, http.client.HTTPException):
+            errors.append(0)
+            conn.close()
+            conn = http.client.HTTPConnection(target.hostname, target.port or 80, timeout=30)
+            continue
+        latencies.append(time.perf_counter() - start)
+    conn.close()
+
+
+def run_load(url: str, concurrency: int, duration: float) -> Dict[str, float]:
+    counter = itertools.count()
+    deadline = time.perf_counter() + duration
+    per_thread = [([], []) for _ in range(concurrency)]
+    threads = [
+        threading.Thread(target=_worker, args=(url, deadline, counter, lat, err))
+        for lat, err in per_thread
+    ]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    latencies = sorted(x for lat, _ in per_thread for x in lat)
+    errors = sum(len(err) for _, err in per_thread)
+    if not latencies:
+        return {"requests": 0, "errors": errors, "rps": 0.0, "p50_ms": 0.0, "p99_ms": 0.0}
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": len(latencies) / elapsed,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p99_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000,
+    }
+
+
+def _wait_ready(url: str, timeout: float = 60.0) -> None:
+    target = urlparse(url)
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            conn = http.client.HTTPConnection(target.hostname, target.port or 80, timeout=2)
+            conn.request("GET", "/healthz")
+            if conn.getresponse().status == 200:
+                return
+        except OSError:
+            pass
+        time.sleep(0.3)
+    raise RuntimeError(f"server at {url} did not become ready")
+
+
+def spawn_and_run(workers: int, port: int, concurrency: int, duration: float) -> Dict[str, float]:
+    env = dict(os.environ, PORT=str(port), WEB_CONCURRENCY=str(workers), LOG_LEVEL="warning")
+    here = os.path.dirname(os.path.abspath(__file__))
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py", "app.main:app"],
+        cwd=here, env=env,
+    )
+    url = f"http://127.0.0.1:{port}"
+    try:
+        _wait_ready(url)
+        run_load(url, concurrency, min(2.0, duration))  # 예열
+        return run_load(url, concurrency, duration)
+    finally:
+        proc.terminate()
+        proc.wait(timeout=30)
+
+
+def _print_row(label: str, r: Dict[str, float]) -> None:
+    print(f"{label:>10} | {r['rps']:9.1f} | {r['p50_ms']:8.1f} | {r['p99_ms']:8.1f} | {r['requests']:8d} | {r['errors']:6d}")
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Synthor-AI 부하 테스트")
+    ap.add_argument("--url", default="http://localhost:8000")
+    ap.add_argument("--concurrency", type=int, default=16)
+    ap.add_argument("--duration", type=float, default=10.0)
+    ap.add_argument("--spawn", action="store_true", help="워커 수별로 gunicorn을 직접 실행")
+    ap.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    ap.add_argument("--port", type=int, default=8765)
+    args = ap.parse_args()
+
+    print(f"{'workers':>10} | {'req/s':>9} | {'p50 ms':>8} | {'p99 ms':>8} | {'requests':>8} | {'errors':>6}")
+    if args.spawn:
+        for w in args.workers:
+            _print_row(str(w), spawn_and_run(w, args.port, args.concurrency, args.duration))
+    else:
+        _print_row("-", run_load(args.url, args.concurrency, args.duration))
+
+
+if __name__ == "__main__":
+    main()
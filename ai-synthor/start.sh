@@ -4,8 +4,8 @@
 # 환경 변수 설정
 export PORT=${PORT:-8000}
 
-# 애플리케이션 시작
-uvicorn app.main:app --host 0.0.0.0 --port $PORT
+# 애플리케이션 시작 (워커 수: WEB_CONCURRENCY, 로그 레벨: LOG_LEVEL)
+exec gunicorn -c gunicorn.conf.py app.main:app
 
 
 